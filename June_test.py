@@ -1,14 +1,13 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-from io import BytesIO
-import os
-import shutil
-import plotly.express as px
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+from wb_sales import commissions, loader, open_store, writer
+from wb_sales.dateindex import date_extent, picker_slice
+from wb_sales.ui import bulk_import, load_transactions
+
 # =============================================
 # CONFIGURATION & SETUP
 # =============================================
@@ -33,48 +32,26 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-file_path = r"C:\\Users\\User\\Desktop\\Accounts\\2025\\JUNE\\sales_deposit_return\\june_sales_data.xlsx"
+store = open_store()
 
 # =============================================
 # LOAD DATA
 # =============================================
-@st.cache_data(ttl=3600)
-def load_data(path):
-    required_cols = {
-        "date": pd.to_datetime("today"),
-        "Order No": "",
-        "customer_name": "",
-        "customer_type": "",
-        "sales_executive": "",
-        "sales_amount": 0.0,
-        "sales_return": 0.0,
-        "paid_amount": 0.0,
-        "customer_cashback_on_paid_amount": 0.0,
-        "executive_commission": 0.0,
-        "zonal_officer_commission": 0.0,
-        "gm_commission": 0.0,
-        "company_profit": 0.0,
-        "open_value": 0.0
-    }
+# Re-run only when the store files change (keyed on their mtime/size)
+@st.cache_data(max_entries=2)
+def load_data(signature):
     try:
-        if os.path.exists(path):
-            df = pd.read_excel(path)
-            for col, default in required_cols.items():
-                if col not in df.columns:
-                    df[col] = default
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df['month'] = df['date'].dt.month_name()
-            df['quarter'] = df['date'].dt.quarter
-            df['year'] = df['date'].dt.year
-            df['day_of_week'] = df['date'].dt.day_name()
-            return df.sort_values('date', ascending=False)
-        else:
-            return pd.DataFrame(columns=required_cols.keys())
+        df = load_transactions(store).copy()
+        df['month'] = df['date'].dt.month_name()
+        df['quarter'] = df['date'].dt.quarter
+        df['year'] = df['date'].dt.year
+        df['day_of_week'] = df['date'].dt.day_name()
+        return df
     except Exception as e:
         st.error(f"Data loading error: {str(e)}")
-        return pd.DataFrame(columns=required_cols.keys())
+        return store.read().iloc[0:0]
 
-df = load_data(file_path)
+df = load_data(loader.signature(store))
 
 # =============================================
 # NAVIGATION
@@ -93,11 +70,11 @@ def show_navigation():
     st.sidebar.markdown("---")
     st.sidebar.header("🔍 Quick Filters")
     if not df.empty:
-        date_min, date_max = df['date'].min().date(), df['date'].max().date()
+        date_min, date_max = (d.date() for d in date_extent(df))
         date_range = st.sidebar.date_input("Date Range", value=(date_min, date_max), key="nav_date_filter")
         exec_filter = st.sidebar.multiselect("Sales Executives", options=sorted(df['sales_executive'].unique()), key="nav_exec_filter")
         cust_type_filter = st.sidebar.multiselect("Customer Types", options=sorted(df['customer_type'].unique()), key="nav_cust_filter")
-        filtered_df = df[(df['date'].dt.date >= date_range[0]) & (df['date'].dt.date <= date_range[1])]
+        filtered_df = picker_slice(df, date_range)
         if exec_filter:
             filtered_df = filtered_df[filtered_df['sales_executive'].isin(exec_filter)]
         if cust_type_filter:
@@ -124,34 +101,42 @@ if current_page == "entry":
             sales_executive = st.selectbox("Sales Executive*", options=sorted(df['sales_executive'].unique()) if not df.empty else [])
             sales_amount = st.number_input("Sales Amount (BDT)*", min_value=0.0)
             paid_amount = st.number_input("Paid Amount (BDT)*", min_value=0.0)
-            cashback = st.number_input("Customer Cashback (BDT)", min_value=0.0, max_value=paid_amount, value=min(paid_amount * 0.02, paid_amount))
+            entry = pd.DataFrame([{"date": pd.to_datetime(date), "customer_type": customer_type,
+                                   "sales_executive": sales_executive, "paid_amount": paid_amount}])
+            amounts = commissions.compute(entry).iloc[0]
+            cashback = st.number_input("Customer Cashback (BDT)", min_value=0.0, max_value=paid_amount, value=min(amounts["customer_cashback_on_paid_amount"], paid_amount))
         if st.form_submit_button("💾 Save Transaction", use_container_width=True):
             if not all([date, order_no, customer_name, sales_executive, sales_amount]):
                 st.error("Please fill required fields (*)")
             else:
                 new_row = {
                     "date": date,
-                    "Order No": order_no,
+                    "order_no": order_no,
                     "customer_name": customer_name,
                     "customer_type": customer_type,
                     "sales_executive": sales_executive,
                     "sales_amount": sales_amount,
                     "paid_amount": paid_amount,
                     "customer_cashback_on_paid_amount": cashback,
-                    "executive_commission": paid_amount * 0.01,
-                    "company_profit": paid_amount * 0.05
+                    "sales_ex_commission": amounts["sales_ex_commission"],
+                    "zonal_officer_commission": amounts["zonal_officer_commission"],
+                    "gm_commission": amounts["gm_commission"],
+                    "company_profit": amounts["company_profit"]
                 }
                 try:
-                    if os.path.exists(file_path):
-                        backup_path = file_path.replace(".xlsx", f"_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-                        shutil.copy(file_path, backup_path)
-                    global df
-                    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                    df.to_excel(file_path, index=False)
+                    # Also appended to the incremental backup (python -m wb_sales backups)
+                    writer.save(store, new_row)
                     st.success("✅ Transaction saved successfully!")
                     st.balloons()
+                except TimeoutError as e:
+                    st.error("⏳ The data store is busy with another save. Please try again.")
+                    st.caption(f"🔍 {e}")
                 except PermissionError as e:
                     st.error("🚫 Permission denied! Please close the Excel file.")
                     st.caption(f"🔍 {e}")
                 except Exception as e:
                     st.error(f"❗ Error saving: {str(e)}")
+
+    st.markdown("---")
+    st.subheader("📥 Bulk Import")
+    bulk_import(store)
@@ -0,0 +1 @@
+"""Benchmarks for the dashboards: ``python -m benchmarks.run --help``."""
@@ -0,0 +1,500 @@
+"""Time every dashboard section on synthetic tables of growing size.
+
+    python -m benchmarks.run                       # 10k and 100k rows
+    python -m benchmarks.run --rows 10000 100000 1000000 10000000
+    python -m benchmarks.run --only summary --compare benchmarks/results/old.json
+
+Each case is timed best-of ``--repeat`` and the results are written as JSON to
+``benchmarks/results/`` (one file per run) so runs from different versions can
+be compared with ``--compare``. Cases that change state (adding a row to the
+totals, the cube or the store) get a fresh copy of it before every repeat, so
+every repeat and every run measures the same starting point.
+"""
+
+import argparse
+import copy
+import datetime as dt
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from wb_sales import backup, charts, commissions, cube, dedup, exports, grid, loader, open_store, schema, writer
+from wb_sales.aggregates import RunningTotals
+from wb_sales.aging import Receivables
+from wb_sales.dateindex import date_extent, date_slice
+from wb_sales.ledger import CustomerLedger
+from wb_sales.nameindex import NameIndex
+from wb_sales.sqlbackend import SqlBackend
+
+from . import synth
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+CASES = {}
+
+
+def case(name, max_rows=None, setup=None):
+    """Register a benchmark; ``max_rows`` skips it on larger tables.
+
+    ``setup(ctx)`` runs untimed before every repeat and returns entries that
+    replace those of ``ctx`` for that repeat (e.g. a copy of the state the
+    case modifies).
+    """
+    def register(fn):
+        CASES[name] = (fn, max_rows, setup)
+        return fn
+    return register
+
+
+def fresh(*keys):
+    """Setup giving the case its own deep copy of ``ctx[key]`` for each key."""
+    return lambda ctx: {key: copy.deepcopy(ctx[key]) for key in keys}
+
+
+_copies = itertools.count()
+
+
+def fresh_store(ctx):
+    """Setup giving the case a copy of the benchmark store (and its SQLite
+    mirror) as built. Parquet files are never modified in place, so they are
+    hard-linked; the journal, manifest, mirror and backup deltas are copied."""
+    root = ctx["store"].root
+    target = root.with_name(f"{root.name}_copy{next(_copies)}")
+    for path in root.rglob("*"):
+        if path.is_dir() or path.name == "store.lock":
+            continue
+        dest = target / path.relative_to(root)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            os.link(path, dest)
+        else:
+            shutil.copy2(path, dest)
+    store = open_store(target)
+    return {"store": store, "sql": SqlBackend(store)}
+
+
+# --- load ---------------------------------------------------------------
+
+@case("load.store_read")
+def _(ctx):
+    return loader.load(ctx["store"])
+
+
+@case("load.store_read_one_month")
+def _(ctx):
+    return loader.load(ctx["store"], *ctx["month"])
+
+
+@case("load.store_totals")
+def _(ctx):
+    return ctx["store"].totals()
+
+
+@case("load.append_one_row", setup=fresh_store)
+def _(ctx):
+    return ctx["store"].append(ctx["new_row"])
+
+
+@case("load.save_50_concurrent_sessions", setup=fresh_store)
+def _(ctx):
+    # One row from each of 50 sessions at once; the writer groups them
+    sessions = [threading.Thread(target=writer.save, args=(ctx["store"], ctx["new_row"])) for _ in range(50)]
+    for session in sessions:
+        session.start()
+    for session in sessions:
+        session.join()
+
+
+# --- date filtering -------------------------------------------------------
+
+@case("filter.date_mask")
+def _(ctx):
+    df, (a, b) = ctx["df"], ctx["range"]
+    return df[(df["date"] >= pd.to_datetime(a)) & (df["date"] <= pd.to_datetime(b))]
+
+
+@case("filter.date_slice")
+def _(ctx):
+    return date_slice(ctx["df"], *ctx["range"])
+
+
+@case("filter.executive_in_range")
+def _(ctx):
+    part = date_slice(ctx["df"], *ctx["range"])
+    return part[part["sales_executive"] == ctx["executive"]]
+
+
+# --- main.py summaries ------------------------------------------------------
+
+@case("summary.running_totals_build")
+def _(ctx):
+    return RunningTotals.from_frame(ctx["df"])
+
+
+@case("summary.running_totals_add", setup=fresh("totals"))
+def _(ctx):
+    return ctx["totals"].add(ctx["new_row"])
+
+
+@case("summary.executive_table")
+def _(ctx):
+    return ctx["totals"].by_executive()
+
+
+@case("summary.executive_customer_outstanding")
+def _(ctx):
+    return ctx["totals"].customers_of(ctx["executive"])
+
+
+@case("summary.kpi_row")
+def _(ctx):
+    totals = ctx["totals"]
+    return totals.grand_total(), len(totals.by_customer()), len(totals.by_executive())
+
+
+@case("summary.custom_range_customer_commission")
+def _(ctx):
+    part = date_slice(ctx["df"], *ctx["range"])
+    part = part[part["sales_executive"] == ctx["executive"]].copy()
+    part["customer_commission"] = commissions.compute(part, ["customer_commission"], unit="paisa")
+    return part.groupby("customer_name", observed=True).agg({
+        "sales_amount": "sum", "paid_amount": "sum", "sales_return": "sum", "customer_commission": "sum",
+    })
+
+
+@case("summary.commission_by_employee")
+def _(ctx):
+    part = date_slice(ctx["df"], *ctx["range"])
+    part = part[part["sales_executive"] == ctx["executive"]]
+    return part[["sales_ex_commission", "zonal_officer_commission", "gm_commission", "company_profit"]].sum()
+
+
+@case("summary.date_range_totals")
+def _(ctx):
+    return date_slice(ctx["df"], *ctx["range"])[schema.MONEY_COLUMNS].sum()
+
+
+@case("summary.chairman_report")
+def _(ctx):
+    part = date_slice(ctx["df"], *ctx["range"])
+    return part[["sales_amount", "paid_amount", "sales_return", "outstanding", "company_profit"]].sum()
+
+
+@case("summary.recompute_commissions")
+def _(ctx):
+    return commissions.recompute(ctx["df"])
+
+
+@case("summary.ledger_build")
+def _(ctx):
+    return CustomerLedger.from_frame(ctx["df"])
+
+
+@case("summary.ledger_customer_period")
+def _(ctx):
+    ledger = ctx["ledger"]
+    return ledger.period(ledger.customers[0], *ctx["range"]), ledger.statement(ledger.customers[0], *ctx["range"])
+
+
+@case("summary.ledger_all_customers_period")
+def _(ctx):
+    return ctx["ledger"].periods(*ctx["range"])
+
+
+@case("summary.aging_build")
+def _(ctx):
+    return Receivables.from_frame(ctx["df"])
+
+
+@case("summary.aging_add_one_row", setup=fresh("receivables"))
+def _(ctx):
+    return ctx["receivables"].add(ctx["new_row"])
+
+
+@case("summary.aging_report")
+def _(ctx):
+    return ctx["receivables"].by_customer(), ctx["receivables"].by_executive()
+
+
+# --- daily cube -----------------------------------------------------------------
+
+@case("cube.build")
+def _(ctx):
+    return cube.Cube.from_frame(ctx["df"])
+
+
+@case("cube.add_one_row", setup=fresh("cube"))
+def _(ctx):
+    return ctx["cube"].add(ctx["new_row"])
+
+
+@case("cube.date_range_totals")
+def _(ctx):
+    return ctx["cube"].query(None, *ctx["range"])
+
+
+@case("cube.executive_in_range_totals")
+def _(ctx):
+    return ctx["cube"].query(None, *ctx["range"], sales_executive=ctx["executive"])
+
+
+@case("cube.totals_by_executive")
+def _(ctx):
+    return ctx["cube"].query("sales_executive", *ctx["range"])
+
+
+# --- SQLite backend -----------------------------------------------------------
+
+@case("sql.executive_in_range")
+def _(ctx):
+    return ctx["sql"].transactions(*ctx["range"], executive=ctx["executive"])
+
+
+@case("sql.date_range_totals")
+def _(ctx):
+    return ctx["sql"].totals(None, *ctx["range"])
+
+
+@case("sql.totals_by_executive")
+def _(ctx):
+    return ctx["sql"].totals("sales_executive", *ctx["range"])
+
+
+def _store_with_new_row(ctx):
+    copied = fresh_store(ctx)
+    copied["store"].append(ctx["new_row"])
+    return copied
+
+
+@case("sql.sync_one_row", setup=_store_with_new_row)
+def _(ctx):
+    return ctx["sql"].sync()
+
+
+# --- june.py summaries -------------------------------------------------------
+
+@case("june.sales_trend")
+def _(ctx):
+    return ctx["june"].groupby("month_year").agg(
+        {"sales_amount": "sum", "sales_return": "sum", "net_sales": "sum"})
+
+
+@case("june.customer_type_and_zone")
+def _(ctx):
+    june = ctx["june"]
+    return (june.groupby("customer_type", observed=True)["net_sales"].sum(),
+            june.groupby("area_zone", observed=True)["net_sales"].sum().nlargest(10))
+
+
+@case("june.customer_profitability")
+def _(ctx):
+    out = ctx["june"].groupby("customer_name", observed=True).agg({"net_sales": "sum", "company_profit": "sum"})
+    out["profit_margin"] = out["company_profit"] / out["net_sales"] * 100
+    return out.nlargest(10, "company_profit"), out.nlargest(10, "profit_margin")
+
+
+@case("june.commission_breakdown")
+def _(ctx):
+    return ctx["june"].groupby("customer_type", observed=True).agg({
+        "sales_person_commission": "sum", "marketing_commission": "sum", "customer_commission": "sum"})
+
+
+@case("june.executive_performance")
+def _(ctx):
+    return ctx["june"].groupby("sales_by", observed=True).agg({
+        "net_sales": "sum", "sales_person_commission": "sum", "order_no": "nunique", "customer_name": "nunique"})
+
+
+@case("june.customer_summary")
+def _(ctx):
+    return ctx["june"].groupby(["customer_name", "phone_number", "customer_type", "area_zone"], observed=True).agg({
+        "customer_opening": "first", "net_sales": "sum", "paid_amount": "sum", "due_amount": "sum",
+        "customer_cashback_on_paid_amount": "sum", "customer_commission": "sum"})
+
+
+# --- chart data ---------------------------------------------------------------
+
+@case("chart.daily_sales_trend")
+def _(ctx):
+    return schema.to_taka(charts.daily(ctx["df"], "sales_amount"))
+
+
+@case("chart.sales_by_customer")
+def _(ctx):
+    return schema.to_taka(charts.top_n(ctx["totals"].by_customer(), "customer_name", ["sales_amount", "paid_amount"]))
+
+
+@case("chart.pies")
+def _(ctx):
+    totals = ctx["totals"]
+    return (schema.to_taka(charts.top_n(totals.by_executive(), "sales_executive", "sales_amount")),
+            schema.to_taka(charts.top_n(totals.by_customer(), "customer_name", "sales_amount")))
+
+
+# --- transaction grid ---------------------------------------------------------
+
+@case("grid.first_page_sorted")
+def _(ctx):
+    return schema.to_taka(grid.page(ctx["df"], 1, sort_by="paid_amount", ascending=False)[0])
+
+
+@case("grid.search_page")
+def _(ctx):
+    return schema.to_taka(grid.page(ctx["df"], 2, text=ctx["executive"][:4])[0])
+
+
+# --- customer search ----------------------------------------------------------
+
+@case("search.customer_index_build")
+def _(ctx):
+    return NameIndex(ctx["df"]["customer_name"].dropna().unique())
+
+
+@case("search.customer_lookup")
+def _(ctx):
+    return [ctx["customers"].search(text) for text in ("ust", "omer 0001", "Cusotmer 00042")]
+
+
+@case("search.duplicate_customers")
+def _(ctx):
+    names = ctx["df"]["customer_name"]
+    return dedup.find_duplicates(names.dropna().unique(), names.value_counts())
+
+
+# --- exports ------------------------------------------------------------------
+
+@case("export.excel_range", max_rows=100_000)
+def _(ctx):
+    return len(exports.export(date_slice(ctx["df"], *ctx["range"]), "xlsx"))
+
+
+@case("export.excel_executive", max_rows=1_000_000)
+def _(ctx):
+    df = ctx["df"]
+    return len(exports.export(df[df["sales_executive"] == ctx["executive"]], "xlsx"))
+
+
+@case("export.csv_range")
+def _(ctx):
+    return len(exports.export(date_slice(ctx["df"], *ctx["range"]), "csv"))
+
+
+@case("export.parquet_range")
+def _(ctx):
+    return len(exports.export(date_slice(ctx["df"], *ctx["range"]), "parquet"))
+
+
+# ------------------------------------------------------------------------------
+
+def build_context(rows, workdir):
+    df = synth.transactions(rows)
+    store = open_store(Path(workdir) / f"store_{rows}")
+    store.write(df)
+    loaded = loader.load(store)
+    first, last = date_extent(loaded)
+    month_start = last.replace(day=1)
+    sql = SqlBackend(store)
+    sql.sync()
+    # So saves find a current base and only append to the backup
+    backup.take_base(store)
+    return {
+        "store": store,
+        "sql": sql,
+        "cube": cube.build(store),
+        "df": loaded,
+        "june": synth.june_frame(df),
+        "totals": store.totals(),
+        "ledger": CustomerLedger.from_frame(loaded),
+        "receivables": Receivables.from_frame(loaded),
+        "customers": NameIndex(loaded["customer_name"].dropna().unique()),
+        "executive": loaded["sales_executive"].cat.categories[0],
+        # The last ~30 days, like a month-end report
+        "range": (last - pd.Timedelta(days=30), last),
+        "month": (month_start, last),
+        "new_row": {"date": last, "customer_name": "Benchmark Customer", "customer_type": "Retail Shop",
+                    "sales_executive": "Benchmark Executive", "sales_amount": 1000.0},
+    }
+
+
+def time_case(fn, ctx, repeat, setup=None):
+    best = float("inf")
+    for _ in range(repeat):
+        state = {**ctx, **setup(ctx)} if setup else ctx
+        start = time.perf_counter()
+        fn(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", help="run cases whose name starts with this prefix")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            start = time.perf_counter()
+            ctx = build_context(rows, workdir)
+            print(f"\n{rows:,} rows (setup {time.perf_counter() - start:.1f}s, "
+                  f"{ctx['df'].memory_usage(deep=True).sum() / 2**20:.1f} MiB in memory)")
+            for name, (fn, max_rows, setup) in CASES.items():
+                if args.only and not name.startswith(args.only):
+                    continue
+                if max_rows and rows > max_rows:
+                    continue
+                seconds = time_case(fn, ctx, args.repeat, setup)
+                results.append({"case": name, "rows": rows, "seconds": seconds})
+                print(f"  {name:<45} {seconds * 1000:>10.2f} ms")
+
+    report = {
+        "timestamp": dt.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "results": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{report['timestamp'].replace(':', '')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=1))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), report)
+
+
+def compare(old, new):
+    before = {(r["case"], r["rows"]): r["seconds"] for r in old["results"]}
+    print(f"\nCompared with {old.get('revision') or old['timestamp']} (ratio > 1 means slower now):")
+    for r in new["results"]:
+        key = (r["case"], r["rows"])
+        if key in before and before[key] > 0:
+            ratio = r["seconds"] / before[key]
+            flag = "  <-- slower" if ratio > 1.25 else ""
+            print(f"  {r['case']:<45} {r['rows']:>10,} {ratio:>6.2f}x{flag}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
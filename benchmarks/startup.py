@@ -0,0 +1,79 @@
+"""Cold-start profile: how long each app takes in a fresh Python process.
+
+    python -m benchmarks.startup                       # main.py, june.py, June_test.py
+    python -m benchmarks.startup main.py dashboard.overview --top 15
+
+Every target (a script path or a module name) is run once in a new
+interpreter with ``-X importtime``, the way a new Streamlit server process
+first runs it (Streamlit in bare mode, so nothing is drawn). The report gives
+the interpreter's wall time, the time spent importing, and the top-level
+packages that cost the most (each including whatever it imports first, so
+``wb_sales`` carries pandas for ``main.py``). A package that a page does not
+need on its first run should not show up here.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_TARGETS = ["main.py", "june.py", "June_test.py"]
+
+# Runs one target in the child process; scripts run as __main__ like `streamlit run`
+CHILD = """
+import importlib, runpy, sys
+target = sys.argv[1]
+if target.endswith(".py"):
+    runpy.run_path(target, run_name="__main__")
+else:
+    importlib.import_module(target)
+"""
+
+
+def parse_importtime(stderr):
+    """Cumulative import time (seconds) per top-level package, from the
+    ``-X importtime`` lines of ``stderr``."""
+    packages = Counter()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            # Only imports made by the target itself (one space of nesting)
+            packages[name.strip().split(".")[0]] += int(cumulative) / 1e6
+    return packages
+
+
+def profile(target, env=None):
+    start = time.perf_counter()
+    done = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD, target], cwd=ROOT,
+                          env=env, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if done.returncode:
+        raise SystemExit(f"{target} failed:\n{done.stderr[-2000:]}")
+    return seconds, parse_importtime(done.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS,
+                        help="script paths (relative to the repository) or module names")
+    parser.add_argument("--top", type=int, default=10, help="packages to list per target")
+    args = parser.parse_args(argv)
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+    for target in args.targets:
+        seconds, packages = profile(target, env)
+        print(f"\n{target}: {seconds * 1000:.0f} ms in a fresh process, "
+              f"{sum(packages.values()) * 1000:.0f} ms of it importing")
+        for name, cost in packages.most_common(args.top):
+            print(f"  {name:<30} {cost * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
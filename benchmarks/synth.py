@@ -0,0 +1,98 @@
+"""Synthetic transaction tables shaped like june_sales_data.xlsx.
+
+Cardinalities follow the real workbook: a handful of customer types, a few
+dozen executives, and customers that grow with the table (each customer
+trades a few dozen times a year). Amounts are drawn so that most rows are
+either a sale or a deposit, as in the June data.
+"""
+
+import numpy as np
+import pandas as pd
+
+from wb_sales import schema
+
+CUSTOMER_TYPES = ["Corporate", "Dealership", "Retail Shop", "WB Customer"]
+ZONES = ["Dhaka North", "Dhaka South", "Chattogram", "Sylhet", "Khulna", "Rajshahi",
+         "Barishal", "Rangpur", "Mymensingh", "Cumilla"]
+
+# main.py's rates, in per-mille of the paid amount
+CASHBACK, EXECUTIVE, ZONAL, GM, PROFIT = 20, 10, 3, 2, 50
+
+
+def cardinalities(rows):
+    """``(executives, customers)`` for a table of ``rows`` transactions."""
+    executives = int(min(200, max(9, rows ** 0.5 / 10)))
+    customers = int(min(50_000, max(60, rows / 40)))
+    return executives, customers
+
+
+def transactions(rows, start="2023-01-01", days=None, seed=0):
+    """A compact-schema transaction table (money in paisa) with ``rows`` rows
+    spread over ``days`` days (about 250 rows a day by default)."""
+    rng = np.random.default_rng(seed)
+    n_exec, n_cust = cardinalities(rows)
+    days = days or max(30, rows // 250)
+
+    executives = np.array([f"Executive {i:03d}" for i in range(n_exec)], dtype=object)
+    customers = np.array([f"Customer {i:05d} Enterprise" for i in range(n_cust)], dtype=object)
+    # Each customer belongs to one executive and one customer type
+    cust_exec = rng.integers(0, n_exec, n_cust)
+    cust_type = rng.choice(len(CUSTOMER_TYPES), n_cust, p=[0.05, 0.15, 0.75, 0.05])
+
+    cust = rng.zipf(1.3, rows) % n_cust  # a few customers trade much more than the rest
+    kind = rng.random(rows)  # 55% sales, 40% deposits, 5% returns
+    sale = kind < 0.55
+    deposit = (kind >= 0.55) & (kind < 0.95)
+    ret = kind >= 0.95
+
+    sales = np.where(sale, rng.lognormal(10.5, 1.0, rows), 0)
+    paid = np.where(deposit, rng.lognormal(10.8, 0.9, rows), 0)
+    returns = np.where(ret, rng.lognormal(8.5, 1.0, rows), 0)
+    to_paisa = lambda a: np.round(a * schema.PAISA_PER_TAKA).astype("int64")  # noqa: E731
+    paid_p = to_paisa(paid)
+
+    df = pd.DataFrame({
+        "date": pd.Timestamp(start) + pd.to_timedelta(np.sort(rng.integers(0, days, rows)), unit="D"),
+        "order_no": pd.array(np.where(sale, np.char.add("ORD-", np.arange(rows).astype(str)), None), dtype="string"),
+        "customer_type": pd.Categorical.from_codes(cust_type[cust], CUSTOMER_TYPES),
+        "customer_name": pd.Categorical.from_codes(cust, customers),
+        "sales_executive": pd.Categorical.from_codes(cust_exec[cust], executives),
+        "open_value": np.zeros(rows, dtype="int64"),
+        "sales_amount": to_paisa(sales),
+        "sales_return": to_paisa(returns),
+        "paid_amount": paid_p,
+        "customer_cashback_on_paid_amount": paid_p * CASHBACK // 1000,
+        "sales_ex_commission": paid_p * EXECUTIVE // 1000,
+        "zonal_officer_commission": paid_p * ZONAL // 1000,
+        "gm_commission": paid_p * GM // 1000,
+        "company_profit": paid_p * PROFIT // 1000,
+    })
+    # Opening balances on each customer's first row, as in the monthly workbook
+    first = ~df["customer_name"].duplicated()
+    df.loc[first, "open_value"] = to_paisa(rng.normal(40_000, 30_000, int(first.sum())))
+    return df
+
+
+def june_frame(df, seed=0):
+    """The same transactions in the column layout june.py expects (taka floats)."""
+    rng = np.random.default_rng(seed)
+    out = schema.to_taka(df)
+    customers = out["customer_name"].cat.categories
+    phones = pd.Series(rng.integers(1_300_000_000, 1_999_999_999, len(customers)).astype(str), index=customers)
+    zones = pd.Series(rng.choice(ZONES, len(customers)), index=customers)
+    out["sales_by"] = out["sales_executive"]
+    out["area_zone"] = pd.Categorical(out["customer_name"].map(zones).astype(str))
+    out["phone_number"] = out["customer_name"].map(phones).astype(str)
+    out["customer_opening"] = out["open_value"]
+    out["sales_person_commission"] = out["sales_ex_commission"]
+    out["marketing_commission"] = out["zonal_officer_commission"] + out["gm_commission"]
+    out["customer_commission"] = out["customer_cashback_on_paid_amount"]
+    out["total_commission"] = (
+        out["sales_person_commission"] + out["marketing_commission"] + out["customer_commission"]
+    )
+    out["net_sales"] = out["sales_amount"] - out["sales_return"]
+    out["gross_profit"] = out["sales_amount"] - out["total_commission"]
+    out["due_amount"] = out["net_sales"] - out["paid_amount"]
+    out["month_year"] = out["date"].dt.to_period("M").astype(str)
+    out["year"] = out["date"].dt.year
+    return out
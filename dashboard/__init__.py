@@ -0,0 +1,7 @@
+"""Pages of the main dashboard (``main.py``).
+
+Each module has a ``page(store, profiler)`` that ``main.py`` registers with
+``st.navigation``, so a rerun only executes the page being viewed. Within a
+page, every section with widgets is a fragment (``ui.section_fragment``):
+changing a widget reruns that section alone.
+"""
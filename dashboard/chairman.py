@@ -0,0 +1,49 @@
+"""🏢 Chairman's Report: company totals for a custom date range."""
+
+import streamlit as st
+
+from wb_sales import reports
+from wb_sales.dateindex import picker_range
+from wb_sales.schema import to_taka
+from wb_sales.ui import (
+    download_button, load_date_extent, paged_table, query_totals, query_transactions, section_fragment,
+)
+
+
+@section_fragment("Chairman report")
+def chairman_report(store, profiler):
+    st.header("🏢 Chairman's Custom Date Range Company Report")
+
+    # 1. Select custom date range
+    min_date, max_date = load_date_extent(store)
+    chairman_range = st.date_input(
+        "Select Date Range for Chairman's Report",
+        [min_date, max_date],
+        key="chairman_date"
+    )
+
+    # 2. Filter data for selected range
+    chairman_df = query_transactions(store, *picker_range(chairman_range))
+    profiler.rows(len(chairman_df))
+
+    # 3. Calculate totals
+    chairman_totals = reports.chairman_totals(query_totals(store, None, *picker_range(chairman_range)))
+
+    # 4. Show summary
+    st.subheader(
+        f"Company Totals ({chairman_range[0]} to {chairman_range[1]})"
+    )
+    for k, v in chairman_totals.items():
+        st.write(f"**{k}:** {to_taka(v):,.2f}")
+
+    # 5. Optional: Show all transactions in range
+    with st.expander("Show All Transactions in Date Range"):
+        paged_table(chairman_df, key="chairman_table")
+
+    # 6. Optional: Download button (CSV / Parquet for ranges too long for Excel)
+    download_button(chairman_df, "Download Chairman's Report",
+                    f"chairman_report_{chairman_range[0]}_{chairman_range[1]}", key="chairman_download")
+
+
+def page(store, profiler):
+    chairman_report(store, profiler)
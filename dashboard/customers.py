@@ -0,0 +1,75 @@
+"""🏢 Customers: one customer's transactions and ledger statement."""
+
+import pandas as pd
+import streamlit as st
+
+from wb_sales.dateindex import picker_range
+from wb_sales.schema import to_taka
+from wb_sales.ui import (
+    customer_picker, download_button, load_customer_index, load_date_extent, load_ledger, paged_table,
+    query_transactions, section_fragment,
+)
+
+
+@section_fragment("Customer report")
+def customer_report(store, profiler):
+    # ✅ Customer selection
+    selected_customer = customer_picker("🔍 Select Customer", load_customer_index(store), key="customer_report")
+    if selected_customer is None:
+        st.info("No customer selected.")
+        return
+
+    # ✅ Filter for selected customer
+    customer_df = query_transactions(store, customer=selected_customer)
+    profiler.rows(len(customer_df))
+
+    # ✅ Show all transactions for the customer
+    st.subheader(f"📄 All Transactions for: {selected_customer}")
+    paged_table(customer_df, key="customer_report_table")
+
+    # ✅ Show total outstanding for the customer (closing balance in the customer ledger)
+    total_outstanding = to_taka(load_ledger(store).closing(selected_customer))
+    st.success(f"Total Outstanding for {selected_customer}: {total_outstanding:,.2f} BDT")
+
+    # ✅ Download button for customer transactions
+    download_button(customer_df, "Download Customer Transactions", f"{selected_customer}_transactions",
+                    key="customer_report_download")
+
+
+@section_fragment("Customer-wise transactions")
+def customer_statement(store, profiler):
+    st.header("Customer-wise Transactions")
+    selected_customer = customer_picker("Select Customer", load_customer_index(store), key="cust")
+    if selected_customer is None:
+        st.info("No customer selected.")
+        return
+
+    # Date range for customer
+    min_date, max_date = load_date_extent(store)
+    cust_date_range = st.date_input("Select Date Range (Customer)", [min_date, max_date], key="cust_date")
+
+    # Statement with the running balance after each transaction
+    ledger = load_ledger(store)
+    cust_start, cust_end = picker_range(cust_date_range)
+    cust_filtered = ledger.statement(selected_customer, cust_start, cust_end)
+    cust_period = to_taka(pd.Series(ledger.period(selected_customer, cust_start, cust_end)))
+    profiler.rows(len(cust_filtered))
+
+    st.subheader(f"All Transactions for: {selected_customer}")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Opening Balance", f"{cust_period['opening']:,.2f} BDT")
+    col2.metric("Movement", f"{cust_period['movement']:,.2f} BDT")
+    col3.metric("Closing Balance", f"{cust_period['closing']:,.2f} BDT")
+    paged_table(cust_filtered, key="cust_table")
+    st.success(f"Total Outstanding: {cust_period['closing']:,.2f} BDT")
+
+    # Download button for customer
+    download_button(cust_filtered, "Download Customer Transactions", f"{selected_customer}_transactions",
+                    key="cust_download")
+
+
+def page(store, profiler):
+    st.title("🏢 Customers")
+    customer_report(store, profiler)
+    st.markdown("---")
+    customer_statement(store, profiler)
@@ -0,0 +1,90 @@
+"""➕ Add Transaction: the entry form and the bulk import."""
+
+import pandas as pd
+import streamlit as st
+
+from wb_sales import commissions, writer
+from wb_sales.ui import bulk_import, customer_picker, dimension_values, load_customer_index, section_fragment
+
+
+@section_fragment("Add transaction form")
+def entry_form(store, profiler):
+    st.header("➕ Add New Transaction")
+
+    # Dropdowns with search
+    customer_index = load_customer_index(store)
+    customer_types = dimension_values("customer_type", store)
+    sales_executives = dimension_values("sales_executive", store)
+
+    date = st.date_input("Date (required)")
+    order_no = st.text_input("Order No (required)", placeholder="Enter Order Number")
+    customer_name = customer_picker("Customer Name (required)", customer_index, key="entry_customer")
+    customer_type = st.selectbox("Customer Type (required)", customer_types)
+    sales_executive = st.selectbox("Sales Executive Name (required)", sales_executives)
+    sales_amount = st.number_input("Sales Amount (required)", value=0.0)
+    sales_return = st.number_input("Sales Return (required)", value=0.0)
+    paid_amount = st.number_input("Paid Amount (required)", value=0.0)
+
+    # Rates for this customer type, executive and date (commission rule table)
+    entry = pd.DataFrame([{
+        "date": pd.to_datetime(date),
+        "customer_type": customer_type,
+        "sales_executive": sales_executive,
+        "paid_amount": paid_amount,
+    }])
+    amounts = commissions.compute(entry).iloc[0]
+    pct = {col: f"{rate * 100:g}%" for col, rate in commissions.rates(entry).iloc[0].items()}
+
+    # Cashback eligibility
+    enable_cashback = st.checkbox(f"Eligible for {pct['customer_cashback_on_paid_amount']} Cashback?", value=True)
+    if enable_cashback:
+        default_cashback = amounts["customer_cashback_on_paid_amount"]
+    else:
+        default_cashback = 0.0
+
+    customer_cashback_on_paid_amount = st.number_input(
+        f"Customer Cashback on Paid Amount (default {pct['customer_cashback_on_paid_amount']} of Paid Amount, override if needed)",
+        value=default_cashback
+    )
+
+    # Auto-calculate commissions and profit
+    sales_ex_commission = amounts["sales_ex_commission"]
+    zonal_officer_commission = amounts["zonal_officer_commission"]
+    gm_commission = amounts["gm_commission"]
+    company_profit = amounts["company_profit"]
+
+    st.markdown(f"**Executive Commission ({pct['sales_ex_commission']}):** {sales_ex_commission} BDT")
+    st.markdown(f"**Zonal Officer Commission ({pct['zonal_officer_commission']}):** {zonal_officer_commission} BDT")
+    st.markdown(f"**GM Commission ({pct['gm_commission']}):** {gm_commission} BDT")
+    st.markdown(f"**Company Profit ({pct['company_profit']}):** {company_profit} BDT")
+
+    if st.button("Add Transaction"):
+        new_row = {
+            "date": pd.to_datetime(date),
+            "order_no": order_no,
+            "customer_name": customer_name,
+            "customer_type": customer_type,
+            "sales_executive": sales_executive,
+            "sales_amount": sales_amount,
+            "sales_return": sales_return,
+            "paid_amount": paid_amount,
+            "customer_cashback_on_paid_amount": customer_cashback_on_paid_amount,
+            "sales_ex_commission": sales_ex_commission,
+            "zonal_officer_commission": zonal_officer_commission,
+            "gm_commission": gm_commission,
+            "company_profit": company_profit
+        }
+        # Queued with other sessions' saves; returns once it is on disk
+        writer.save(store, new_row)
+        st.success("Transaction added and saved!")
+
+
+@section_fragment("Bulk import")
+def batch_import(store, profiler):
+    with st.expander("📥 Bulk Import (CSV / Excel)"):
+        bulk_import(store)
+
+
+def page(store, profiler):
+    entry_form(store, profiler)
+    batch_import(store, profiler)
@@ -0,0 +1,97 @@
+"""🧑‍💼 Executives: one executive's transactions and customer outstanding."""
+
+import plotly.express as px
+import streamlit as st
+
+from wb_sales import charts, reports
+from wb_sales.dateindex import picker_range
+from wb_sales.schema import to_taka
+from wb_sales.ui import (
+    dimension_values, download_button, load_balances, load_date_extent, paged_table, query_transactions,
+    section_fragment,
+)
+
+
+@section_fragment("Executive report")
+def executive_report(store, profiler):
+    # ✅ Sales Executive বেছে নিন
+    executives = dimension_values("sales_executive", store)
+    selected_exec = st.selectbox("🔍 Select Sales Executive", executives)
+
+    # ✅ নির্বাচিত Executive-এর রিপোর্ট দেখানো
+    filtered_df = query_transactions(store, executive=selected_exec)
+    profiler.rows(len(filtered_df))
+
+    st.subheader(f"📄 Detailed Transactions for: {selected_exec}")
+    paged_table(filtered_df, key="exec_report_table")
+
+    # ✅ Download বাটন (file written only when clicked)
+    download_button(filtered_df, "Download This Report", f"{selected_exec}_transactions", key="exec_report_download")
+
+
+@section_fragment("Executive-wise transactions")
+def executive_range(store, profiler):
+    st.header("Executive-wise Transactions")
+    executives = dimension_values("sales_executive", store)
+    selected_exec = st.selectbox("Select Sales Executive", executives, key="exec")
+
+    # Date range for executive
+    min_date, max_date = load_date_extent(store)
+    exec_date_range = st.date_input("Select Date Range (Executive)", [min_date, max_date], key="exec_date")
+
+    exec_filtered = query_transactions(store, *picker_range(exec_date_range), executive=selected_exec)
+    profiler.rows(len(exec_filtered))
+
+    st.subheader(f"All Transactions for: {selected_exec}")
+    paged_table(exec_filtered, key="exec_table")
+    st.success(f"Total Outstanding: {to_taka(exec_filtered['outstanding'].sum()):,.2f} BDT")
+
+    # Download button for executive
+    download_button(exec_filtered, "Download Executive Transactions", f"{selected_exec}_transactions",
+                    key="exec_download")
+
+
+@section_fragment("Executive customer outstanding")
+def customer_outstanding(store, profiler):
+    # Executive-wise, customer-wise total outstanding
+    st.header("🔎 Executive-wise Customer Outstanding")
+
+    # Select executive
+    exec_names = dimension_values("sales_executive", store)
+    selected_exec = st.selectbox("Select Sales Executive for Outstanding", exec_names, key="outstanding_exec")
+
+    # Customer-wise outstanding for the executive (from the running balances)
+    customer_outstanding = to_taka(reports.customer_outstanding(load_balances(store), selected_exec))
+    profiler.rows(len(customer_outstanding))
+
+    st.subheader(f"Customer-wise Total Outstanding for {selected_exec}")
+    st.dataframe(customer_outstanding, use_container_width=True)
+
+    # Show total outstanding amount for the executive
+    total_outstanding = customer_outstanding["outstanding"].sum()
+    st.success(f"Total Outstanding Amount for {selected_exec}: {total_outstanding:,.2f} BDT")
+
+    # Download button for outstanding table (already in taka)
+    download_button(customer_outstanding, "Download Outstanding", f"{selected_exec}_customer_outstanding",
+                    key="outstanding_download", paisa=False, sheet="Customer Outstanding")
+
+    profiler.section("Outstanding chart", rows=len(customer_outstanding))
+    # Bar chart for customer-wise outstanding (largest customers, the rest as "Other")
+    fig = px.bar(
+        charts.top_n(customer_outstanding, "customer_name", "outstanding"),
+        x="customer_name",
+        y="outstanding",
+        title=f"Customer-wise Outstanding for {selected_exec}",
+        labels={"outstanding": "Outstanding (BDT)", "customer_name": "Customer"}
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    st.plotly_chart(fig, use_container_width=True, key="outstanding_chart")
+
+
+def page(store, profiler):
+    st.title("🧑‍💼 Sales Executives")
+    executive_report(store, profiler)
+    st.markdown("---")
+    executive_range(store, profiler)
+    st.markdown("---")
+    customer_outstanding(store, profiler)
@@ -0,0 +1,151 @@
+"""📊 Overview: company KPIs, executive summary and the sales charts."""
+
+import plotly.express as px
+import streamlit as st
+
+from wb_sales import charts
+from wb_sales.schema import to_taka
+from wb_sales.ui import load_balances, load_transactions, section_fragment
+
+
+@section_fragment("Outstanding alert")
+def outstanding_alert(store, profiler):
+    balances = load_balances(store)
+    threshold = st.number_input("Outstanding Alert Threshold", value=50000.0)
+    high_outstanding = to_taka(balances.by_customer()[["customer_name", "outstanding"]])
+    alert_customers = high_outstanding[high_outstanding["outstanding"] > threshold]
+    if not alert_customers.empty:
+        st.warning("⚠️ Customers with high outstanding:")
+        st.dataframe(alert_customers, use_container_width=True)
+
+
+def page(store, profiler):
+    profiler.section("Running balances")
+    # ✅ Running per-executive / per-customer balances
+    balances = load_balances(store)
+
+    profiler.section("KPI row")
+    st.title("📊 Sales & Deposit Dashboard")
+    grand_total = to_taka(balances.grand_total())
+    total_sales = grand_total['sales_amount']
+    total_deposit = grand_total['paid_amount']
+    total_outstanding = grand_total['outstanding']
+    num_customers = len(balances.by_customer())
+    num_executives = len(balances.by_executive())
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Total Sales", f"{total_sales:,.2f} BDT")
+    col2.metric("Total Deposit", f"{total_deposit:,.2f} BDT")
+    col3.metric("Total Outstanding", f"{total_outstanding:,.2f} BDT")
+    col4.metric("Customers", num_customers)
+    col5.metric("Executives", num_executives)
+    st.markdown("---")
+
+    profiler.section("Executive summary")
+    # ✅ Sales Executive অনুযায়ী গ্রুপ করে দেখানো
+    st.subheader("Sales Executive Wise Summary")
+    grouped_exec = to_taka(balances.by_executive()[
+        ["sales_executive", "open_value", "sales_amount", "sales_return", "paid_amount"]
+    ])
+
+    # ✅ কাস্টমার আউটস্ট্যান্ডিং হিসাব করুন
+    grouped_exec["customer_outstanding"] = (
+        grouped_exec["open_value"] +
+        grouped_exec["sales_amount"] -
+        grouped_exec["sales_return"]
+    )
+
+    # ✅ শুধুমাত্র number columns format করুন
+    number_cols = ["open_value", "sales_amount", "sales_return", "paid_amount", "customer_outstanding"]
+    st.dataframe(
+        grouped_exec.style.format({col: "{:,.2f}" for col in number_cols}),
+        use_container_width=True
+    )
+
+    outstanding_alert(store, profiler)
+    st.markdown("---")
+
+    st.header("📈 Sales Trends & Performance Analytics")
+
+    df = load_transactions(store)
+    profiler.section("Sales trend chart", rows=len(df))
+    # --- Sales Trends Over Time ---
+    st.subheader("Sales Trends Over Time")
+    # Daily totals, downsampled to a bounded number of points
+    sales_trend = to_taka(charts.daily(df, 'sales_amount'))
+    fig_trend = px.line(sales_trend, x='date', y='sales_amount', title="Total Sales Amount Over Time")
+    st.plotly_chart(fig_trend, use_container_width=True)
+
+    profiler.section("Executive performance chart")
+    # --- Sales Person (Executive) Performance ---
+    st.subheader("Sales Executive Performance (Bar Chart)")
+    exec_perf = to_taka(balances.by_executive()[['sales_executive', 'sales_amount', 'paid_amount']])
+    fig_exec = px.bar(
+        charts.top_n(exec_perf, 'sales_executive', ['sales_amount', 'paid_amount']),
+        x='sales_executive',
+        y=['sales_amount', 'paid_amount'],
+        barmode='group',
+        title="Sales & Deposit by Executive",
+        labels={'value': 'Amount (BDT)', 'sales_executive': 'Executive'}
+    )
+    fig_exec.update_layout(xaxis_tickangle=-45)
+    st.plotly_chart(fig_exec, use_container_width=True)
+
+    profiler.section("Customer performance chart")
+    # --- Customer Performance ---
+    st.subheader("Customer Performance (Bar Chart)")
+    cust_perf = to_taka(balances.by_customer()[['customer_name', 'sales_amount', 'paid_amount']])
+    fig_cust = px.bar(
+        charts.top_n(cust_perf, 'customer_name', ['sales_amount', 'paid_amount']),
+        x='customer_name',
+        y=['sales_amount', 'paid_amount'],
+        barmode='group',
+        title="Sales & Deposit by Customer",
+        labels={'value': 'Amount (BDT)', 'customer_name': 'Customer'}
+    )
+    fig_cust.update_layout(xaxis_tickangle=-45)
+    st.plotly_chart(fig_cust, use_container_width=True)
+
+    profiler.section("Top 10 tables")
+    # --- Top 5 Executives and Customers ---
+    st.subheader("🏆 Top 10 Executives by Sales")
+    top_exec = exec_perf.sort_values('sales_amount', ascending=False).head(10)
+    st.dataframe(top_exec, use_container_width=True)
+
+    st.subheader("🏆 Top 10 Customers by Sales")
+    top_cust = cust_perf.sort_values('sales_amount', ascending=False).head(10)
+    st.dataframe(top_cust, use_container_width=True)
+    st.markdown("---")
+
+    profiler.section("Sales by executive pie")
+    # Pie chart for sales by executive
+    st.subheader("Sales Distribution by Executive")
+    exec_sales = to_taka(charts.top_n(balances.by_executive(), 'sales_executive', 'sales_amount'))
+    fig_pie_exec = px.pie(exec_sales, names='sales_executive', values='sales_amount', title="Sales by Executive")
+    st.plotly_chart(fig_pie_exec, use_container_width=True, key="pie_exec")
+
+    profiler.section("Sales by customer pie")
+    # Pie chart for sales by customer
+    st.subheader("Sales Distribution by Customer")
+    cust_sales = to_taka(charts.top_n(balances.by_customer(), 'customer_name', 'sales_amount'))
+    fig_pie_cust = px.pie(cust_sales, names='customer_name', values='sales_amount', title="Sales by Customer")
+    st.plotly_chart(fig_pie_cust, use_container_width=True, key="pie_cust")
+    st.markdown("---")
+
+    profiler.section("Executive sales & deposit chart")
+    st.header("📊 Sales Executive-wise Sales & Deposit (Bar Chart)")
+
+    # Group by sales executive and sum sales and deposit
+    exec_summary = to_taka(balances.by_executive()[["sales_executive", "sales_amount", "paid_amount"]])
+
+    # Create bar chart
+    fig = px.bar(
+        charts.top_n(exec_summary, "sales_executive", ["sales_amount", "paid_amount"]),
+        x="sales_executive",
+        y=["sales_amount", "paid_amount"],
+        barmode="group",
+        labels={"value": "Amount (BDT)", "sales_executive": "Sales Executive"},
+        title="Sales & Deposit by Sales Executive"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    st.plotly_chart(fig, use_container_width=True)
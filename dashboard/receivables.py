@@ -0,0 +1,31 @@
+"""⏳ Receivables Aging: unpaid sales by age, per customer and executive."""
+
+import streamlit as st
+
+from wb_sales.aging import AMOUNT_COLUMNS as AGING_COLUMNS
+from wb_sales.schema import to_taka
+from wb_sales.ui import load_date_extent, load_receivables, section_fragment
+
+
+@section_fragment("Receivables aging")
+def receivables_aging(store, profiler):
+    st.header("⏳ Receivables Aging")
+
+    # Unpaid sales by age; deposits, returns and cashback settle the oldest sales first.
+    # An earlier date is settled from the transactions up to that day only.
+    min_date, max_date = load_date_extent(store)
+    aging_date = st.date_input("Aging as of", max_date, key="aging_date")
+    receivables = load_receivables(store, aging_date)
+
+    aging_by_customer, aging_by_exec = st.tabs(["By Customer", "By Executive"])
+    with aging_by_customer:
+        aging_customers = to_taka(receivables.by_customer(aging_date), AGING_COLUMNS)
+        profiler.rows(len(aging_customers))
+        st.dataframe(aging_customers, use_container_width=True, hide_index=True)
+    with aging_by_exec:
+        st.dataframe(to_taka(receivables.by_executive(aging_date), AGING_COLUMNS),
+                     use_container_width=True, hide_index=True)
+
+
+def page(store, profiler):
+    receivables_aging(store, profiler)
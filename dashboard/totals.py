@@ -0,0 +1,134 @@
+"""📅 Commissions & Totals: date-range summaries, commission and profit."""
+
+import streamlit as st
+
+from wb_sales import commissions, reports
+from wb_sales.dateindex import picker_range
+from wb_sales.schema import to_taka
+from wb_sales.ui import (
+    dimension_values, load_date_extent, paged_table, query_totals, query_transactions, section_fragment,
+)
+
+
+@section_fragment("Custom range commission summary")
+def custom_range_summary(store, profiler):
+    # --- Custom Date Range & Executive-wise Analytics ---
+    st.header("📅 Executive-wise Sales, Deposit, Return & Customer Commission (Custom Date Range)")
+
+    # Executive selection
+    exec_names = dimension_values("sales_executive", store)
+    selected_exec = st.selectbox("Select Sales Executive", exec_names, key="custom_exec")
+
+    # Date range selection
+    min_date, max_date = load_date_extent(store)
+    date_range = st.date_input("Select Date Range", [min_date, max_date], key="custom_exec_date")
+
+    # Filter data
+    filtered = query_transactions(store, *picker_range(date_range), executive=selected_exec).copy()
+    profiler.rows(len(filtered))
+
+    # Customer commission on paid_amount, at the rule table's rates
+    filtered["customer_commission"] = commissions.compute(filtered, ["customer_commission"], unit="paisa")
+
+    # Show summary table
+    summary = filtered.groupby("customer_name", observed=True).agg({
+        "sales_amount": "sum",
+        "paid_amount": "sum",
+        "sales_return": "sum",
+        "customer_commission": "sum"
+    }).reset_index()
+    summary = to_taka(summary)
+
+    st.subheader(f"Summary for {selected_exec} ({date_range[0]} to {date_range[1]})")
+    st.dataframe(summary, use_container_width=True)
+
+    # Show totals
+    totals = summary[["sales_amount", "paid_amount", "sales_return", "customer_commission"]].sum()
+    st.success(
+        f"**Total Sales:** {totals['sales_amount']:,.2f} | "
+        f"**Total Deposit:** {totals['paid_amount']:,.2f} | "
+        f"**Total Return:** {totals['sales_return']:,.2f} | "
+        f"**Total Customer Commission:** {totals['customer_commission']:,.2f}"
+    )
+
+
+@section_fragment("Commission & profit analytics")
+def commission_analytics(store, profiler):
+    # --- Date Range & Employee Commission/Profit Analytics ---
+    st.header("💼 Commission & Profit Analytics (By Date Range & Employee)")
+
+    # 1. Select date range first
+    min_date, max_date = load_date_extent(store)
+    selected_range = st.date_input("Select Date Range", [min_date, max_date], key="commission_date")
+
+    # 2. Executives with transactions in the date range
+    commission_start, commission_end = picker_range(selected_range)
+    employee_names = list(query_totals(store, "sales_executive", commission_start, commission_end)["sales_executive"])
+
+    # 3. Select employee name (sales executive)
+    selected_employee = st.selectbox("Select Employee Name", employee_names, key="commission_employee")
+
+    # 4. Filter by employee
+    emp_filtered = query_transactions(store, commission_start, commission_end, executive=selected_employee)
+    profiler.rows(len(emp_filtered))
+
+    # 5. Show commission and profit summary
+    commission_summary = to_taka(query_totals(
+        store, None, commission_start, commission_end, executive=selected_employee
+    )[["sales_ex_commission", "zonal_officer_commission", "gm_commission", "company_profit"]]).rename({
+        "sales_ex_commission": "Executive Commission",
+        "zonal_officer_commission": "Zonal Officer Commission",
+        "gm_commission": "GM Commission",
+        "company_profit": "Company Profit"
+    })
+
+    st.subheader(f"Commission & Profit for {selected_employee} ({selected_range[0]} to {selected_range[1]})")
+    st.write(commission_summary)
+
+    # Optional: Show detailed transactions
+    with st.expander("Show Detailed Transactions"):
+        paged_table(emp_filtered, key="commission_table")
+
+
+@section_fragment("Date range totals")
+def date_range_totals(store, profiler):
+    # --- Date Range Wise Totals (All Employees or Selected Employee) ---
+    st.header("📅 Date Range Wise Totals (Sales, Deposit, Return, etc.)")
+
+    # 1. Select date range
+    min_date, max_date = load_date_extent(store)
+    date_range = st.date_input("Select Date Range for Totals", [min_date, max_date], key="date_range_totals")
+
+    # 2. Optional: Select employee (or show all)
+    employee_options = ["All"] + dimension_values("sales_executive", store)
+    selected_emp = st.selectbox("Select Employee (optional)", employee_options, key="totals_employee")
+
+    # 3. Filter by date range (and employee if selected)
+    totals_exec = None if selected_emp == "All" else selected_emp
+    filtered = query_transactions(store, *picker_range(date_range), executive=totals_exec)
+    profiler.rows(len(filtered))
+
+    # 4. Calculate totals
+    totals = reports.labelled_totals(
+        query_totals(store, None, *picker_range(date_range), executive=totals_exec), reports.RANGE_TOTALS
+    )
+
+    # 5. Show totals
+    st.subheader(
+        f"Totals from {date_range[0]} to {date_range[1]}"
+        + (f" for {selected_emp}" if selected_emp != "All" else " (All Employees)")
+    )
+    for k, v in totals.items():
+        st.write(f"**{k}:** {to_taka(v):,.2f}")
+
+    # Optional: Show filtered transactions
+    with st.expander("Show Transactions in Date Range"):
+        paged_table(filtered, key="range_totals_table")
+
+
+def page(store, profiler):
+    custom_range_summary(store, profiler)
+    st.markdown("---")
+    commission_analytics(store, profiler)
+    st.markdown("---")
+    date_range_totals(store, profiler)
@@ -0,0 +1,17 @@
+"""📋 All Transactions: the whole table, searchable and paged."""
+
+import streamlit as st
+
+from wb_sales.ui import load_transactions, paged_table, section_fragment
+
+
+@section_fragment("All transactions table")
+def all_transactions(store, profiler):
+    df = load_transactions(store)
+    profiler.rows(len(df))
+    st.header("📋 All Transactions")
+    paged_table(df, key="all_transactions")
+
+
+def page(store, profiler):
+    all_transactions(store, profiler)
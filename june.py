@@ -1,9 +1,11 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
 from datetime import datetime
-import io
+
+from wb_sales.cube import Cube
+from wb_sales.nameindex import NameIndex
+from wb_sales.schema import categorize
+from wb_sales.ui import download_button, paged_table
 
 # Page configuration
 st.set_page_config(
@@ -20,6 +22,10 @@ def load_data(file_path):
     
     # Data preprocessing
     df['date'] = pd.to_datetime(df['date'])
+    # Repeated names as categoricals: smaller frame, faster groupby
+    for col in ['customer_name', 'customer_type', 'area_zone', 'sales_by']:
+        if col in df.columns:
+            df[col] = categorize(df[col])
     df['net_sales'] = df['sales_amount'] - df['sales_return']
     df['gross_profit'] = df['sales_amount'] - df['total_commission']
     df['due_amount'] = df['net_sales'] - df['paid_amount']
@@ -30,6 +36,21 @@ def load_data(file_path):
     
     return df
 
+# Daily cube of the upload: the KPI cards and commission breakdown roll up
+# its cells instead of summing every filtered row
+CUBE_DIMENSIONS = ['sales_by', 'customer_name', 'customer_type', 'area_zone']
+CUBE_MEASURES = ['sales_amount', 'net_sales', 'company_profit',
+                 'sales_person_commission', 'marketing_commission', 'customer_commission']
+
+@st.cache_resource(max_entries=2)
+def load_cube(file_path):
+    return Cube.from_frame(load_data(file_path), dimensions=CUBE_DIMENSIONS, measures=CUBE_MEASURES)
+
+# Customer name / phone search index (rebuilt when the filtered customers change)
+@st.cache_resource(max_entries=4)
+def customer_index(customer_summary):
+    return NameIndex.from_frame(customer_summary, phone="phone_number")
+
 # Main app function
 def main():
     # Sidebar - Filters
@@ -38,7 +59,11 @@ def main():
     # Load data
     uploaded_file = st.sidebar.file_uploader("Upload your sales data (Excel or CSV)", type=['xlsx', 'csv'])
     if uploaded_file is not None:
+        # Only needed once there is data to chart; keeps the first page load fast
+        import plotly.express as px
+
         df = load_data(uploaded_file)
+        cube = load_cube(uploaded_file)
         
         # Date range filter
         min_date = df['date'].min()
@@ -51,6 +76,7 @@ def main():
         )
         
         # Convert to datetime
+        start_date = end_date = None
         if len(date_range) == 2:
             start_date, end_date = pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1])
             df = df[(df['date'] >= start_date) & (df['date'] <= end_date)]
@@ -80,6 +106,8 @@ def main():
             (df['area_zone'].isin(area_zones)) &
             (df['sales_by'].isin(sales_executives))
         ]
+        cube_filters = dict(customer_type=customer_types, area_zone=area_zones, sales_by=sales_executives)
+        kpis = cube.query(None, start_date, end_date, **cube_filters)
         
         # Main dashboard
         st.title("📊 Sales Performance & Profitability Dashboard")
@@ -89,13 +117,13 @@ def main():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Sales", f"${df['sales_amount'].sum():,.2f}")
+            st.metric("Total Sales", f"${kpis['sales_amount']:,.2f}")
         with col2:
-            st.metric("Net Sales", f"${df['net_sales'].sum():,.2f}")
+            st.metric("Net Sales", f"${kpis['net_sales']:,.2f}")
         with col3:
-            st.metric("Total Profit", f"${df['company_profit'].sum():,.2f}")
+            st.metric("Total Profit", f"${kpis['company_profit']:,.2f}")
         with col4:
-            st.metric("Avg. Profit Margin", f"{df['company_profit'].sum() / df['net_sales'].sum() * 100:.2f}%")
+            st.metric("Avg. Profit Margin", f"{kpis['company_profit'] / kpis['net_sales'] * 100:.2f}%")
         
         # Tabs for different sections
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -129,7 +157,7 @@ def main():
             col1, col2 = st.columns(2)
             with col1:
                 st.subheader("Sales by Customer Type")
-                cust_type_sales = df.groupby('customer_type')['net_sales'].sum().reset_index()
+                cust_type_sales = df.groupby('customer_type', observed=True)['net_sales'].sum().reset_index()
                 fig = px.pie(
                     cust_type_sales,
                     names='customer_type',
@@ -140,7 +168,7 @@ def main():
             
             with col2:
                 st.subheader("Sales by Area Zone")
-                zone_sales = df.groupby('area_zone')['net_sales'].sum().nlargest(10).reset_index()
+                zone_sales = df.groupby('area_zone', observed=True)['net_sales'].sum().nlargest(10).reset_index()
                 fig = px.bar(
                     zone_sales,
                     x='net_sales',
@@ -156,7 +184,7 @@ def main():
             
             # High-profit vs low-profit customers
             st.subheader("Customer Profitability Analysis")
-            customer_profit = df.groupby('customer_name').agg({
+            customer_profit = df.groupby('customer_name', observed=True).agg({
                 'net_sales': 'sum',
                 'company_profit': 'sum'
             }).reset_index()
@@ -175,11 +203,9 @@ def main():
             
             # Commission analysis
             st.subheader("Commission Breakdown")
-            commission_data = df.groupby('customer_type').agg({
-                'sales_person_commission': 'sum',
-                'marketing_commission': 'sum',
-                'customer_commission': 'sum'
-            }).reset_index()
+            commission_data = cube.query('customer_type', start_date, end_date, **cube_filters)[[
+                'customer_type', 'sales_person_commission', 'marketing_commission', 'customer_commission'
+            ]]
             
             fig = px.bar(
                 commission_data,
@@ -194,7 +220,7 @@ def main():
             # Executive Performance
             st.subheader("Sales Executive Performance")
             
-            exec_performance = df.groupby('sales_by').agg({
+            exec_performance = df.groupby('sales_by', observed=True).agg({
                 'net_sales': 'sum',
                 'sales_person_commission': 'sum',
                 'order_no': 'nunique',
@@ -237,7 +263,7 @@ def main():
             # Customer Insights
             st.subheader("Customer Summary")
             
-            customer_summary = df.groupby(['customer_name', 'phone_number', 'customer_type', 'area_zone']).agg({
+            customer_summary = df.groupby(['customer_name', 'phone_number', 'customer_type', 'area_zone'], observed=True).agg({
                 'customer_opening': 'first',
                 'net_sales': 'sum',
                 'paid_amount': 'sum',
@@ -249,10 +275,11 @@ def main():
             # Search functionality
             search_term = st.text_input("Search by Customer Name or Phone Number")
             if search_term:
-                customer_summary = customer_summary[
-                    (customer_summary['customer_name'].str.contains(search_term, case=False)) |
-                    (customer_summary['phone_number'].astype(str).str.contains(search_term))
-                ]
+                # Best matches first; near misses (typos) after the exact ones
+                matches = customer_index(customer_summary).search(search_term)
+                rank = pd.Series(range(len(matches)), index=matches, dtype="int64")
+                order = customer_summary['customer_name'].astype('string').map(rank)
+                customer_summary = customer_summary.loc[order.dropna().sort_values(kind='stable').index]
             
             st.dataframe(customer_summary)
             
@@ -266,24 +293,11 @@ def main():
             # Raw Data with download option
             st.subheader("Filtered Data")
             st.write(f"Showing {len(df)} records")
-            st.dataframe(df)
+            paged_table(df, key="raw_data", paisa=False)
             
-            # Download button
-            def to_excel(df):
-                output = io.BytesIO()
-                writer = pd.ExcelWriter(output, engine='xlsxwriter')
-                df.to_excel(writer, index=False, sheet_name='SalesData')
-                writer.close()
-                processed_data = output.getvalue()
-                return processed_data
-            
-            excel_data = to_excel(df)
-            st.download_button(
-                label="📥 Download Filtered Data as Excel",
-                data=excel_data,
-                file_name="filtered_sales_data.xlsx",
-                mime="application/vnd.ms-excel"
-            )
+            # Download button (the file is only written when clicked)
+            download_button(df, "📥 Download Filtered Data", "filtered_sales_data",
+                            key="june_download", paisa=False, sheet="SalesData")
     
     else:
         st.info("Please upload a data file to begin analysis")
@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Keep wb_sales.config away from the real data folder, rules and merges
+_scratch = tempfile.mkdtemp(prefix="wb_sales_tests_")
+os.environ["WB_SALES_DATA"] = os.path.join(_scratch, "data")
+os.environ["WB_SALES_PROFILE_LOG"] = os.path.join(_scratch, "profile.jsonl")
+os.environ.pop("WB_SALES_RULES", None)
+os.environ.pop("WB_SALES_MERGES", None)
+os.environ.pop("WB_SALES_BACKUPS", None)
+
+from wb_sales import TransactionStore  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TransactionStore(tmp_path / "store")
+
+
+@pytest.fixture(scope="session")
+def transactions():
+    """A synthetic table in the compact schema (money in paisa), date-sorted."""
+    from benchmarks import synth
+
+    return synth.transactions(3000, days=120)
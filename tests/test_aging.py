@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from wb_sales import aging, schema
+
+AS_OF = pd.Timestamp("2025-03-31")
+
+
+def frame(rows):
+    return schema.normalize(pd.DataFrame(rows))
+
+
+def naive_buckets(df, as_of):
+    """Open charge per customer and bucket: each customer's credits up to
+    ``as_of`` paid against their charges up to ``as_of``, oldest first."""
+    df = df[df["date"] <= as_of]
+    owed = {}
+    for customer, rows in df.groupby("customer_name", observed=True):
+        rows = rows.sort_values("date", kind="stable")
+        credit = int(rows[["paid_amount", "sales_return", "customer_cashback_on_paid_amount"]].sum().sum())
+        for date, amount in zip(rows["date"], rows["open_value"] + rows["sales_amount"]):
+            settled = min(credit, int(amount))
+            credit -= settled
+            if amount - settled > 0:
+                age = (as_of - date).days
+                label = next(label for label, first, last in aging.BUCKETS
+                             if age >= first and (last is None or age <= last))
+                owed[(customer, label)] = owed.get((customer, label), 0) + int(amount - settled)
+    return owed
+
+
+def table_buckets(table):
+    return {(row["customer_name"], label): int(row[label])
+            for _, row in table.iterrows() for label in aging.BUCKET_LABELS if row[label]}
+
+
+def random_frame(rows=400, seed=1):
+    rng = np.random.default_rng(seed)
+    sale = rng.random(rows) < 0.6
+    return frame({
+        "date": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 90, rows), unit="D"),
+        "customer_name": rng.choice([f"Customer {i}" for i in range(12)], rows),
+        "customer_type": "Retail Shop",
+        "sales_executive": rng.choice(["Karim", "Salma"], rows),
+        "sales_amount": np.where(sale, rng.integers(1, 5000, rows), 0),
+        "paid_amount": np.where(sale, 0, rng.integers(1, 4000, rows)),
+    }).sort_values("date", kind="stable", ignore_index=True)
+
+
+def test_buckets_match_a_naive_fifo():
+    df = random_frame()
+    table = aging.Receivables.from_frame(df).by_customer(AS_OF)
+    assert table_buckets(table) == naive_buckets(df, AS_OF)
+    assert (table[aging.DUE] == table[aging.BUCKET_LABELS].sum(axis=1)).all()
+
+
+def test_incremental_add_matches_a_full_build():
+    df = random_frame()
+    cut = 300
+    receivables = aging.Receivables.from_frame(df.iloc[:cut])
+    receivables.add(schema.to_taka(df.iloc[cut:]))
+    full = aging.Receivables.from_frame(df)
+    assert table_buckets(receivables.by_customer(AS_OF)) == table_buckets(full.by_customer(AS_OF))
+
+
+def test_historical_as_of_excludes_later_sales_and_credits(store):
+    store.append([
+        {"date": "2025-01-01", "customer_name": "A", "sales_amount": 100},
+        {"date": "2025-02-10", "customer_name": "A", "sales_amount": 100},
+        {"date": "2025-03-01", "customer_name": "A", "sales_amount": 200},
+        {"date": "2025-03-05", "customer_name": "A", "paid_amount": 100},
+    ])
+    as_of = pd.Timestamp("2025-02-15")
+    historical = aging.build(store, as_of).by_customer(as_of)
+    assert table_buckets(historical) == {("A", "0-30"): 10_000, ("A", "31-60"): 10_000}
+    assert table_buckets(historical) == naive_buckets(store.read(), as_of)
+    # The current state settles the March payment against January
+    assert table_buckets(aging.build(store).by_customer()) == {("A", "0-30"): 30_000}
@@ -0,0 +1,76 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from wb_sales import backup, writer
+from wb_sales.journal import SEQ
+
+ROW = {"date": "2025-06-01", "customer_name": "A", "customer_type": "Retail Shop",
+       "sales_executive": "Karim", "sales_amount": 10}
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_capture_on_the_save_path_never_takes_a_base(store):
+    store.append(ROW)
+    assert backup.capture(store, base=False) is None
+    assert backup.bases(store) == []
+    assert backup.base_due(store)
+
+    backup.take_base(store)
+    store.append(ROW)
+    later = datetime.now() + backup.BASE_INTERVAL + timedelta(minutes=1)
+    assert backup.capture(store, now=later, base=False) == "delta"
+    assert len(backup.bases(store)) == 1
+    assert backup.base_due(store, now=later)
+
+
+def test_base_does_not_hold_the_lock_while_reading(store, monkeypatch):
+    store.append(ROW)
+    reading, release = threading.Event(), threading.Event()
+    snapshot = store.snapshot
+
+    def slow_snapshot(*args, **kwargs):
+        reading.set()
+        release.wait(10)
+        return snapshot(*args, **kwargs)
+
+    monkeypatch.setattr(store, "snapshot", slow_snapshot)
+    thread = threading.Thread(target=backup.take_base, args=(store,))
+    thread.start()
+    reading.wait(10)
+    # A save while the base is being read goes straight through
+    assert store.append(ROW) == 2
+    assert backup.capture(store, base=False) is None  # no base published yet
+    release.set()
+    thread.join()
+    assert len(backup.bases(store)) == 1
+
+
+def test_entries_captured_during_a_base_are_carried_over(store, monkeypatch):
+    store.append(ROW)
+    backup.take_base(store)
+    old_snapshot = store.snapshot()
+    store.append(ROW)
+    backup.capture(store, base=False)  # into the first base's delta
+    monkeypatch.setattr(store, "snapshot", lambda *a, **k: old_snapshot)
+    name = backup.take_base(store, now=datetime.now() + timedelta(seconds=1))
+    newest = backup.bases(store)[-1]
+    assert newest["name"] == name
+    assert [e[SEQ] for e in backup.read_delta(newest["delta"])] == [2]
+    monkeypatch.undo()
+    assert backup.restore(store) == 2
+
+
+def test_writer_takes_the_base_in_the_background(store):
+    writer.save(store, ROW)
+    wait_for(lambda: len(backup.bases(store)) == 1)
+    writer.save(store, ROW)
+    wait_for(lambda: backup._catalog(backup._folder(store))["seq"] == 2)
+    assert len(backup.bases(store)) == 1
+    assert backup.restore(store) == 2
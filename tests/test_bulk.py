@@ -0,0 +1,68 @@
+import io
+
+import pandas as pd
+
+from wb_sales import bulk, commissions
+
+CSV = """date,customer_name,customer_type,sales_executive,sales_amount,paid_amount,sales_ex_commission,cashback_eligible
+2025-06-01,Rahim Traders,Retail Shop,Karim,"1,000",,,
+2025-06-02,Rahim Traders,Retail Shop,Karim,,500,7.5,no
+"""
+
+
+def read(text):
+    return bulk.read_batch(io.StringIO(text), name="batch.csv")
+
+
+def test_validate_accepts_a_clean_batch():
+    rows, errors = bulk.validate(read(CSV))
+    assert errors.empty
+    assert rows["sales_amount"].tolist() == [1000.0, 0.0]
+    assert rows["paid_amount"].tolist() == [0.0, 500.0]
+    assert rows["sales_ex_commission"].isna().tolist() == [True, False]
+
+
+def test_validate_reports_bad_cells_with_file_line_numbers():
+    text = CSV + "not a date,,Retail Shop,Karim,-5,abc,,\n"
+    _, errors = bulk.validate(read(text))
+    problems = set(errors.itertuples(index=False, name=None))
+    assert (4, "date", "not a date") in problems
+    assert (4, "customer_name", "required") in problems
+    assert (4, "sales_amount", "negative") in problems
+    assert (4, "paid_amount", "not a number") in problems
+
+
+def test_validate_checks_every_computed_column():
+    text = CSV.replace(",7.5,", ",x,")
+    _, errors = bulk.validate(read(text))
+    assert errors[["row", "column"]].values.tolist() == [[3, "sales_ex_commission"]]
+    row = {"date": "2025-06-01", "customer_name": "Rahim Traders", "customer_type": "Retail Shop",
+           "sales_executive": "Karim"}
+    for col in [commissions.CASHBACK] + commissions.COMMISSIONS:
+        _, errors = bulk.validate(pd.DataFrame([{**row, col: "-1"}]))
+        assert errors["column"].tolist() == [col]
+
+
+def test_validate_reports_missing_columns():
+    _, errors = bulk.validate(pd.DataFrame({"date": ["2025-06-01"]}))
+    assert errors["column"].tolist() == bulk.REQUIRED[1:]
+
+
+def test_import_batch_fills_commissions_and_appends(store):
+    added, errors = bulk.import_batch(store, read(CSV))
+    assert errors.empty
+    assert added == 2
+    df = store.read()
+    assert len(df) == 2
+    deposit = df.iloc[1]
+    assert deposit["paid_amount"] == 50_000  # paisa
+    assert deposit["sales_ex_commission"] == 750  # kept as typed
+    assert deposit[commissions.CASHBACK] == 0  # not eligible
+    assert deposit["company_profit"] == 2_500  # 5% from the default rules
+
+
+def test_import_batch_writes_nothing_when_any_row_is_bad(store):
+    added, errors = bulk.import_batch(store, read(CSV + "2025-06-03,,Retail Shop,Karim,1,,,\n"))
+    assert added == 0
+    assert errors["column"].tolist() == ["customer_name"]
+    assert store.read().empty
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from wb_sales import commissions, dedup, loader
+from wb_sales.__main__ import main
+
+
+def test_rules_and_merges_live_in_the_data_folder(store):
+    store.append([{"date": "2025-06-01", "customer_name": name, "sales_amount": 100}
+                  for name in ["Al- Madina Crockeries", "Al- Madina Crockeries", "AL-MADINA CROCKERIES"]])
+    main(["--data", str(store.root), "rules", "--init"])
+    main(["--data", str(store.root), "dedup-customers"])
+    assert (store.root / "commission_rules.csv").exists()
+    assert (store.root / "customer_merges.csv").exists()
+    assert not commissions.rules_path().exists()
+    assert not dedup.map_path().exists()
+    # The store's own merge map is applied when it is loaded
+    assert loader.load(store)["customer_name"].nunique() == 1
+
+
+def test_batch_import_uses_the_stores_rules(store):
+    rules = commissions.DEFAULT_RULES.assign(sales_ex_commission=0.05)
+    commissions.save_rules(rules, commissions.rules_path(store))
+    batch = store.root / "batch.csv"
+    pd.DataFrame([{"date": "2025-06-01", "customer_name": "A", "sales_executive": "Karim", "customer_type": "Retail Shop",
+                   "paid_amount": 1000}]).to_csv(batch, index=False)
+    main(["--data", str(store.root), "import-batch", str(batch)])
+    assert store.read()["sales_ex_commission"].tolist() == [5000]  # 50 taka in paisa
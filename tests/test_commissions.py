@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from wb_sales import commissions
+
+CASHBACK = commissions.CASHBACK
+
+
+def rules(*rows):
+    return pd.DataFrame(list(rows))
+
+
+def row(customer_type="Retail Shop", sales_executive="Karim", date="2025-06-15", paid=1000):
+    return pd.DataFrame([{"date": date, "customer_type": customer_type, "sales_executive": sales_executive,
+                          "paid_amount": paid}])
+
+
+def rate(df, table, col="sales_ex_commission"):
+    return commissions.rates(df, table)[col].iloc[0]
+
+
+TABLE = rules(
+    {"sales_ex_commission": 0.01, CASHBACK: 0.02},
+    {"customer_type": "Dealership", "sales_ex_commission": 0.015},
+    {"sales_executive": "Karim", "sales_ex_commission": 0.02},
+    {"sales_executive": "Karim", "customer_type": "Dealership", "sales_ex_commission": 0.03},
+)
+
+
+@pytest.mark.parametrize("customer_type, executive, expected", [
+    ("Retail Shop", "Salma", 0.01),  # catch-all
+    ("Dealership", "Salma", 0.015),  # customer type beats catch-all
+    ("Retail Shop", "Karim", 0.02),  # executive beats customer type
+    ("Dealership", "Karim", 0.03),  # both beat either
+    (None, None, 0.01),
+])
+def test_most_specific_rule_wins(customer_type, executive, expected):
+    assert rate(row(customer_type, executive), TABLE) == expected
+
+
+def test_blank_rate_keeps_the_less_specific_one():
+    assert rate(row("Dealership", "Karim"), TABLE, CASHBACK) == 0.02
+
+
+def test_names_match_ignoring_surrounding_spaces():
+    assert rate(row(" Dealership ", "Karim  "), TABLE) == 0.03
+
+
+def test_validity_dates_are_inclusive_and_latest_start_wins():
+    table = rules(
+        {"sales_ex_commission": 0.01},
+        {"valid_from": "2025-01-01", "valid_to": "2025-06-30", "sales_ex_commission": 0.02},
+        {"valid_from": "2025-06-01", "sales_ex_commission": 0.03},
+    )
+    assert rate(row(date="2024-12-31"), table) == 0.01
+    assert rate(row(date="2025-05-31"), table) == 0.02
+    assert rate(row(date="2025-06-30"), table) == 0.03  # started later
+    assert rate(row(date="2025-07-01"), table) == 0.03
+
+
+def test_later_row_wins_among_equals():
+    table = rules({"sales_ex_commission": 0.01}, {"sales_ex_commission": 0.04})
+    assert rate(row(), table) == 0.04
+
+
+def test_compute_in_taka_and_paisa():
+    df = row(paid=1234.5)
+    assert commissions.compute(df, ["sales_ex_commission"], TABLE)["sales_ex_commission"].iloc[0] == 24.69
+    paisa = commissions.compute(row(paid=123450), ["sales_ex_commission"], TABLE, unit="paisa")
+    assert paisa["sales_ex_commission"].iloc[0] == 2469
+
+
+def test_fill_keeps_typed_values_and_respects_cashback_eligibility():
+    df = pd.concat([row(), row()], ignore_index=True)
+    df["sales_ex_commission"] = [5.0, None]
+    filled = commissions.fill(df, cashback_eligible=pd.Series([True, False]), rules=TABLE)
+    assert filled["sales_ex_commission"].tolist() == [5.0, 20.0]
+    assert filled[CASHBACK].tolist() == [20.0, 0.0]
+
+
+def test_rules_file_round_trip_and_default(tmp_path):
+    path = tmp_path / "rules.csv"
+    assert commissions.load_rules(path)["sales_ex_commission"].tolist() == [0.01]  # DEFAULT_RULES
+    commissions.save_rules(TABLE, path)
+    assert rate(row("Dealership", "Karim"), commissions.load_rules(path)) == 0.03
+
+
+def test_recompute_rewrites_only_commission_columns():
+    df = pd.DataFrame([{"date": "2025-06-01", "customer_type": "Dealership", "sales_executive": "Karim",
+                        "paid_amount": 100_000, "sales_ex_commission": 1, CASHBACK: 7}])
+    out = commissions.recompute(df, rules=TABLE)
+    assert out["sales_ex_commission"].iloc[0] == 3_000
+    assert out[CASHBACK].iloc[0] == 7
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from wb_sales import cube, schema
+from wb_sales.aggregates import COUNT, OUTSTANDING, TOTAL_COLUMNS
+
+
+def naive(df, start=None, end=None, **filters):
+    """Totals of the raw rows, summed directly."""
+    if start is not None:
+        df = df[df["date"] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df["date"] < pd.Timestamp(end) + pd.Timedelta(days=1)]
+    for col, value in filters.items():
+        df = df[df[col].isin([value] if isinstance(value, str) else value)]
+    totals = df[schema.MONEY_COLUMNS].sum()
+    totals[OUTSTANDING] = schema.outstanding(df).sum()
+    totals[COUNT] = len(df)
+    return totals[TOTAL_COLUMNS]
+
+
+@pytest.fixture(scope="module")
+def built(transactions):
+    return cube.Cube.from_frame(transactions)
+
+
+def test_cells_are_fewer_than_rows_and_in_date_order(built, transactions):
+    assert len(built) < len(transactions)
+    assert built.cells["date"].is_monotonic_increasing
+
+
+@pytest.mark.parametrize("start, end", [(None, None), ("2023-02-01", "2023-02-28"), ("2023-03-15", None)])
+def test_totals_match_the_raw_rows(built, transactions, start, end):
+    assert built.query(None, start, end).tolist() == naive(transactions, start, end).tolist()
+
+
+def test_filters_match_the_raw_rows(built, transactions):
+    executive = transactions["sales_executive"].cat.categories[0]
+    types = ["Dealership", "Corporate"]
+    got = built.query(None, "2023-01-10", "2023-03-10", sales_executive=executive, customer_type=types)
+    expected = naive(transactions, "2023-01-10", "2023-03-10", sales_executive=executive, customer_type=types)
+    assert got.tolist() == expected.tolist()
+
+
+def test_grouped_totals_match_a_groupby(built, transactions):
+    table = built.query("sales_executive", "2023-02-01", "2023-02-28").set_index("sales_executive")
+    month = transactions[transactions["date"].between("2023-02-01", "2023-02-28")]
+    expected = month.groupby("sales_executive", observed=True)["sales_amount"].sum()
+    expected.index = expected.index.astype("string")
+    pd.testing.assert_series_equal(table["sales_amount"], expected, check_names=False, check_index_type=False)
+
+
+def test_add_matches_a_full_build(transactions):
+    cut = len(transactions) - 200
+    incremental = cube.Cube.from_frame(transactions.iloc[:cut])
+    # Includes a back-dated row, which regroups earlier days too
+    new = schema.to_taka(pd.concat([transactions.iloc[cut:], transactions.iloc[[10]]]))
+    incremental.add(new, seq=7)
+    full = cube.Cube.from_frame(pd.concat([transactions, transactions.iloc[[10]]], ignore_index=True))
+    assert incremental.seq == 7
+    assert incremental.query(None).tolist() == full.query(None).tolist()
+    assert incremental.query(None, "2023-01-01", "2023-01-05").tolist() == \
+        full.query(None, "2023-01-01", "2023-01-05").tolist()
+
+
+def test_sql_totals_can_stand_in_for_the_cube(store, transactions):
+    from wb_sales.sqlbackend import SqlBackend
+
+    store.write(transactions)
+    backend = SqlBackend(store)
+    backend.sync()
+    built = cube.build(store)
+    start, end = "2023-02-01", "2023-03-31"
+    executive = transactions["sales_executive"].cat.categories[0]
+    assert backend.totals(None, start, end).tolist() == built.query(None, start, end).tolist()
+    sql = backend.totals("customer_type", start, end, executive=executive)
+    rolled = built.query("customer_type", start, end, sales_executive=executive)
+    assert sql.columns.tolist() == rolled.columns.tolist()
+    assert sql.astype(str).values.tolist() == rolled.astype(str).values.tolist()
@@ -0,0 +1,49 @@
+import io
+
+import pandas as pd
+import pytest
+
+from wb_sales import exports, schema
+
+
+@pytest.fixture
+def table(transactions):
+    return transactions.iloc[:500]
+
+
+def read_back(data, fmt):
+    if fmt == "csv":
+        return pd.read_csv(io.BytesIO(data), encoding="utf-8-sig", parse_dates=["date"])
+    if fmt == "parquet":
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_excel(io.BytesIO(data), sheet_name="Transactions")
+
+
+@pytest.mark.parametrize("fmt", list(exports.FORMATS))
+def test_round_trip_in_taka(table, fmt, monkeypatch):
+    monkeypatch.setattr(exports, "CHUNK_ROWS", 128)  # several chunks
+    back = read_back(exports.export(table, fmt), fmt)
+    expected = schema.to_taka(table)
+    assert back.columns.tolist() == expected.columns.tolist()
+    assert len(back) == len(table)
+    assert back["sales_amount"].round(2).tolist() == expected["sales_amount"].tolist()
+    assert back["customer_name"].astype(str).tolist() == expected["customer_name"].astype(str).tolist()
+    assert (pd.to_datetime(back["date"]) == expected["date"]).all()
+
+
+@pytest.mark.parametrize("fmt", list(exports.FORMATS))
+def test_empty_table_keeps_its_header(table, fmt):
+    assert read_back(exports.export(table.iloc[0:0], fmt), fmt).columns.tolist() == table.columns.tolist()
+
+
+def test_frames_already_in_taka_are_not_converted(table):
+    taka = schema.to_taka(table)
+    back = read_back(exports.export(taka, "parquet", paisa=False), "parquet")
+    assert back["sales_amount"].tolist() == taka["sales_amount"].tolist()
+
+
+def test_excel_is_not_offered_past_the_sheet_limit():
+    assert "xlsx" in exports.formats(exports.EXCEL_MAX_ROWS)
+    assert exports.formats(exports.EXCEL_MAX_ROWS + 1) == ["csv", "parquet"]
+    with pytest.raises(ValueError):
+        exports.export(pd.DataFrame(), "pdf")
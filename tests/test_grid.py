@@ -0,0 +1,30 @@
+import pytest
+
+from wb_sales import grid
+
+
+@pytest.mark.parametrize("sort_by, ascending", [("sales_amount", False), ("customer_name", True),
+                                                 ("date", False), ("order_no", True)])
+def test_pages_match_a_full_sort(transactions, sort_by, ascending):
+    expected = transactions.sort_values(sort_by, ascending=ascending, kind="stable", na_position="last")
+    if sort_by == "customer_name":
+        expected = transactions.iloc[
+            transactions["customer_name"].astype(str).reset_index(drop=True)
+            .sort_values(kind="stable").index]
+    for number in (1, 3):
+        rows, total = grid.page(transactions, number, 50, sort_by, ascending)
+        assert total == len(transactions)
+        assert rows.index.tolist() == expected.index[(number - 1) * 50:number * 50].tolist()
+
+
+def test_search_matches_names_case_insensitively(transactions):
+    name = transactions["customer_name"].iloc[0]
+    rows, total = grid.page(transactions, text=name.upper()[:14])
+    assert total == transactions["customer_name"].astype(str).str.contains(name[:14], case=False).sum()
+    assert len(rows) == min(total, grid.PAGE_SIZE)
+
+
+def test_page_past_the_end_is_empty(transactions):
+    rows, total = grid.page(transactions, number=10_000)
+    assert rows.empty and total == len(transactions)
+    assert grid.page_count(total) == -(-len(transactions) // grid.PAGE_SIZE)
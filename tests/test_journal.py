@@ -0,0 +1,60 @@
+import logging
+
+from wb_sales.journal import SEQ, Journal
+
+
+def entries(journal):
+    return [(r[SEQ], r["customer_name"]) for r in journal.read()]
+
+
+def test_append_numbers_entries_and_reads_them_back(tmp_path):
+    journal = Journal(tmp_path / "journal.jsonl")
+    assert journal.last_seq() == 0
+    assert journal.append([{"customer_name": "A"}, {"customer_name": "B"}], first_seq=1) == 2
+    assert entries(journal) == [(1, "A"), (2, "B")]
+    assert [r["customer_name"] for r in journal.read(after_seq=1)] == ["B"]
+    journal.discard_through(1)
+    assert entries(journal) == [(2, "B")]
+
+
+def test_append_after_a_torn_write_keeps_the_new_entry(tmp_path, caplog):
+    journal = Journal(tmp_path / "journal.jsonl")
+    journal.append([{"customer_name": "A"}], first_seq=1)
+    with open(journal.path, "ab") as f:
+        f.write(b'{"customer_name": "half writ')  # crash mid-append
+    assert journal.last_seq() == 1
+
+    with caplog.at_level(logging.WARNING, logger="wb_sales.journal"):
+        journal.append([{"customer_name": "B"}], first_seq=journal.last_seq() + 1)
+    assert "torn entry" in caplog.text
+    assert entries(journal) == [(1, "A"), (2, "B")]
+    assert journal.last_seq() == 2
+    assert journal.skipped == 0
+
+
+def test_torn_only_line_is_dropped(tmp_path):
+    journal = Journal(tmp_path / "journal.jsonl")
+    journal.path.write_bytes(b'{"customer_na')
+    journal.append([{"customer_name": "A"}], first_seq=1)
+    assert entries(journal) == [(1, "A")]
+
+
+def test_unparseable_lines_are_counted_and_logged(tmp_path, caplog):
+    journal = Journal(tmp_path / "journal.jsonl")
+    journal.append([{"customer_name": "A"}], first_seq=1)
+    with open(journal.path, "ab") as f:
+        f.write(b"garbage\n")
+    journal.append([{"customer_name": "B"}], first_seq=2)
+    with caplog.at_level(logging.WARNING, logger="wb_sales.journal"):
+        assert entries(journal) == [(1, "A"), (2, "B")]
+    assert journal.skipped == 1
+    assert "line 2" in caplog.text
+
+
+def test_store_save_after_a_torn_write_is_durable(store):
+    store.append({"date": "2025-06-01", "customer_name": "A", "sales_amount": 10})
+    with open(store.journal.path, "ab") as f:
+        f.write(b'{"date": "2025-06-02", "customer_')
+    assert store.append({"date": "2025-06-03", "customer_name": "B", "sales_amount": 20}) == 2
+    assert store.read()["customer_name"].tolist() == ["A", "B"]
+    assert store.append({"date": "2025-06-04", "customer_name": "C"}) == 3
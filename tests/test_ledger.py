@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from wb_sales import schema
+from wb_sales.ledger import BALANCE, CustomerLedger
+
+START, END = pd.Timestamp("2023-02-01"), pd.Timestamp("2023-02-28")
+
+
+@pytest.fixture(scope="module")
+def ledger(transactions):
+    return CustomerLedger.from_frame(transactions)
+
+
+def naive_period(df, customer, start, end):
+    rows = df[df["customer_name"] == customer]
+    moves = schema.outstanding(rows)
+    opening = int(moves[rows["date"] < start].sum())
+    closing = int(moves[rows["date"] <= end].sum())
+    return {"opening": opening, "movement": closing - opening, "closing": closing}
+
+
+def test_periods_match_a_naive_sum(ledger, transactions):
+    table = ledger.periods(START, END).set_index("customer_name")
+    for customer in transactions["customer_name"].cat.categories[:40]:
+        expected = naive_period(transactions, customer, START, END)
+        assert ledger.period(customer, START, END) == expected
+        assert table.loc[customer, ["opening", "movement", "closing"]].tolist() == list(expected.values())
+
+
+def test_closing_without_an_end_is_the_whole_history(ledger, transactions):
+    customer = transactions["customer_name"].iloc[0]
+    rows = transactions[transactions["customer_name"] == customer]
+    assert ledger.closing(customer) == schema.outstanding(rows).sum()
+
+
+def test_statement_carries_the_running_balance(ledger, transactions):
+    customer = transactions["customer_name"].iloc[0]
+    statement = ledger.statement(customer, START, END)
+    opening = ledger.period(customer, START, END)["opening"]
+    expected = opening + schema.outstanding(statement).cumsum()
+    assert statement[BALANCE].tolist() == expected.tolist()
+    assert statement["date"].between(START, END).all()
+
+
+def test_unknown_customer_raises(ledger):
+    with pytest.raises(KeyError):
+        ledger.period("Nobody")
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from wb_sales import reports, schema
+
+END = "2023-03-15"
+
+
+def test_customer_outstanding_is_as_at_the_end_of_the_period(store, transactions, tmp_path):
+    store.write(transactions)
+    executive = transactions["sales_executive"].cat.categories[0]
+    results = reports.run_batch(store, tmp_path / "out", "2023-03-01", END, executives=[executive], workers=1)
+    path = dict((name, path) for name, path, _ in results)[executive]
+    got = pd.read_excel(path, sheet_name="Customer Outstanding").set_index("customer_name")["outstanding"]
+
+    upto = transactions[(transactions["date"] <= END) & (transactions["sales_executive"] == executive)]
+    expected = schema.outstanding(upto).groupby(upto["customer_name"], observed=True).sum() / 100
+    assert got.round(2).to_dict() == expected.round(2).to_dict()
+    # Later transactions would change the balances
+    later = transactions[transactions["sales_executive"] == executive]
+    assert expected.sum() != schema.outstanding(later).sum() / 100
+
+
+def test_open_ended_reports_use_the_running_totals(store, transactions, tmp_path):
+    store.write(transactions)
+    executive = transactions["sales_executive"].cat.categories[0]
+    results = reports.run_batch(store, tmp_path / "out", executives=[executive], workers=1)
+    path = dict((name, path) for name, path, _ in results)[executive]
+    got = pd.read_excel(path, sheet_name="Customer Outstanding")["outstanding"].sum()
+    mine = transactions[transactions["sales_executive"] == executive]
+    assert round(got, 2) == round(schema.outstanding(mine).sum() / 100, 2)
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from wb_sales import schema
+from wb_sales.aggregates import COUNT, OUTSTANDING
+from wb_sales.sqlbackend import SqlBackend
+
+START, END = "2023-02-01", "2023-02-28"
+
+
+@pytest.fixture
+def backend(store, transactions):
+    store.write(transactions)
+    backend = SqlBackend(store)
+    backend.sync()
+    return backend
+
+
+def test_filters_return_the_same_rows_as_pandas(backend, transactions):
+    executive = transactions["sales_executive"].cat.categories[1]
+    got = backend.transactions(START, END, executive=executive)
+    expected = transactions[transactions["date"].between(START, END)
+                            & (transactions["sales_executive"] == executive)]
+    assert len(got) == len(expected)
+    assert got["sales_amount"].tolist() == expected["sales_amount"].tolist()
+    assert (got["date"].to_numpy() == expected["date"].to_numpy()).all()
+
+
+def test_totals_match_pandas(backend, transactions):
+    month = transactions[transactions["date"].between(START, END)]
+    totals = backend.totals(None, START, END)
+    assert totals[schema.MONEY_COLUMNS].tolist() == month[schema.MONEY_COLUMNS].sum().tolist()
+    assert totals[OUTSTANDING] == schema.outstanding(month).sum()
+    assert totals[COUNT] == len(month)
+    by_type = backend.totals("customer_type", START, END).set_index("customer_type")["paid_amount"]
+    expected = month.groupby("customer_type", observed=True)["paid_amount"].sum()
+    assert by_type.to_dict() == expected.to_dict()
+
+
+def test_sync_adds_new_journal_entries(backend, store):
+    store.append({"date": "2023-02-10", "customer_name": "New Customer", "sales_executive": "Karim",
+                  "customer_type": "Retail Shop", "sales_amount": 12.5})
+    before = backend.totals(None, START, END)
+    assert backend.sync() == 1
+    assert backend.sync() == 0
+    after = backend.totals(None, START, END)
+    assert after["sales_amount"] - before["sales_amount"] == 1250
+    assert len(backend.transactions(customer="New Customer")) == 1
+
+
+def test_rewritten_store_is_mirrored_again(backend, store, transactions):
+    store.write(transactions.iloc[:100])
+    assert backend.sync() == 100
+    assert backend.totals()[COUNT] == 100
+
+
+def test_pickers_come_from_sql(backend, transactions):
+    assert backend.date_extent() == (transactions["date"].min(), transactions["date"].max())
+    assert backend.values("sales_executive") == sorted(transactions["sales_executive"].dropna().unique())
+    assert backend.values("customer_name") == sorted(transactions["customer_name"].dropna().unique())
+    with pytest.raises(ValueError):
+        backend.values("paid_amount")
+
+
+def test_empty_mirror_has_no_dates(store):
+    backend = SqlBackend(store)
+    backend.sync()
+    assert all(pd.isna(d) for d in backend.date_extent())
+    assert backend.values("customer_type") == []
@@ -0,0 +1,74 @@
+import pandas as pd
+
+from wb_sales import TransactionStore, schema
+
+ROWS = [
+    {"date": "2025-06-01", "customer_name": "Rahim Traders", "customer_type": "Retail Shop",
+     "sales_executive": "Karim", "sales_amount": 1000.25},
+    {"date": "2025-06-15", "customer_name": "Rahim Traders", "customer_type": "Retail Shop",
+     "sales_executive": "Karim", "paid_amount": 400},
+    {"date": "2025-07-02", "customer_name": "Bhai Bhai Store", "customer_type": "Dealership",
+     "sales_executive": "Salma", "sales_amount": 250, "sales_return": 50},
+]
+
+
+def summary(df):
+    return df.assign(date=df["date"].dt.strftime("%Y-%m-%d"))[
+        ["date", "customer_name", "sales_executive", "sales_amount", "paid_amount", "sales_return"]
+    ].astype(str).values.tolist()
+
+
+def test_append_is_read_back_before_and_after_compaction(store):
+    store.append(ROWS)
+    before = store.read()
+    assert before["sales_amount"].tolist() == [100_025, 0, 25_000]
+    assert before["paid_amount"].dtype == "int64"
+
+    assert store.compact() == 3
+    assert store.pending() == []
+    after = store.read()
+    assert summary(after) == summary(before)
+    assert isinstance(after["customer_name"].dtype, pd.CategoricalDtype)
+    # A fresh handle sees the same committed table
+    assert summary(TransactionStore(store.root).read()) == summary(before)
+
+
+def test_compaction_keeps_appending(store):
+    store.append(ROWS[:2])
+    store.compact()
+    store.append(ROWS[2])
+    assert store.read()["customer_name"].tolist() == ["Rahim Traders", "Rahim Traders", "Bhai Bhai Store"]
+    store.compact()
+    assert len(store.read()) == 3
+    assert store.journal.last_seq() <= store.base_seq()
+
+
+def test_month_with_a_blank_dimension_survives_compaction(store):
+    # June has no customer type or executive at all
+    store.append({"date": "2025-06-01", "customer_name": "Walk-in", "sales_amount": 100})
+    store.append(ROWS[2])
+    store.compact()
+    df = store.read()
+    assert df["customer_type"].isna().tolist() == [True, False]
+    assert df["sales_executive"].tolist()[1] == "Salma"
+    for col in schema.CATEGORIES[:3]:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    assert len(store.read(start="2025-06-01", end="2025-06-30")) == 1
+
+
+def test_date_range_read_opens_only_matching_months(store):
+    store.append(ROWS)
+    store.compact()
+    assert store.partitions("2025-07-01", "2025-07-31") == ["2025-07"]
+    july = store.read(start="2025-07-01", end="2025-07-31")
+    assert july["customer_name"].tolist() == ["Bhai Bhai Store"]
+
+
+def test_write_replaces_the_table_and_totals_follow(store):
+    store.append(ROWS)
+    df = store.read()
+    store.write(df[df["sales_executive"] == "Karim"])
+    assert len(store.read()) == 2
+    totals = store.totals().grand_total()
+    assert totals["sales_amount"] == 100_025
+    assert totals["paid_amount"] == 40_000
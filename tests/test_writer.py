@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from wb_sales import writer
+from wb_sales.journal import SEQ
+
+
+def test_concurrent_saves_are_all_durable_with_distinct_numbers(store):
+    seqs = []
+
+    def save(i):
+        seqs.append(writer.save(store, {"date": "2025-06-01", "customer_name": f"C{i}", "sales_amount": i}))
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(30)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    entries = store.journal.read()
+    assert sorted(e[SEQ] for e in entries) == list(range(1, 31))
+    assert max(seqs) == 30
+    assert sorted(store.read()["customer_name"]) == sorted(f"C{i}" for i in range(30))
+
+
+def test_save_raises_the_commit_error(store, monkeypatch):
+    def fail(rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "append", fail)
+    writer._writers.pop(store.root.resolve(), None)
+    with pytest.raises(OSError, match="disk full"):
+        writer.save(store, {"date": "2025-06-01"}, timeout=10)
+
+
+def test_store_lock_is_reentrant_and_shared(store):
+    lock = writer.store_lock(store.root)
+    assert lock is writer.store_lock(store.root)
+    with lock:
+        with lock:
+            assert store.append({"date": "2025-06-01", "customer_name": "A"}) == 1
+
+
+
+@pytest.mark.filterwarnings("ignore:compaction of")
+def test_failed_compaction_does_not_fail_the_save(store, monkeypatch):
+    def fail(threshold=None):
+        raise OSError("compaction failed")
+
+    monkeypatch.setattr(store, "maybe_compact", fail)
+    writer._writers.pop(store.root.resolve(), None)
+    assert writer.save(store, {"date": "2025-06-01", "customer_name": "A"}, timeout=10) == 1
+    # Saved exactly once; the entry waits in the journal for a later compaction
+    assert [e["customer_name"] for e in store.journal.read()] == ["A"]
+    assert store.read()["customer_name"].tolist() == ["A"]
@@ -0,0 +1,9 @@
+"""Shared data layer for the WELBURG METAL sales & deposit dashboards."""
+
+from .config import DATA_DIR
+from .storage import TransactionStore
+
+
+def open_store(root=None):
+    """The transaction store the apps use (``config.DATA_DIR`` by default)."""
+    return TransactionStore(root or DATA_DIR)
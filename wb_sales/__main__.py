@@ -0,0 +1,145 @@
+"""Command line tools: ``python -m wb_sales <command>``."""
+
+import argparse
+import time
+
+import pandas as pd
+
+from . import open_store
+from .config import WORKBOOK_PATH
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m wb_sales")
+    parser.add_argument("--data", help="store directory (default: WB_SALES_DATA or ./data)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    imp = commands.add_parser("import-xlsx", help="load a workbook into the store")
+    imp.add_argument("workbook", nargs="?", default=WORKBOOK_PATH)
+    imp.add_argument("--append", action="store_true", help="add rows instead of replacing")
+
+    batch = commands.add_parser("import-batch", help="validate a CSV/Excel batch and add it to the store")
+    batch.add_argument("file")
+
+    exp = commands.add_parser("export-xlsx", help="write the store out as a workbook")
+    exp.add_argument("workbook")
+
+    commands.add_parser("compact", help="fold the transaction journal into the base table")
+
+    rules = commands.add_parser("rules", help="show the commission rule table")
+    rules.add_argument("--init", action="store_true", help="write the default table to edit")
+
+    rec = commands.add_parser("recompute-commissions",
+                              help="recalculate stored commissions and profit from the rule table")
+    rec.add_argument("--start", help="first day (YYYY-MM-DD) to recalculate")
+    rec.add_argument("--end", help="last day (YYYY-MM-DD) to recalculate")
+    rec.add_argument("--dry-run", action="store_true", help="only show what would change")
+
+    dup = commands.add_parser("dedup-customers",
+                              help="propose merges of near-duplicate customer names for review")
+    dup.add_argument("--threshold", type=float, help="lowest similarity (0-1) to propose")
+
+    bak = commands.add_parser("backup", help="back up changes since the last backup")
+    bak.add_argument("--full", action="store_true", help="take a new full snapshot")
+
+    commands.add_parser("backups", help="list the backup snapshots")
+
+    res = commands.add_parser("restore", help="put the table back as it was at a given time")
+    res.add_argument("when", nargs="?", help="date/time (YYYY-MM-DD HH:MM; default: latest backup)")
+
+    rep = commands.add_parser("reports", help="write every executive's workbook and the chairman report")
+    rep.add_argument("out_dir", help="folder for the workbooks")
+    rep.add_argument("--start", help="first day (YYYY-MM-DD) of the report period")
+    rep.add_argument("--end", help="last day (YYYY-MM-DD) of the report period")
+    rep.add_argument("--executive", action="append", dest="executives",
+                     help="only this executive (repeatable; default: all)")
+    rep.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+
+    args = parser.parse_args(argv)
+    store = open_store(args.data)
+
+    if args.command == "import-xlsx":
+        rows = store.import_excel(args.workbook, append=args.append)
+        print(f"Imported {args.workbook}: store now holds {rows} rows")
+    elif args.command == "import-batch":
+        from .bulk import import_batch, read_batch
+
+        added, errors = import_batch(store, read_batch(args.file))
+        if len(errors):
+            print(errors.to_string(index=False))
+            raise SystemExit(f"{len(errors)} problem(s) in {args.file}; nothing was imported")
+        print(f"Imported {added} transactions from {args.file}")
+    elif args.command == "export-xlsx":
+        rows = store.export_excel(args.workbook)
+        print(f"Exported {rows} rows to {args.workbook}")
+    elif args.command == "compact":
+        rows = store.compact()
+        print(f"Merged {rows} journal entries into the base table")
+    elif args.command == "rules":
+        from . import commissions
+
+        path = commissions.rules_path(store)
+        if args.init:
+            if path.exists():
+                raise SystemExit(f"{path} already exists")
+            print(f"Wrote {commissions.save_rules(commissions.DEFAULT_RULES, path)}")
+        table = commissions.load_rules(path).drop(columns="_priority").astype(object)
+        print(table.where(table.notna(), "").to_string(index=False))
+    elif args.command == "recompute-commissions":
+        from .commissions import recompute_store
+        from .schema import to_taka
+
+        before, after, changed = recompute_store(store, args.start, args.end, dry_run=args.dry_run)
+        print(pd.DataFrame({"before": to_taka(before), "after": to_taka(after)}).to_string())
+        action = "would change" if args.dry_run else "changed"
+        print(f"{changed} rows {action}")
+    elif args.command == "dedup-customers":
+        from . import dedup
+
+        names = store.read(columns=["customer_name"])["customer_name"]
+        proposed = dedup.find_duplicates(names.dropna().unique(), names.value_counts(),
+                                         threshold=args.threshold or dedup.THRESHOLD)
+        path = dedup.map_path(store)
+        existing = dedup.read_map(path)
+        table = dedup.update_map(proposed, existing)
+        if table.empty:
+            print("No near-duplicate customer names found")
+        else:
+            print(table.to_string(index=False))
+            new = len(table) - (0 if existing is None else len(existing))
+            print(f"{new} new merge(s) proposed; review the '{dedup.APPROVED}' column of {dedup.save_map(table, path)}")
+    elif args.command == "backup":
+        from . import backup
+
+        if args.full:
+            print(f"Wrote {backup.take_base(store)}")
+        else:
+            print({"base": "Took a full snapshot", "delta": "Backed up new transactions",
+                   None: "Nothing new to back up"}[backup.capture(store)])
+    elif args.command == "backups":
+        from . import backup
+
+        for base in backup.bases(store):
+            deltas = len(backup.read_delta(base["delta"]))
+            print(f"{base['time']:%Y-%m-%d %H:%M:%S}  seq {base['seq']:>8}  "
+                  f"{base['path'].stat().st_size / 1e6:8.2f} MB  + {deltas} later transactions")
+    elif args.command == "restore":
+        from . import backup
+
+        try:
+            rows = backup.restore(store, args.when)
+        except ValueError as exc:
+            raise SystemExit(str(exc))
+        print(f"Restored {rows} rows; the table as it was before is kept as a backup")
+    elif args.command == "reports":
+        from .reports import run_batch
+
+        started = time.perf_counter()
+        written = run_batch(store, args.out_dir, args.start, args.end, args.executives, args.workers)
+        for name, path, rows in written:
+            print(f"{name}: {rows} rows -> {path}")
+        print(f"Wrote {len(written)} workbooks in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Running per-executive and per-customer totals (money in paisa).
+
+The totals are built once from the base table (and saved next to it at every
+compaction), then updated in place as transactions are appended, so summary
+tables and KPI cards cost O(#groups) instead of a groupby over every row.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import dedup, schema
+from .journal import SEQ_KEY
+
+OUTSTANDING = "outstanding"
+COUNT = "transactions"
+TOTAL_COLUMNS = schema.MONEY_COLUMNS + [OUTSTANDING, COUNT]
+
+LEVELS = {
+    "executive": ["sales_executive"],
+    "customer": ["customer_name"],
+    "executive_customer": ["sales_executive", "customer_name"],
+}
+
+
+def _group(df, keys):
+    values = df[schema.MONEY_COLUMNS].copy()
+    values[OUTSTANDING] = schema.outstanding(df)
+    values[COUNT] = 1
+    grouped = values.groupby([df[k] for k in keys], observed=True).sum().reset_index()
+    # Plain string keys, so totals built from frames with different category
+    # dictionaries still line up
+    for k in keys:
+        grouped[k] = grouped[k].astype("string")
+    return grouped.set_index(keys)
+
+
+class RunningTotals:
+    """Money totals, outstanding and row counts keyed by executive, customer
+    and executive/customer pair. ``seq`` is the last journal entry included."""
+
+    def __init__(self, tables, seq=0):
+        self.tables = tables
+        self.seq = seq
+
+    @classmethod
+    def from_frame(cls, df, seq=0):
+        return cls({level: _group(df, keys) for level, keys in LEVELS.items()}, seq)
+
+    def add(self, rows, seq=None):
+        """Fold newly appended transactions (a frame or list of dicts) into the totals."""
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame([rows] if isinstance(rows, dict) else rows)
+        rows = schema.normalize(rows)
+        for level, keys in LEVELS.items():
+            table = self.tables[level]
+            part = _group(rows, keys)
+            seen = part.index.intersection(table.index)
+            table.loc[seen] += part.loc[seen]
+            new = part.index.difference(table.index)
+            if len(new):
+                self.tables[level] = pd.concat([table, part.loc[new]])
+        if seq is not None:
+            self.seq = seq
+        return self
+
+    # --- summaries -------------------------------------------------------
+
+    def by_executive(self):
+        return self.tables["executive"].sort_index().reset_index()
+
+    def by_customer(self, merges=None):
+        return dedup.merge_totals(self.tables["customer"], merges=merges).sort_index().reset_index()
+
+    def customers_of(self, executive, merges=None):
+        """Per-customer totals for one executive; ``merges`` as in
+        ``dedup.merge_totals``."""
+        table = dedup.merge_totals(self.tables["executive_customer"], merges=merges)
+        if executive not in table.index.get_level_values(0):
+            return table.iloc[0:0].reset_index(level=0, drop=True).reset_index()
+        return table.xs(executive, level=0).sort_index().reset_index()
+
+    def grand_total(self):
+        return self.tables["executive"].sum()
+
+    # --- persistence -----------------------------------------------------
+
+    def save(self, path):
+        frames = []
+        for level, table in self.tables.items():
+            frame = table.reset_index()
+            frame.insert(0, "level", level)
+            frames.append(frame)
+        table = pa.Table.from_pandas(pd.concat(frames, ignore_index=True), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), SEQ_KEY: str(self.seq)})
+        pq.write_table(table, path)
+
+    @classmethod
+    def load(cls, path):
+        table = pq.read_table(path)
+        seq = int((table.schema.metadata or {}).get(SEQ_KEY, 0))
+        df = table.to_pandas()
+        tables = {}
+        for level, keys in LEVELS.items():
+            part = df[df["level"] == level]
+            tables[level] = part.set_index(keys)[TOTAL_COLUMNS]
+        return cls(tables, seq)
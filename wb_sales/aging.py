@@ -0,0 +1,153 @@
+"""Receivables aging: open sales per customer, by age (money in paisa).
+
+Charges (opening balance and sales) are settled first-in-first-out by credits
+(deposits, returns and cashback); whatever is left of each charge is still
+owed and ages from the charge's date. A negative amount counts on the other
+side, so a negative opening balance is a credit.
+
+Only the open charges and each customer's unapplied credit are kept, so the
+state stays small however long the history is. ``Receivables.add`` settles
+newly appended transactions against it the way ``RunningTotals.add`` updates
+the totals: only the customers in the new rows are touched. Credits are
+applied when they arrive, so a back-dated sale is not matched against
+payments already applied to later sales until the next full build (after
+compaction, see ``loader.catch_up``).
+
+The state is always as of its newest transaction. Aging as of an earlier day
+needs its own build from the transactions up to that day (``build(store,
+as_of)``): later sales are not owed yet and later credits not yet applied.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import dedup, schema
+
+# (label, first day, last day) of every age bucket
+BUCKETS = [("0-30", 0, 30), ("31-60", 31, 60), ("61-90", 61, 90), ("90+", 91, None)]
+BUCKET_LABELS = [label for label, _, _ in BUCKETS]
+
+DUE = "total_due"
+CREDIT = "unapplied_credit"
+NET = "outstanding"
+
+# Money columns of the aging tables (for ``schema.to_taka``)
+AMOUNT_COLUMNS = BUCKET_LABELS + [DUE, CREDIT, NET]
+
+_CHARGES = ["open_value", "sales_amount"]
+_CREDITS = ["paid_amount", "sales_return", "customer_cashback_on_paid_amount"]
+
+
+def _split(df):
+    """Charge and credit of every row (both >= 0)."""
+    charges, credits = df[_CHARGES].to_numpy(np.int64), df[_CREDITS].to_numpy(np.int64)
+    charge = np.clip(charges, 0, None).sum(axis=1) - np.clip(credits, None, 0).sum(axis=1)
+    credit = np.clip(credits, 0, None).sum(axis=1) - np.clip(charges, None, 0).sum(axis=1)
+    return charge, credit
+
+
+def _settle(items, credit):
+    """Apply ``credit`` (customer -> amount) FIFO to ``items`` (open charges
+    sorted by customer and date). Returns the still-open items and the credit
+    left over per customer."""
+    available = items["customer_name"].map(credit).fillna(0).to_numpy(np.int64)
+    amount = items["amount"].to_numpy(np.int64)
+    settled_through = items.groupby("customer_name", sort=False)["amount"].cumsum().to_numpy(np.int64)
+    remaining = np.clip(settled_through - available, 0, amount)
+    owed = items.groupby("customer_name", sort=False)["amount"].sum()
+    leftover = (credit - owed.reindex(credit.index, fill_value=0)).clip(lower=0)
+    return items.assign(amount=remaining)[remaining > 0], leftover[leftover > 0]
+
+
+def _state(df):
+    """Open charges, credit per customer and executive per customer of ``df``."""
+    df = df[df["customer_name"].notna()]
+    charge, credit = _split(df)
+    items = df.loc[charge > 0, ["customer_name", "sales_executive", schema.DATE]].reset_index(drop=True)
+    items = items.astype({"customer_name": "string", "sales_executive": "string"})
+    items["amount"] = charge[charge > 0]
+    by_customer = pd.Series(credit, index=df.index).groupby(df["customer_name"], observed=True)
+    credits = by_customer.sum()
+    last_exec = df["sales_executive"].groupby(df["customer_name"], observed=True).last().astype("string")
+    credits.index = last_exec.index = credits.index.astype("string")
+    return items, credits, last_exec
+
+
+def _sort(items):
+    return items.sort_values(["customer_name", schema.DATE], kind="stable", na_position="last")
+
+
+class Receivables:
+    """Open charges per customer plus unapplied credit; ``seq`` is the last
+    journal entry included."""
+
+    def __init__(self, items, credit, executives, seq=0):
+        self.items = items
+        self.credit = credit
+        # Executive of each customer's latest transaction (unapplied credit is shown under them)
+        self.executives = executives
+        self.seq = seq
+
+    @classmethod
+    def from_frame(cls, df, seq=0):
+        items, credits, executives = _state(df)
+        items, credit = _settle(_sort(items).reset_index(drop=True), credits)
+        return cls(items, credit, executives, seq)
+
+    def add(self, rows, seq=None):
+        """Settle newly appended transactions (a frame or list of dicts, taka)."""
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame([rows] if isinstance(rows, dict) else rows)
+        new_items, new_credit, executives = _state(dedup.apply_frame(schema.normalize(rows)))
+        touched = new_credit.index
+        if len(touched):
+            mine = self.items["customer_name"].isin(touched)
+            pool = _sort(pd.concat([self.items[mine], new_items], ignore_index=True))
+            credit = self.credit.reindex(touched, fill_value=0) + new_credit
+            settled, left = _settle(pool.reset_index(drop=True), credit)
+            self.items = pd.concat([self.items[~mine], settled], ignore_index=True)
+            self.credit = pd.concat([self.credit.drop(touched, errors="ignore"), left])
+            self.executives = pd.concat([self.executives.drop(executives.index, errors="ignore"), executives])
+        if seq is not None:
+            self.seq = seq
+        return self
+
+    # --- reports ---------------------------------------------------------
+
+    def _aged(self, as_of):
+        if as_of is None:
+            as_of = self.items[schema.DATE].max()
+        as_of = pd.Timestamp.today() if pd.isna(as_of) else pd.Timestamp(as_of)
+        age = (as_of.normalize() - self.items[schema.DATE]).dt.days.fillna(0).clip(lower=0)
+        bins = [-1] + [last for _, _, last in BUCKETS[:-1]] + [np.inf]
+        bucket = pd.cut(age, bins, labels=BUCKET_LABELS)
+        return self.items.assign(bucket=bucket)
+
+    def _table(self, aged, key, credit):
+        table = aged.pivot_table(index=key, columns="bucket", values="amount", aggfunc="sum",
+                                 fill_value=0, observed=False)
+        table = table.reindex(columns=BUCKET_LABELS, fill_value=0)
+        table = table.reindex(table.index.union(credit.index), fill_value=0).astype("int64")
+        table[DUE] = table[BUCKET_LABELS].sum(axis=1)
+        table[CREDIT] = credit.reindex(table.index, fill_value=0).astype("int64")
+        table[NET] = table[DUE] - table[CREDIT]
+        table.columns.name = None
+        return table.rename_axis(key).sort_index().reset_index()
+
+    def by_customer(self, as_of=None):
+        """Amount owed per customer in each age bucket, aged at ``as_of``
+        (default: the newest open charge's date). Only the ages move with
+        ``as_of``; the open amounts are those of the state's own date."""
+        return self._table(self._aged(as_of), "customer_name", self.credit)
+
+    def by_executive(self, as_of=None):
+        credit = self.credit.groupby(self.executives.reindex(self.credit.index).to_numpy()).sum()
+        return self._table(self._aged(as_of), "sales_executive", credit)
+
+
+def build(store, as_of=None):
+    """Receivables of everything in ``store`` (base table and journal), with
+    the approved customer merges applied; with ``as_of``, of the transactions
+    dated up to that day only."""
+    df, seq = store.snapshot(end=as_of)
+    return Receivables.from_frame(dedup.apply_frame(df, dedup.load_merges(dedup.map_path(store))), seq)
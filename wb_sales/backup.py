@@ -0,0 +1,212 @@
+"""Incremental backups: compressed base snapshots plus journal deltas.
+
+Layout under ``config.BACKUP_DIR`` (default: ``backups`` in the store folder)::
+
+    catalog.json                                          current base, last seq backed up
+    base-20250615T090000000000-0000001234.parquet         whole table (zstd), taken at that time
+    base-20250615T090000000000-0000001234.delta.jsonl.gz  entries saved after that base
+
+Saving a transaction only appends the new journal entries to the current
+base's delta (one small gzip member, fsynced), so a save costs the same
+however big the table is. A new base is due once ``BASE_INTERVAL`` has
+passed, or when the base table changed in a way the deltas cannot replay (a
+rewrite, or a compaction of entries not backed up yet). The save that notices
+(``base_due``) does not take it: the writer starts ``take_base`` on a thread
+of its own, which reads the table without holding the store lock, and
+``python -m wb_sales backup --full`` takes one on demand. Bases older than
+``RETAIN`` are deleted with their deltas, keeping the one that covers the
+start of the retention window.
+
+``restore(store, when)`` rebuilds the table as it was at ``when``: the last
+base taken at or before it plus the delta entries saved up to then.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import schema
+from .config import BACKUP_DIR
+from .journal import SEQ
+
+BASE_INTERVAL = timedelta(days=1)
+RETAIN = timedelta(days=30)
+
+# Backup time recorded with every delta entry
+AT = "_at"
+
+_STAMP = "%Y%m%dT%H%M%S%f"
+
+
+def _folder(store, backup_dir=None):
+    return Path(backup_dir or BACKUP_DIR or store.root / "backups")
+
+
+def _catalog(folder):
+    try:
+        with open(folder / "catalog.json", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _save_catalog(folder, catalog):
+    tmp_path = folder / "catalog.json.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, folder / "catalog.json")
+
+
+def _delta_path(folder, base):
+    return folder / f"{base}.delta.jsonl.gz"
+
+
+def bases(store, backup_dir=None):
+    """Every base snapshot of ``store``, oldest first: ``name``, ``time``,
+    ``seq``, ``path`` and ``delta`` (its delta file)."""
+    folder = _folder(store, backup_dir)
+    found = []
+    for path in sorted(folder.glob("base-*.parquet")):
+        _, stamp, seq = path.stem.split("-")
+        found.append({"name": path.stem, "time": datetime.strptime(stamp, _STAMP), "seq": int(seq),
+                      "path": path, "delta": _delta_path(folder, path.stem)})
+    return found
+
+
+def _base_time(name):
+    return datetime.strptime(name.split("-")[1], _STAMP)
+
+
+def _due(store, catalog, now):
+    return (catalog is None or store.base_seq() > catalog["seq"]
+            or now - _base_time(catalog["base"]) >= BASE_INTERVAL)
+
+
+def base_due(store, backup_dir=None, now=None):
+    """Whether ``store`` needs a new base snapshot (see the module docstring)."""
+    return _due(store, _catalog(_folder(store, backup_dir)), now or datetime.now())
+
+
+def take_base(store, backup_dir=None, now=None):
+    """Snapshot the whole table as a new base; returns its name.
+
+    The table is read and compressed without the store lock, so saves go on
+    meanwhile; the lock is only held to publish the base. Entries captured
+    into the previous base's delta while it was being written are carried
+    over into the new base's delta.
+    """
+    folder = _folder(store, backup_dir)
+    now = now or datetime.now()
+    folder.mkdir(parents=True, exist_ok=True)
+    df, seq = store.snapshot()
+    name = f"base-{now:{_STAMP}}-{seq:010d}"
+    tmp_path = folder / f"{name}.parquet.tmp"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path, compression="zstd")
+    with store.lock:
+        catalog = _catalog(folder)
+        carried = [] if catalog is None else [
+            entry for entry in read_delta(_delta_path(folder, catalog["base"])) if entry[SEQ] > seq
+        ]
+        if carried:
+            _append_delta(_delta_path(folder, name), carried)
+        os.replace(tmp_path, folder / f"{name}.parquet")
+        _save_catalog(folder, {"base": name, "seq": max([seq] + [entry[SEQ] for entry in carried])})
+    prune(store, folder, now)
+    return name
+
+
+def _append_delta(path, entries, now=None):
+    """Append ``entries`` stamped with backup time ``now`` (default: the
+    ``AT`` they already carry)."""
+    stamp = {} if now is None else {AT: now.isoformat()}
+    lines = "".join(json.dumps({**entry, **stamp}, ensure_ascii=False) + "\n"
+                    for entry in entries)
+    # One gzip member per capture; readers decompress the members in turn
+    with open(path, "ab") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="ab") as f:
+            f.write(lines.encode("utf-8"))
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def read_delta(path):
+    """Entries of a delta file (each with its ``AT`` backup time)."""
+    if not path.exists():
+        return []
+    entries = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                entries.append(json.loads(line))
+    except (EOFError, gzip.BadGzipFile, ValueError):
+        pass  # torn last member from a crash mid-append
+    return entries
+
+
+def capture(store, backup_dir=None, now=None, base=True):
+    """Back up whatever changed since the last capture: ``"base"`` when a new
+    base was taken, ``"delta"`` when entries were appended, else ``None``.
+
+    With ``base=False`` (the save path) a due base is left to the caller and
+    only entries that the current base's delta can still take are appended.
+    """
+    folder = _folder(store, backup_dir)
+    now = now or datetime.now()
+    with store.lock:
+        catalog = _catalog(folder)
+        if base and _due(store, catalog, now):
+            take_base(store, folder, now)
+            return "base"
+        if catalog is None or store.base_seq() > catalog["seq"]:
+            return None  # only a new base can cover what changed
+        entries = store.journal.read(after_seq=catalog["seq"])
+        if not entries:
+            return None
+        _append_delta(_delta_path(folder, catalog["base"]), entries, now)
+        _save_catalog(folder, {**catalog, "seq": entries[-1][SEQ]})
+    return "delta"
+
+
+def prune(store, backup_dir=None, now=None):
+    """Delete bases (and deltas) older than ``RETAIN``, except the newest of
+    them, which the restore points inside the window still need."""
+    cutoff = (now or datetime.now()) - RETAIN
+    old = [b for b in bases(store, backup_dir) if b["time"] < cutoff]
+    for base in old[:-1]:
+        base["path"].unlink()
+        base["delta"].unlink(missing_ok=True)
+    return len(old[:-1])
+
+
+def restore(store, when=None, backup_dir=None):
+    """Replace the table with its state at ``when`` (default: the latest
+    backup). The current table is backed up first, so a restore can itself
+    be undone. Returns the number of rows restored."""
+    folder = _folder(store, backup_dir)
+    when = None if when is None else pd.Timestamp(when).to_pydatetime()
+    candidates = [b for b in bases(store, folder) if when is None or b["time"] <= when]
+    if not candidates:
+        raise ValueError(f"no backup taken at or before {when}" if when else f"no backups in {folder}")
+    base = candidates[-1]
+    df = pd.read_parquet(base["path"])
+    seen, rows = set(), []
+    for entry in read_delta(base["delta"]):
+        if entry[SEQ] in seen or (when is not None and datetime.fromisoformat(entry[AT]) > when):
+            continue
+        seen.add(entry[SEQ])
+        rows.append({k: v for k, v in entry.items() if k not in (SEQ, AT)})
+    if rows:
+        df = schema.concat([df, schema.normalize(pd.DataFrame(rows))])
+    with store.lock:
+        take_base(store, folder)
+        store.write(df)
+        take_base(store, folder)
+    return len(df)
@@ -0,0 +1,114 @@
+"""Bulk transaction import from a CSV or Excel batch.
+
+The whole batch is checked and completed with vectorised column operations
+(no per-row Python), then committed with a single journal write, so a day's
+worth of deposits goes in as quickly as one row from the entry form.
+
+A batch uses the workbook's column names (``schema.ALIASES`` are accepted).
+``date``, ``customer_name``, ``customer_type`` and ``sales_executive`` are
+required; money columns may be blank (0). Blank cashback, commission and
+profit cells are computed from ``paid_amount`` (see ``commissions``); an
+optional ``cashback_eligible`` column (yes/no) switches cashback off per row.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from . import commissions, schema, writer
+
+REQUIRED = ["date", "customer_name", "customer_type", "sales_executive"]
+
+# Money the batch must supply (when given, the computed columns must be valid too)
+INPUT_MONEY = ["open_value", "sales_amount", "sales_return", "paid_amount"]
+
+ELIGIBLE = "cashback_eligible"
+
+_NO = {"no", "n", "false", "0", "none"}
+
+
+def read_batch(source, name=None):
+    """Read a ``.csv`` or Excel batch from a path or an uploaded file object."""
+    name = str(name or getattr(source, "name", source))
+    if Path(name).suffix.lower() == ".csv":
+        return pd.read_csv(source, dtype=str, keep_default_na=False, na_values=[""])
+    return pd.read_excel(source, dtype=object)
+
+
+def _problems(mask, column, problem):
+    rows = mask.index[mask.fillna(False).astype(bool)]
+    return pd.DataFrame({"row": rows, "column": [column] * len(rows), "problem": [problem] * len(rows)})
+
+
+def validate(batch):
+    """Clean ``batch`` (taka) and list what is wrong with it.
+
+    Returns ``(rows, errors)``: ``rows`` is the batch with standard column
+    names, trimmed names, parsed dates and numeric money; ``errors`` has one
+    line per bad cell, ``row`` being the line number in the file (header = 1).
+    """
+    rows = batch.rename(columns=lambda c: str(c).strip())
+    rows = rows.rename(columns={k: v for k, v in schema.ALIASES.items() if k in rows.columns})
+    rows = rows.dropna(how="all").copy()
+    rows.index = rows.index + 2  # spreadsheet line numbers
+    errors = []
+
+    missing = [c for c in REQUIRED if c not in rows]
+    if missing:
+        return rows, pd.DataFrame({"row": 1, "column": missing, "problem": "column missing"})
+
+    for col in REQUIRED[1:] + ["order_no"]:
+        if col in rows:
+            rows[col] = rows[col].astype("string").str.strip().replace("", pd.NA)
+
+    raw_dates = rows["date"]
+    rows["date"] = pd.to_datetime(raw_dates, errors="coerce")
+    errors.append(_problems(raw_dates.isna(), "date", "required"))
+    errors.append(_problems(raw_dates.notna() & rows["date"].isna(), "date", "not a date"))
+    for col in REQUIRED[1:]:
+        errors.append(_problems(rows[col].isna(), col, "required"))
+
+    for col in INPUT_MONEY + [commissions.CASHBACK] + commissions.COMMISSIONS:
+        if col not in rows:
+            continue
+        raw = rows[col]
+        if raw.dtype == object or pd.api.types.is_string_dtype(raw):
+            raw = raw.astype("string").str.replace(",", "").str.strip().replace("", pd.NA)
+        values = pd.to_numeric(raw, errors="coerce")
+        errors.append(_problems(raw.notna() & values.isna(), col, "not a number"))
+        errors.append(_problems(values < 0, col, "negative"))
+        rows[col] = values if col not in INPUT_MONEY else values.fillna(0)
+    for col in INPUT_MONEY:
+        if col not in rows:
+            rows[col] = 0.0
+
+    errors = pd.concat(errors, ignore_index=True)
+    return rows, errors.sort_values(["row", "column"], ignore_index=True)
+
+
+def prepare(rows, rules=None):
+    """Validated ``rows`` with cashback, commissions and profit filled in
+    from ``rules`` (default: the apps' rule table); columns the store does
+    not know are dropped."""
+    eligible = True
+    if ELIGIBLE in rows:
+        eligible = ~rows[ELIGIBLE].astype("string").str.strip().str.lower().isin(_NO)
+        rows = rows.drop(columns=ELIGIBLE)
+    rows = rows[[c for c in rows if c in schema.COLUMNS or c in schema.CATEGORIES]]
+    return commissions.fill(rows, eligible, rules)
+
+
+def import_batch(store, batch):
+    """Validate, complete and append ``batch`` (a frame in taka) to ``store``.
+
+    Nothing is written unless the whole batch is valid. Returns ``(added,
+    errors)``: the number of rows appended and the ``validate`` error table.
+    """
+    rows, errors = validate(batch)
+    if len(errors):
+        return 0, errors
+    rows = prepare(rows, commissions.load_rules(commissions.rules_path(store)))
+    records = rows.astype(object).where(rows.notna(), None).to_dict("records")
+    if records:
+        writer.save(store, records)
+    return len(records), errors
@@ -0,0 +1,74 @@
+"""Chart data: small, pre-aggregated frames to hand to Plotly.
+
+A figure embeds every point it is given, so charts are fed summaries whose
+size does not grow with the table: category charts keep the largest ``n``
+categories and fold the rest into one "Other" slice/bar, and long time series
+are downsampled with Largest-Triangle-Three-Buckets (LTTB), which keeps the
+peaks and dips that make the line's shape.
+"""
+
+import numpy as np
+import pandas as pd
+
+OTHER = "Other"
+
+# Default limits for figures in the dashboards
+TOP_N = 15
+MAX_POINTS = 500
+
+
+def top_n(df, names, values, n=TOP_N, other=OTHER):
+    """``values`` summed per ``names``, largest ``n`` first, the rest summed
+    into one ``other`` row. ``values`` is a column or a list of columns; rows
+    are ranked by the first one."""
+    values = [values] if isinstance(values, str) else list(values)
+    totals = df.groupby(names, observed=True)[values].sum()
+    totals.index = totals.index.astype("string")
+    totals = totals.sort_values(values[0], ascending=False)
+    if len(totals) > n + 1:
+        rest = totals.iloc[n:].sum().to_frame(other).T
+        totals = pd.concat([totals.iloc[:n], rest])
+    return totals.rename_axis(names).reset_index()
+
+
+def lttb(x, y, threshold=MAX_POINTS):
+    """Positions of the ``threshold`` points of ``(x, y)`` that LTTB keeps
+    (all of them when there are not more than ``threshold``). ``x`` must be
+    sorted; datetimes are fine."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").astype(np.int64)
+    x = x.astype(float)
+    y = np.asarray(y, dtype=float)
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    # First and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, size - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, size - 1
+    chosen = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else size
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        # Keep the point spanning the largest triangle with the previous
+        # choice and the next bucket's average
+        area = np.abs((x[chosen] - avg_x) * (y[lo:hi] - y[chosen])
+                      - (x[chosen] - x[lo:hi]) * (avg_y - y[chosen]))
+        chosen = lo + int(area.argmax())
+        keep[i + 1] = chosen
+    return keep
+
+
+def downsample(df, x, y, threshold=MAX_POINTS):
+    """Rows of ``df`` (sorted by ``x``) that LTTB keeps for the line ``y``."""
+    return df.iloc[lttb(df[x], df[y], threshold)]
+
+
+def daily(df, value, date="date", threshold=MAX_POINTS):
+    """``value`` summed per day, downsampled to at most ``threshold`` points."""
+    series = df.groupby(date)[value].sum().reset_index()
+    return downsample(series, date, value, threshold)
@@ -0,0 +1,208 @@
+"""Cashback, commissions and company profit derived from the paid amount.
+
+Rates come from a rule table (``rules_path(store)``, a CSV the accounts team
+can edit; ``DEFAULT_RULES`` when it does not exist). Each rule has:
+
+* ``customer_type`` and ``sales_executive``: who it applies to (blank = anyone)
+* ``valid_from`` / ``valid_to``: the dates it applies to, inclusive (blank = open)
+* one rate per column in ``RATE_COLUMNS``, as a share of ``paid_amount``;
+  a blank rate keeps whatever a less specific rule says
+
+When several rules match a transaction the most specific one wins (an
+executive beats a customer type, which beats a catch-all), then the one that
+started latest, then the one further down the table. Rates are looked up for
+a whole frame at once (one vectorised mask per rule), so recomputing a year
+of history is a single call to ``recompute``.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import schema
+from .config import DATA_DIR, RULES_PATH
+from .dateindex import date_bounds
+
+CASHBACK = "customer_cashback_on_paid_amount"
+
+# Derived per-row amounts, each a share of paid_amount
+RATE_COLUMNS = [
+    CASHBACK,
+    "sales_ex_commission",
+    "zonal_officer_commission",
+    "gm_commission",
+    "company_profit",
+    "customer_commission",
+]
+
+# Stored columns ``recompute`` rewrites by default. Cashback depends on
+# per-transaction eligibility, which the table does not record, so it is left alone.
+COMMISSIONS = ["sales_ex_commission", "zonal_officer_commission", "gm_commission", "company_profit"]
+
+SCOPE = ["customer_type", "sales_executive"]
+VALIDITY = ["valid_from", "valid_to"]
+
+# The rates main.py's entry form has always used
+DEFAULT_RULES = pd.DataFrame([{
+    "customer_type": None,
+    "sales_executive": None,
+    "valid_from": None,
+    "valid_to": None,
+    CASHBACK: 0.02,
+    "sales_ex_commission": 0.01,
+    "zonal_officer_commission": 0.003,
+    "gm_commission": 0.002,
+    "company_profit": 0.05,
+    "customer_commission": 0.02,
+}])
+
+
+def _clean(rules):
+    rules = rules.reindex(columns=SCOPE + VALIDITY + RATE_COLUMNS).copy()
+    for col in SCOPE:
+        rules[col] = rules[col].astype("string").str.strip().replace("", pd.NA)
+    for col in VALIDITY:
+        rules[col] = pd.to_datetime(rules[col], errors="coerce")
+    rules[RATE_COLUMNS] = rules[RATE_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    # Least specific first, so later (more specific) rules overwrite them
+    rules["_priority"] = rules["sales_executive"].notna() * 2 + rules["customer_type"].notna()
+    return rules.reset_index(drop=True).sort_values(["_priority", "valid_from"], kind="stable", na_position="first")
+
+
+# (path, mtime) -> parsed table, so callers can load the rules on every rerun
+_loaded = {}
+
+
+def rules_path(store=None):
+    """The rule table of ``store`` (default: the apps' store):
+    ``config.RULES_PATH`` when set, else ``commission_rules.csv`` in the
+    store folder."""
+    root = DATA_DIR if store is None else store.root
+    return Path(RULES_PATH or Path(root) / "commission_rules.csv")
+
+
+def load_rules(path=None):
+    """The rule table from ``path`` (default ``rules_path()``), or
+    ``DEFAULT_RULES`` when the file does not exist."""
+    path = Path(path or rules_path())
+    try:
+        key = (path, path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        key = (path, None)
+    if key not in _loaded:
+        source = DEFAULT_RULES if key[1] is None else pd.read_csv(path, dtype=str, keep_default_na=False)
+        _loaded.clear()
+        _loaded[key] = _clean(source)
+    return _loaded[key]
+
+
+def save_rules(rules, path=None):
+    path = Path(path or rules_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rules = rules.reindex(columns=SCOPE + VALIDITY + RATE_COLUMNS)
+    rules.to_csv(path, index=False, date_format="%Y-%m-%d")
+    return path
+
+
+def _matcher(values):
+    """A function name -> boolean array telling which ``values`` equal the name
+    (ignoring surrounding spaces); compares each distinct value only once."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), pd.Index(values.cat.categories)
+    else:
+        codes, uniques = pd.factorize(values)
+    uniques = pd.Index(uniques).astype("string").str.strip()
+
+    def match(name):
+        # code -1 (blank) picks the trailing False
+        return np.append((uniques == name).to_numpy(dtype=bool, na_value=False), False)[codes]
+    return match
+
+
+def rates(df, rules=None):
+    """Rate of every ``RATE_COLUMNS`` entry for each row of ``df`` (same index).
+
+    Rows no rule matches get 0.
+    """
+    rules = load_rules() if rules is None else rules
+    if "_priority" not in rules:
+        rules = _clean(rules)
+    out = np.zeros((len(df), len(RATE_COLUMNS)))
+    matchers = {col: _matcher(df[col]) for col in SCOPE if col in df}
+    dates = pd.to_datetime(df[schema.DATE], errors="coerce") if schema.DATE in df else None
+    for rule in rules.to_dict("records"):
+        mask = np.ones(len(df), dtype=bool)
+        for col in SCOPE:
+            if pd.notna(rule[col]):
+                mask &= matchers[col](rule[col]) if col in matchers else False
+        if dates is not None:
+            if pd.notna(rule["valid_from"]):
+                mask &= (dates >= rule["valid_from"]).to_numpy()
+            if pd.notna(rule["valid_to"]):
+                mask &= (dates < rule["valid_to"] + pd.Timedelta(days=1)).to_numpy()
+        for j, col in enumerate(RATE_COLUMNS):
+            if pd.notna(rule[col]):
+                out[mask, j] = rule[col]
+    return pd.DataFrame(out, index=df.index, columns=RATE_COLUMNS)
+
+
+def compute(df, columns=RATE_COLUMNS, rules=None, unit="taka"):
+    """The amounts in ``columns`` for every row of ``df``: ``paid_amount``
+    times the matching rate. ``unit`` is what ``paid_amount`` holds; taka
+    amounts are rounded to 2 decimals, paisa to whole paisa."""
+    paid = pd.to_numeric(df["paid_amount"], errors="coerce").fillna(0)
+    amounts = rates(df, rules)[list(columns)].mul(paid, axis=0)
+    if unit == "paisa":
+        return amounts.round().astype("int64")
+    return amounts.round(2)
+
+
+def fill(df, cashback_eligible=True, rules=None):
+    """``df`` (taka) with blank cashback/commission/profit cells computed,
+    in one pass over the whole frame. Values already present are kept, like
+    an override in the entry form.
+
+    ``cashback_eligible`` is a bool or a per-row boolean Series; ineligible
+    rows get no cashback.
+    """
+    df = df.copy()
+    eligible = pd.Series(cashback_eligible, index=df.index).astype(bool)
+    computed = compute(df, [CASHBACK] + COMMISSIONS, rules)
+    computed[CASHBACK] = computed[CASHBACK].where(eligible, 0.0)
+    for col in computed:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(computed[col])
+        else:
+            df[col] = computed[col]
+    return df
+
+
+def recompute(df, columns=COMMISSIONS, rules=None, unit="paisa"):
+    """``df`` with ``columns`` recalculated from the rules for every row, e.g.
+    after a rate change that applies to past transactions."""
+    return df.assign(**compute(df, columns, rules, unit))
+
+
+def recompute_store(store, start=None, end=None, columns=COMMISSIONS, rules=None, dry_run=False):
+    """Recalculate ``columns`` for the stored transactions dated
+    ``start``..``end`` (all when open) and save the table, unless ``dry_run``.
+
+    Returns ``(before, after, changed)``: column totals (paisa) of the range
+    before and after, and how many rows changed. ``rules`` defaults to the
+    store's rule table.
+    """
+    rules = load_rules(rules_path(store)) if rules is None else rules
+    # Held throughout, so rows saved meanwhile are not lost by the rewrite
+    with store.lock:
+        df = store.read()
+        lo, hi = date_bounds(df, start, end)
+        part = df.iloc[lo:hi]
+        new = recompute(part, columns, rules)
+        before, after = part[list(columns)].sum(), new[list(columns)].sum()
+        changed = int((new[list(columns)] != part[list(columns)]).any(axis=1).sum())
+        if changed and not dry_run:
+            for col in columns:
+                df.iloc[lo:hi, df.columns.get_loc(col)] = new[col].to_numpy()
+            store.write(df)
+    return before, after, changed
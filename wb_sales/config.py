@@ -0,0 +1,35 @@
+"""Where the apps keep their data.
+
+Both locations can be overridden with environment variables so the same code
+runs on the office PC and on a server.
+"""
+
+import os
+from pathlib import Path
+
+# Columnar transaction store used by every dashboard
+DATA_DIR = Path(os.environ.get("WB_SALES_DATA", Path(__file__).resolve().parent.parent / "data"))
+
+# Workbook the accounts team maintains by hand; only used for import/export
+WORKBOOK_PATH = os.environ.get(
+    "WB_SALES_WORKBOOK",
+    r"C:\Users\User\Desktop\Accounts\2025\JUNE\sales_deposit_return\june_sales_data.xlsx",
+)
+
+# Per-section timings recorded in profiling mode (JSON lines, appended)
+PROFILE_LOG = Path(os.environ.get("WB_SALES_PROFILE_LOG", Path(__file__).resolve().parent.parent / "logs" / "profile.jsonl"))
+
+# Commission / cashback / profit rates (see wb_sales.commissions); unset:
+# "commission_rules.csv" in the store folder
+RULES_PATH = os.environ.get("WB_SALES_RULES")
+
+# Reviewed customer-name merges (see wb_sales.dedup); unset:
+# "customer_merges.csv" in the store folder
+MERGES_PATH = os.environ.get("WB_SALES_MERGES")
+
+# Incremental backups (see wb_sales.backup); unset: "backups" in the store folder
+BACKUP_DIR = os.environ.get("WB_SALES_BACKUPS")
+
+# "sqlite" answers filtered queries from an indexed SQLite mirror of the store
+# (see wb_sales.sqlbackend); "parquet" filters the cached table in pandas
+BACKEND = os.environ.get("WB_SALES_BACKEND", "parquet").lower()
@@ -0,0 +1,116 @@
+"""Daily cube: money totals per day × executive × customer × customer type.
+
+Most KPIs are sums of a few money columns over a date range, optionally for
+one executive, customer or customer type. The cube holds those sums once per
+(day, executive, customer, customer type) cell, kept in date order, so a
+date range is a contiguous block of cells (``dateindex.date_slice``) and a
+roll-up reads a few thousand cells instead of every transaction:
+
+    cube.query(None, start, end)                         # Series of totals
+    cube.query("sales_executive", start, end)            # one row per executive
+    cube.query("customer_type", customer_type=["Dealer", "Retail Shop"])
+
+Like the running totals it is built once and caught up from the journal
+(``add``); only the cells from the earliest new date onwards are regrouped.
+Rows without a date or name keep their own cells, so unfiltered totals match
+a sum over the raw rows. Customer filters and per-customer roll-ups apply
+the reviewed merge map (``dedup``).
+"""
+
+import pandas as pd
+
+from . import dedup, schema
+from .aggregates import COUNT, OUTSTANDING, TOTAL_COLUMNS
+from .dateindex import date_bounds, date_slice
+
+DIMENSIONS = ["sales_executive", "customer_name", "customer_type"]
+
+
+def _cells(df, dimensions, measures):
+    """``df``'s rows summed per day and ``dimensions`` value, in date order."""
+    if measures is None:
+        values = df[schema.MONEY_COLUMNS].copy()
+        values[OUTSTANDING] = schema.outstanding(df)
+    else:
+        values = df[measures].copy()
+    values[COUNT] = 1
+    keys = [df[schema.DATE].dt.normalize()] + [df[d] for d in dimensions]
+    cells = values.groupby(keys, observed=True, dropna=False).sum().reset_index()
+    # Plain string keys, so cells from frames with different category
+    # dictionaries still line up
+    for d in dimensions:
+        cells[d] = cells[d].astype("string")
+    return cells
+
+
+class Cube:
+    """Cells of ``measures`` summed per day and ``dimensions`` value; ``seq``
+    is the last journal entry included."""
+
+    def __init__(self, cells, dimensions=DIMENSIONS, measures=None, seq=0):
+        self.cells = cells
+        self.dimensions = list(dimensions)
+        self.measures = measures
+        self.seq = seq
+
+    @classmethod
+    def from_frame(cls, df, dimensions=DIMENSIONS, measures=None, seq=0):
+        """Cube of ``df``. ``measures`` defaults to the store's money columns
+        plus outstanding (``aggregates.TOTAL_COLUMNS``); a row count is
+        always kept."""
+        return cls(_cells(df, dimensions, measures), dimensions, measures, seq)
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def columns(self):
+        return TOTAL_COLUMNS if self.measures is None else self.measures + [COUNT]
+
+    def add(self, rows, seq=None):
+        """Fold newly appended transactions (a frame or list of dicts) into the cube."""
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame([rows] if isinstance(rows, dict) else rows)
+        part = _cells(schema.normalize(rows), self.dimensions, self.measures)
+        if len(part):
+            first = part[schema.DATE].min()
+            # Cells dated before the new rows are unchanged
+            lo = date_bounds(self.cells, first)[0] if pd.notna(first) else date_bounds(self.cells)[1]
+            tail = pd.concat([self.cells.iloc[lo:], part], ignore_index=True)
+            keys = [schema.DATE] + self.dimensions
+            tail = tail.groupby(keys, dropna=False).sum().reset_index()
+            self.cells = pd.concat([self.cells.iloc[:lo], tail], ignore_index=True)
+        if seq is not None:
+            self.seq = seq
+        return self
+
+    def query(self, by=None, start=None, end=None, **filters):
+        """Totals of the cells dated ``start``..``end`` (inclusive) whose
+        dimensions match ``filters`` (``dimension=value`` or a list of
+        values; ``None`` matches everything).
+
+        Returns a Series of ``columns``, or with ``by`` (a dimension, list of
+        dimensions, or ``"date"`` for daily totals) a frame with one row per
+        group; groups without a name are left out, as in the running totals.
+        """
+        cells = date_slice(self.cells, start, end)
+        for dimension, value in filters.items():
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) or not pd.api.types.is_list_like(value) else list(value)
+            if dimension == dedup.CUSTOMER:
+                values = dedup.variants(values)
+            cells = cells[cells[dimension].isin(values)]
+        if by is None:
+            return cells[self.columns].sum()
+        keys = [by] if isinstance(by, str) else list(by)
+        table = cells.groupby(keys)[self.columns].sum()
+        if dedup.CUSTOMER in keys:
+            table = dedup.merge_totals(table)
+        return table.sort_index().reset_index()
+
+
+def build(store):
+    """The cube of everything in ``store`` (base table and journal)."""
+    df, seq = store.snapshot([schema.DATE] + DIMENSIONS + schema.MONEY_COLUMNS)
+    return Cube.from_frame(df, seq=seq)
@@ -0,0 +1,60 @@
+"""Date-range slicing over a table kept sorted by date.
+
+``TransactionStore.read`` returns rows in date order, so a date range is a
+contiguous block that two binary searches can find. The slice is a view of the
+loaded table rather than a boolean-mask copy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .schema import DATE
+
+
+def sort_by_date(df):
+    """``df`` in date order (stable, so same-day rows keep their entry order)."""
+    if df[DATE].is_monotonic_increasing:
+        return df
+    return df.sort_values(DATE, kind="stable", na_position="last", ignore_index=True)
+
+
+def date_bounds(df, start=None, end=None):
+    """Row positions ``(lo, hi)`` of the rows dated ``start``..``end``, both
+    days inclusive. ``None`` leaves that side of the range open."""
+    dates = df[DATE].to_numpy()
+    lo = 0
+    hi = int(np.searchsorted(dates, np.datetime64("NaT"), side="left"))
+    if start is not None:
+        lo = int(np.searchsorted(dates[:hi], pd.Timestamp(start).to_datetime64(), side="left"))
+    if end is not None:
+        next_day = (pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).to_datetime64()
+        hi = int(np.searchsorted(dates[:hi], next_day, side="left"))
+    return lo, max(lo, hi)
+
+
+def date_slice(df, start=None, end=None):
+    """Rows of a date-sorted ``df`` dated ``start``..``end`` (inclusive)."""
+    lo, hi = date_bounds(df, start, end)
+    return df.iloc[lo:hi]
+
+
+def picker_range(picked):
+    """``(start, end)`` of a Streamlit range ``date_input`` value, which holds
+    one date while the user is still choosing the end of the range."""
+    picked = list(picked) if isinstance(picked, (list, tuple)) else [picked]
+    start = picked[0] if picked else None
+    end = picked[1] if len(picked) > 1 else start
+    return start, end
+
+
+def picker_slice(df, picked):
+    """``date_slice`` for the value of a Streamlit range ``date_input``."""
+    return date_slice(df, *picker_range(picked))
+
+
+def date_extent(df):
+    """First and last date of a date-sorted ``df`` (NaT when it has no dates)."""
+    lo, hi = date_bounds(df)
+    if hi == lo:
+        return pd.NaT, pd.NaT
+    return df[DATE].iloc[lo], df[DATE].iloc[hi - 1]
@@ -0,0 +1,255 @@
+"""Near-duplicate customer names and the merge map that folds them together.
+
+"Al- Madina Crockeries" and "Al- Madina Crockerise" are one shop typed two
+ways, but every per-customer figure (ledger, totals, aging) treats them as
+two. ``find_duplicates`` proposes merges without comparing every pair of
+names:
+
+1. blocking: names are reduced to a key (``nameindex.normalize`` without
+   bracketed notes such as "(2024)") and sorted, once by the key and once by
+   the key reversed; only names within ``WINDOW`` places of each other in
+   either order are compared (typos rarely hit both ends of a name)
+2. scoring: each key's 3-grams are hashed into a 512-bit signature, and a
+   pair's score is the Jaccard overlap of the signatures, computed for all
+   pairs at once
+3. pairs scoring at least ``THRESHOLD`` (and with the same numbers in them:
+   "Store 2" is not a typo of "Store 3") are joined into groups; each group
+   merges into the name with the most transactions
+
+The proposals go to ``map_path(store)``, a CSV for the accounts team to
+review: only rows marked ``approved`` are applied (exact key matches, which
+differ only in case, spacing or punctuation, are approved up front).
+``loader.load``, the running totals and the receivables apply the map when
+they read customer names, so the stored transactions are never rewritten
+and a merge can be undone by un-approving it.
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_DIR, MERGES_PATH
+from .nameindex import normalize
+
+THRESHOLD = 0.7
+WINDOW = 8
+
+CUSTOMER = "customer_name"
+TARGET = "merge_into"
+SCORE = "score"
+APPROVED = "approved"
+COLUMNS = [CUSTOMER, TARGET, SCORE, APPROVED]
+
+_BITS = 512
+_NOTES = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_DIGITS = re.compile(r"\D+")
+_SYMBOLS = " 0123456789abcdefghijklmnopqrstuvwxyz"
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+_YES = {"1", "true", "yes", "y", "x"}
+
+
+def key(name):
+    """Blocking/scoring key of a name: normalized, bracketed notes dropped."""
+    return normalize(_NOTES.sub(" ", str(name)))
+
+
+def _signatures(keys):
+    """One ``_BITS``-bit set of hashed 3-grams per key (padded with spaces)."""
+    width = max((len(k) for k in keys), default=0) + 2
+    padded = np.array([f" {k} ".ljust(width) for k in keys], dtype=f"<U{width}")
+    chars = padded.view(np.uint32).reshape(len(keys), width) if len(keys) else np.zeros((0, width), np.uint32)
+    table = np.zeros(128, dtype=np.int64)
+    table[[ord(c) for c in _SYMBOLS]] = np.arange(len(_SYMBOLS))
+    codes = table[np.minimum(chars, 127)]
+    grams = codes[:, :-2] * len(_SYMBOLS) ** 2 + codes[:, 1:-1] * len(_SYMBOLS) + codes[:, 2:]
+    lengths = np.array([len(k) + 2 for k in keys], dtype=np.int64)
+    valid = np.arange(width - 2) < (lengths - 2)[:, None]
+    rows, cols = np.nonzero(valid)
+    bits = (grams[rows, cols] * 2654435761 % (1 << 32)) % _BITS
+    sig = np.zeros((len(keys), _BITS // 8), dtype=np.uint8)
+    np.bitwise_or.at(sig, (rows, bits // 8), (1 << (bits % 8)).astype(np.uint8))
+    return sig
+
+
+def _jaccard(sig, left, right):
+    both = _POPCOUNT[sig[left] & sig[right]].sum(axis=1)
+    either = _POPCOUNT[sig[left] | sig[right]].sum(axis=1)
+    return both / np.maximum(either, 1)
+
+
+def _pairs(keys, sig, window, threshold):
+    """``(left, right, score)`` of the blocked pairs scoring ``threshold`` or
+    more whose keys have the same digits."""
+    digits = np.array([_DIGITS.sub("", k) for k in keys], dtype=object)
+    found = []
+    for order in (np.argsort(keys, kind="stable"), np.argsort([k[::-1] for k in keys], kind="stable")):
+        for step in range(1, window + 1):
+            left, right = order[:-step], order[step:]
+            score = _jaccard(sig, left, right)
+            keep = (score >= threshold) & (digits[left] == digits[right])
+            found.append((left[keep], right[keep], score[keep]))
+    left, right, score = (np.concatenate(parts) for parts in zip(*found))
+    return np.minimum(left, right), np.maximum(left, right), score
+
+
+def _groups(size, left, right):
+    """Group number of each of ``size`` items, joining every ``left``/``right`` pair."""
+    parent = np.arange(size)
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b in zip(left, right):
+        ra, rb = root(a), root(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    return np.array([root(i) for i in range(size)])
+
+
+def find_duplicates(names, counts=None, threshold=THRESHOLD, window=WINDOW):
+    """Proposed merge map (``COLUMNS``) for the distinct ``names``: one row
+    per name that should merge into another. ``counts`` (name -> number of
+    transactions) picks which name of a group is kept."""
+    names = pd.Index(pd.Series(names, dtype="string").dropna().unique())
+    if len(names) < 2:
+        return pd.DataFrame(columns=COLUMNS)
+    keys = np.array([key(name) for name in names], dtype=object)
+    sig = _signatures(list(keys))
+    left, right, _ = _pairs(keys, sig, window, threshold)
+    group = _groups(len(names), left, right)
+
+    counts = pd.Series(counts, dtype="float64") if counts is not None else pd.Series(dtype="float64")
+    table = pd.DataFrame({
+        CUSTOMER: names,
+        "_group": group,
+        "_count": counts.reindex(names).fillna(0).to_numpy(),
+        "_key": keys,
+    })
+    table = table[table.groupby("_group")["_group"].transform("size") > 1]
+    # Keep the busiest name of each group (then the shortest, then A-Z)
+    table = table.assign(_length=table[CUSTOMER].str.len())
+    table = table.sort_values(["_group", "_count", "_length", CUSTOMER], ascending=[True, False, True, True])
+    kept = table.groupby("_group").head(1).set_index("_group")
+    table[TARGET] = kept[CUSTOMER].reindex(table["_group"]).to_numpy()
+    table = table[table[CUSTOMER] != table[TARGET]]
+    target_key = kept["_key"].reindex(table["_group"]).to_numpy()
+
+    positions = names.get_indexer(table[CUSTOMER]), names.get_indexer(table[TARGET])
+    table[SCORE] = _jaccard(sig, *positions).round(3)
+    table[APPROVED] = table["_key"].to_numpy() == target_key
+    return table[COLUMNS].sort_values([TARGET, CUSTOMER]).reset_index(drop=True)
+
+
+def update_map(proposed, existing):
+    """``proposed`` with the review decisions already in ``existing`` kept
+    (and the rows of ``existing`` it no longer proposes)."""
+    if existing is None or existing.empty:
+        return proposed
+    existing = existing.reindex(columns=COLUMNS)
+    new = proposed[~proposed[CUSTOMER].isin(existing[CUSTOMER])]
+    return pd.concat([existing, new], ignore_index=True).sort_values([TARGET, CUSTOMER]).reset_index(drop=True)
+
+
+# (path, mtime) -> approved merges, so readers can check the map on every load
+_loaded = {}
+
+
+def map_path(store=None):
+    """The merge map of ``store`` (default: the apps' store):
+    ``config.MERGES_PATH`` when set, else ``customer_merges.csv`` in the
+    store folder."""
+    root = DATA_DIR if store is None else store.root
+    return Path(MERGES_PATH or Path(root) / "customer_merges.csv")
+
+
+def read_map(path=None):
+    """The merge map CSV at ``path`` (default ``map_path()``), or ``None``
+    when it does not exist."""
+    path = Path(path or map_path())
+    if not path.exists():
+        return None
+    return pd.read_csv(path, dtype=str, keep_default_na=False).reindex(columns=COLUMNS)
+
+
+def save_map(table, path=None):
+    path = Path(path or map_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table.reindex(columns=COLUMNS).to_csv(path, index=False)
+    return path
+
+
+def load_merges(path=None):
+    """Approved merges of the map at ``path`` as ``{name: kept name}``,
+    following chains (A -> B, B -> C gives A -> C)."""
+    path = Path(path or map_path())
+    try:
+        stamp = (path, path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return {}
+    if stamp not in _loaded:
+        table = read_map(path)
+        approved = table[table[APPROVED].astype(str).str.strip().str.lower().isin(_YES)]
+        merges = {}
+        for name, target in zip(approved[CUSTOMER].str.strip(), approved[TARGET].str.strip()):
+            if name and target and name != target:
+                merges[name] = target
+        for name in list(merges):
+            seen = {name}
+            while merges[name] in merges and merges[name] not in seen:
+                seen.add(merges[name])
+                merges[name] = merges[merges[name]]
+        _loaded.clear()
+        _loaded[stamp] = merges
+    return _loaded[stamp]
+
+
+def variants(names, merges=None):
+    """``names`` plus every name merged into one of them."""
+    merges = load_merges() if merges is None else merges
+    names = list(names)
+    wanted = set(names)
+    return names + [name for name, target in merges.items() if target in wanted]
+
+
+def apply(values, merges=None):
+    """Customer names ``values`` with the merges applied (same dtype kind:
+    categoricals stay categorical and are recoded, not rewritten row by row)."""
+    merges = load_merges() if merges is None else merges
+    if not merges:
+        return values
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = pd.Index(values.cat.categories)
+        if not categories.isin(list(merges)).any():
+            return values
+        codes, kept = pd.factorize(categories.map(lambda name: merges.get(name, name)))
+        old = values.cat.codes.to_numpy()
+        new = np.where(old >= 0, codes[old], -1)
+        return pd.Series(pd.Categorical.from_codes(new, kept), index=values.index, name=values.name)
+    return values.replace(merges)
+
+
+def apply_frame(df, merges=None, column=CUSTOMER):
+    """``df`` with merged names in ``column`` (``df`` itself when nothing changes)."""
+    if column not in df:
+        return df
+    merged = apply(df[column], merges)
+    if merged is df[column]:
+        return df
+    return df.assign(**{column: merged})
+
+
+def merge_totals(table, level=CUSTOMER, merges=None):
+    """Totals indexed by customer name (possibly among other levels) with
+    merged names summed together."""
+    merges = load_merges() if merges is None else merges
+    names = table.index.get_level_values(level)
+    if not merges or not names.isin(list(merges)).any():
+        return table
+    keys = [names.map(lambda name: merges.get(name, name)) if n == level else table.index.get_level_values(n)
+            for n in table.index.names]
+    return table.groupby(keys).sum().rename_axis(table.index.names)
@@ -0,0 +1,124 @@
+"""Excel, CSV and Parquet exports, streamed in chunks.
+
+The dashboards hand ``export`` to ``st.download_button`` as a callable, so a
+file is only written when someone clicks. Every writer walks the table in
+slices of ``CHUNK_ROWS`` rows, converting money from paisa to taka one slice
+at a time, and streams them out:
+
+* Excel through xlsxwriter's constant-memory mode, which flushes each row as
+  it is written instead of building the whole sheet in memory
+* CSV appended slice by slice (UTF-8 with a byte order mark, so Excel shows
+  Bengali names correctly)
+* Parquet as one row group per slice
+
+Files are assembled in a spooled temporary file, kept in memory while small
+and moved to disk once they pass ``SPOOL_BYTES``. An Excel sheet holds at
+most ``EXCEL_MAX_ROWS`` rows; larger tables are only offered as CSV and
+Parquet (``formats``).
+"""
+
+import io
+import tempfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import schema
+
+CHUNK_ROWS = 50_000
+
+# One row of an Excel sheet is the header
+EXCEL_MAX_ROWS = 1_048_575
+
+SPOOL_BYTES = 32 * 2**20
+
+# Format -> (label, MIME type)
+FORMATS = {
+    "xlsx": ("Excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": ("CSV", "text/csv"),
+    "parquet": ("Parquet", "application/vnd.apache.parquet"),
+}
+
+
+def formats(rows):
+    """Formats a table of ``rows`` rows can be exported as."""
+    return [f for f in FORMATS if f != "xlsx" or rows <= EXCEL_MAX_ROWS]
+
+
+def _chunks(df, paisa):
+    """``df`` in slices of ``CHUNK_ROWS`` (at least one, for the header),
+    money in taka when ``paisa`` says it holds paisa."""
+    for start in range(0, max(len(df), 1), CHUNK_ROWS):
+        part = df.iloc[start:start + CHUNK_ROWS]
+        yield schema.to_taka(part) if paisa else part
+
+
+def write_xlsx(sheets, target, paisa=True):
+    """Write ``sheets`` (name -> frame) as one workbook to a path or binary file."""
+    import xlsxwriter  # only loaded when a workbook is written
+
+    workbook = xlsxwriter.Workbook(target, {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd",
+        "nan_inf_to_errors": True,
+    })
+    try:
+        for name, df in sheets.items():
+            sheet = workbook.add_worksheet(str(name)[:31])
+            sheet.write_row(0, 0, [str(c) for c in df.columns])
+            row = 1
+            for part in _chunks(df, paisa):
+                # Missing values of any dtype (NaN, NaT, <NA>) as empty cells
+                part = part.astype(object).where(part.notna(), None)
+                for values in part.itertuples(index=False, name=None):
+                    sheet.write_row(row, 0, values)
+                    row += 1
+    finally:
+        workbook.close()
+    return target
+
+
+def write_csv(df, target, paisa=True):
+    """Write ``df`` as CSV to a path or binary file."""
+    if not hasattr(target, "write"):
+        with open(target, "wb") as f:
+            write_csv(df, f, paisa)
+        return target
+    text = io.TextIOWrapper(target, encoding="utf-8-sig", newline="")
+    try:
+        for i, part in enumerate(_chunks(df, paisa)):
+            part.to_csv(text, header=i == 0, index=False)
+    finally:
+        text.flush()
+        text.detach()  # leave ``target`` open for the caller
+    return target
+
+
+def write_parquet(df, target, paisa=True):
+    """Write ``df`` as Parquet (zstd) to a path or binary file."""
+    writer = None
+    try:
+        for part in _chunks(df, paisa):
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(target, table.schema, compression="zstd")
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    return target
+
+
+def export(df, fmt, paisa=True, sheet="Transactions"):
+    """``df`` as a file in format ``fmt`` (a key of ``FORMATS``), as bytes."""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as f:
+        if fmt == "xlsx":
+            write_xlsx({sheet: df}, f, paisa)
+        elif fmt == "csv":
+            write_csv(df, f, paisa)
+        elif fmt == "parquet":
+            write_parquet(df, f, paisa)
+        else:
+            raise ValueError(f"unknown export format {fmt!r}")
+        f.seek(0)
+        return f.read()
@@ -0,0 +1,77 @@
+"""Server-side filtering, sorting and paging for large transaction tables.
+
+The browser only ever receives one page. Filtering matches the search text
+against each category's dictionary once (not every row), and sorting only
+orders the rows up to the requested page (``np.partition``), so showing
+page 1 of a million rows sorted by amount does not sort the whole table.
+"""
+
+import numpy as np
+import pandas as pd
+
+PAGE_SIZE = 50
+
+
+def search(df, text):
+    """Rows where any text column contains ``text`` (case-insensitive)."""
+    text = (text or "").strip()
+    if not text:
+        return df
+    hit = np.zeros(len(df), dtype=bool)
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            names = pd.Index(values.cat.categories).astype("string")
+            matched = names.str.contains(text, case=False, regex=False).to_numpy(dtype=bool, na_value=False)
+            codes = values.cat.codes.to_numpy()
+            hit |= np.append(matched, False)[codes]
+        elif pd.api.types.is_string_dtype(values) or values.dtype == object:
+            found = values.astype("string").str.contains(text, case=False, regex=False)
+            hit |= found.to_numpy(dtype=bool, na_value=False)
+    return df[hit]
+
+
+def _order(values, stop, ascending):
+    """Positions of the first ``stop`` rows of ``values`` in sort order (NaN last)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Sort by name, not by code
+        ranks = pd.Index(values.cat.categories).astype("string").argsort().argsort()
+        keys = np.append(ranks, len(ranks))[values.cat.codes.to_numpy()].astype(float)
+        keys[values.cat.codes.to_numpy() < 0] = np.nan
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        keys = values.to_numpy().astype("datetime64[ns]").astype(np.int64).astype(float)
+        keys[values.isna().to_numpy()] = np.nan
+    elif pd.api.types.is_numeric_dtype(values):
+        keys = values.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        keys = pd.factorize(values, sort=True)[0].astype(float)
+        keys[keys < 0] = np.nan
+    if not ascending:
+        keys = -keys
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    if stop < len(keys):
+        # Everything below the stop-th key, then the earliest rows equal to it
+        kth = np.partition(keys, stop - 1)[stop - 1]
+        below = np.flatnonzero(keys < kth)
+        part = np.concatenate([below, np.flatnonzero(keys == kth)[:stop - len(below)]])
+        return part[np.lexsort((part, keys[part]))]
+    return np.lexsort((np.arange(len(keys)), keys))
+
+
+def page(df, number=1, size=PAGE_SIZE, sort_by=None, ascending=True, text=None):
+    """``(rows, total)``: page ``number`` (from 1) of ``df`` after the
+    ``text`` search and sorting by ``sort_by``, and how many rows matched."""
+    matched = search(df, text)
+    total = len(matched)
+    start = (max(number, 1) - 1) * size
+    stop = min(start + size, total)
+    if start >= total:
+        return matched.iloc[0:0], total
+    if sort_by is None:
+        return matched.iloc[start:stop], total
+    order = _order(matched[sort_by], stop, ascending)
+    return matched.iloc[order[start:stop]], total
+
+
+def page_count(total, size=PAGE_SIZE):
+    return max(1, -(-total // size))
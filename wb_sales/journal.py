@@ -0,0 +1,128 @@
+"""Append-only journal of new transactions.
+
+Each saved transaction becomes one JSON line with a sequence number. Appending
+never touches the existing data, so saving a row costs the same no matter how
+big the table is. ``TransactionStore.compact`` later folds the journal into the
+Parquet base table.
+
+A crash in the middle of an append can leave a partial last line. It was
+never acknowledged, so the next ``append`` cuts it off before writing (the
+caller holds the store lock); lines that still cannot be parsed are skipped
+by ``read``, counted in ``skipped`` and logged.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+SEQ = "_seq"
+
+# Parquet metadata key recording the last journal entry a file already covers
+SEQ_KEY = b"wb_sales.journal_seq"
+
+log = logging.getLogger(__name__)
+
+
+def _encode(value):
+    if hasattr(value, "isoformat"):  # dates and timestamps
+        return value.isoformat()
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return str(value)
+
+
+class Journal:
+    def __init__(self, path):
+        self.path = Path(path)
+        # Unparseable lines passed over by the last ``read``
+        self.skipped = 0
+
+    def exists(self):
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def last_seq(self):
+        """Sequence number of the newest entry (0 for an empty journal)."""
+        if not self.exists():
+            return 0
+        with open(self.path, "rb") as f:
+            # Only the tail is needed to find the last complete line
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 64 * 1024))
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                return int(json.loads(line)[SEQ])
+            except (ValueError, KeyError):
+                continue  # torn write at the end of the file
+        return 0
+
+    def append(self, records, first_seq):
+        """Durably append ``records`` numbered from ``first_seq``; returns the last seq."""
+        seq = first_seq - 1
+        lines = []
+        for record in records:
+            seq += 1
+            lines.append(json.dumps({**record, SEQ: seq}, default=_encode, ensure_ascii=False))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._drop_torn_tail()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return seq
+
+    def read(self, after_seq=0):
+        """Entries with a sequence number above ``after_seq``, oldest first."""
+        if not self.exists():
+            return []
+        records = []
+        skipped = 0
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1  # torn write from a crash mid-append
+                    log.warning("%s line %d is not a complete entry; skipped", self.path, number)
+                    continue
+                if record.get(SEQ, 0) > after_seq:
+                    records.append(record)
+        self.skipped = skipped
+        return records
+
+    def _drop_torn_tail(self):
+        """Cut a partial last line (no trailing newline) off the file, so the
+        next entry starts on a line of its own."""
+        if not self.exists():
+            return
+        with open(self.path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            keep, pos = 0, end
+            while pos > 0:
+                step = min(64 * 1024, pos)
+                pos -= step
+                f.seek(pos)
+                newline = f.read(step).rfind(b"\n")
+                if newline >= 0:
+                    keep = pos + newline + 1
+                    break
+            f.truncate(keep)
+            f.flush()
+            os.fsync(f.fileno())
+        log.warning("%s ended in a torn entry; dropped its %d bytes", self.path, end - keep)
+
+    def discard_through(self, seq):
+        """Drop entries up to and including ``seq`` (they are in the base table)."""
+        keep = self.read(after_seq=seq)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in keep:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,111 @@
+"""Customer ledger: per-customer running balances (money in paisa).
+
+Every transaction moves its customer's balance by ``schema.outstanding`` of
+the row (opening value + sales - deposit - return - cashback). The ledger
+keeps the rows sorted by customer and date together with the cumulative
+balance after each row, so the balance on any date is one binary search:
+
+* opening balance of a period = balance after the last row dated before it
+* closing balance = balance after the last row dated on or before its end
+* movement = closing - opening
+
+Rows without a date sort after every date, so they only count towards
+balances with an open end.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import schema
+from .dateindex import date_slice
+
+BALANCE = "balance"
+
+# Search keys are customer code * _SHIFT + day number
+_SHIFT = np.int64(1) << 32
+_NO_DATE = np.int64(_SHIFT - 1)
+
+
+def _days(dates):
+    """Dates as day numbers in 0.._SHIFT-1 (NaT last)."""
+    days = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    out = days.astype(np.int64) + (np.int64(1) << 31)
+    return np.where(np.isnat(days), _NO_DATE, out)
+
+
+def _day(value):
+    return np.datetime64(pd.Timestamp(value).date(), "D").astype(np.int64) + (np.int64(1) << 31)
+
+
+class CustomerLedger:
+    """Per-customer transactions in date order with a running ``balance``."""
+
+    def __init__(self, rows, customers):
+        self.rows = rows
+        self.customers = customers
+        codes = rows["_code"].to_numpy(np.int64)
+        self._keys = codes * _SHIFT + _days(rows[schema.DATE])
+        self._balance = rows[BALANCE].to_numpy()
+        # First row of every customer (and one past the last row)
+        self._starts = np.searchsorted(codes, np.arange(len(customers) + 1))
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the ledger from a transaction table (compact schema)."""
+        codes, customers = pd.factorize(df["customer_name"].astype("string"), sort=True)
+        rows = df.assign(_code=codes)[codes >= 0]
+        order = np.lexsort((_days(rows[schema.DATE]), rows["_code"].to_numpy()))
+        rows = rows.iloc[order].reset_index(drop=True)
+        rows[BALANCE] = schema.outstanding(rows).groupby(rows["_code"]).cumsum()
+        return cls(rows, pd.Index(customers, dtype="string"))
+
+    def _code(self, customer):
+        code = self.customers.get_indexer([customer])[0]
+        if code < 0:
+            raise KeyError(customer)
+        return code
+
+    def _balance_at(self, codes, days, side):
+        """Balance of each customer after its rows keyed up to ``days``
+        (``side="left"``: strictly before that day)."""
+        pos = np.searchsorted(self._keys, codes * _SHIFT + days, side=side)
+        has_rows = pos > self._starts[codes]
+        return np.where(has_rows, self._balance[np.maximum(pos - 1, 0)], 0)
+
+    def _range(self, start, end):
+        lo = np.int64(0) if start is None else _day(start)
+        hi = _NO_DATE if end is None else _day(end)
+        return lo, hi
+
+    def period(self, customer, start=None, end=None):
+        """``{"opening", "movement", "closing"}`` of ``customer`` for the days
+        ``start``..``end`` (inclusive; ``None`` leaves that side open)."""
+        code = np.array([self._code(customer)])
+        lo, hi = self._range(start, end)
+        opening = int(self._balance_at(code, lo, "left")[0])
+        closing = int(self._balance_at(code, hi, "right")[0])
+        return {"opening": opening, "movement": closing - opening, "closing": closing}
+
+    def closing(self, customer, end=None):
+        return self.period(customer, end=end)["closing"]
+
+    def periods(self, start=None, end=None):
+        """``period`` of every customer as a frame (one row per customer)."""
+        codes = np.arange(len(self.customers))
+        lo, hi = self._range(start, end)
+        opening = self._balance_at(codes, lo, "left")
+        closing = self._balance_at(codes, hi, "right")
+        return pd.DataFrame({
+            "customer_name": self.customers,
+            "opening": opening,
+            "movement": closing - opening,
+            "closing": closing,
+        })
+
+    def statement(self, customer, start=None, end=None):
+        """``customer``'s transactions dated ``start``..``end`` with the running
+        ``balance`` after each one; the balance before the first row is
+        ``period(...)["opening"]``."""
+        code = self._code(customer)
+        rows = self.rows.iloc[self._starts[code]:self._starts[code + 1]]
+        return date_slice(rows, start, end).drop(columns="_code")
@@ -0,0 +1,77 @@
+"""Load the transaction table once per change of the files behind it.
+
+``signature`` is a cheap fingerprint of the store files (mtime and size, plus
+an optional content hash) that callers use as a cache key: the table is only
+re-read when the fingerprint changes.
+"""
+
+import hashlib
+
+import pandas as pd
+
+from . import dedup, schema
+from .aggregates import OUTSTANDING
+from .journal import SEQ
+
+
+def file_signature(path, content_hash=False):
+    """``(mtime_ns, size[, digest])`` of ``path``, or ``None`` if it is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    if not content_hash:
+        return (stat.st_mtime_ns, stat.st_size)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+
+
+def signature(store, content_hash=False):
+    """Fingerprint of everything ``store.read()`` depends on.
+
+    ``content_hash`` also hashes the files, for filesystems whose timestamps
+    are too coarse to notice two saves within the same tick.
+    """
+    return (
+        str(store.root),
+        # Partition files are immutable; every change goes through the manifest
+        file_signature(store.manifest_path, content_hash),
+        file_signature(store.journal.path, content_hash),
+        # Customer merges are applied on load
+        file_signature(dedup.map_path(store), content_hash),
+    )
+
+
+def load(store, start=None, end=None):
+    """The table as every dashboard section uses it: date-sorted, compact
+    schema (money in paisa), approved customer merges applied (see
+    ``dedup``) and the per-row ``outstanding`` column.
+
+    ``start``/``end`` load only that date range (and its month partitions).
+    """
+    df = dedup.apply_frame(store.read(start=start, end=end), dedup.load_merges(dedup.map_path(store)))
+    df[OUTSTANDING] = schema.outstanding(df)
+    return df
+
+
+def catch_up(store, totals, rebuild=None):
+    """Bring running totals up to date with entries appended since they were
+    built (by this process or any other); returns the up-to-date totals.
+
+    Works for any state with a ``seq`` and an ``add(rows, seq)`` method;
+    ``rebuild()`` (default ``store.totals``) makes a fresh one when the
+    journal entries it would need have been compacted away.
+    """
+    base_seq = store.base_seq()
+    if max(base_seq, store.journal.last_seq()) <= totals.seq:
+        return totals
+    if base_seq > totals.seq:
+        # The base table was rewritten past what the totals cover
+        return (rebuild or store.totals)()
+    new = store.journal.read(after_seq=totals.seq)
+    if new:
+        totals.add(pd.DataFrame(new).drop(columns=SEQ), seq=new[-1][SEQ])
+    return totals
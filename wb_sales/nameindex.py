@@ -0,0 +1,150 @@
+"""Customer lookup by name or phone number through an n-gram index.
+
+Names are normalized (lower case, accents and punctuation dropped) and phone
+numbers reduced to their local digits, then every key is split into
+overlapping 3-character grams. The index maps each gram to the keys that
+contain it, so a lookup only touches the keys sharing the query's grams:
+
+* substring match: keys holding every gram of the query, confirmed with ``in``
+* typo-tolerant match: keys sharing at least ``MIN_SHARED`` of the query's
+  grams (word edges count, so one wrong letter still leaves most of them)
+
+Built once per table version (see ``ui.load_customer_index``); a lookup over
+a few thousand customers takes well under a millisecond.
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+N = 3
+
+# Share of a query's grams a key needs to count as a near match
+MIN_SHARED = 0.5
+
+# Shortest query (after normalizing) that near matches are looked for
+MIN_FUZZY = 4
+
+_NOT_WORD = re.compile(r"[^0-9a-z]+")
+_NOT_DIGIT = re.compile(r"\D+")
+
+
+def normalize(text):
+    """``text`` lower-cased, without accents, punctuation runs as one space."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode()
+    return _NOT_WORD.sub(" ", text.lower()).strip()
+
+
+def normalize_phone(text):
+    """The local digits of a phone number: ``+880 1712-345678``, ``8801712345678``
+    and ``1712345678`` (a spreadsheet dropping the leading 0) all become
+    ``01712345678``."""
+    digits = _NOT_DIGIT.sub("", str(text))
+    if len(digits) == 13 and digits.startswith("880"):
+        digits = digits[2:]
+    if len(digits) == 10 and digits.startswith("1"):
+        digits = "0" + digits
+    return digits
+
+
+def _phones(values):
+    """Phone column as text; numbers read from Excel lose their ``.0``."""
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        values = values.round().astype("Int64")
+    return values.astype("string")
+
+
+def _grams(key, padded=True):
+    if padded:
+        key = f" {key} "
+    return {key[i:i + N] for i in range(len(key) - N + 1)}
+
+
+class NameIndex:
+    """Sorted customer ``names`` and an n-gram index over their keys (the
+    normalized name plus any phone numbers)."""
+
+    def __init__(self, names, phones=None):
+        """``names``: customer names; ``phones``: optional same-length phone
+        numbers (a customer may appear with several)."""
+        names = pd.Series(names, dtype="string").reset_index(drop=True)
+        known = names.notna()
+        codes, uniques = pd.factorize(names[known], sort=True)
+        self.names = pd.Index(uniques, dtype="string")
+        self._names = np.asarray(uniques, dtype=object)
+
+        keys = [normalize(name) for name in self._names]
+        owners = list(range(len(self.names)))
+        if phones is not None:
+            pairs = pd.DataFrame({"code": codes, "phone": _phones(phones)[known].to_numpy()})
+            pairs = pairs.dropna().drop_duplicates()
+            for code, phone in zip(pairs["code"], pairs["phone"]):
+                digits = normalize_phone(phone)
+                if digits:
+                    keys.append(digits)
+                    owners.append(code)
+        self._keys = keys
+        self._owners = np.array(owners, dtype=np.int64)
+
+        postings = {}
+        for i, key in enumerate(keys):
+            for gram in _grams(key):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+
+    @classmethod
+    def from_frame(cls, df, name="customer_name", phone=None):
+        return cls(df[name], df[phone] if phone else None)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _query(self, text):
+        """``(normalized query, is_phone)``: phone digits when it has no letters."""
+        text = str(text or "").strip()
+        if text and not re.search(r"[^\W\d_]", text) and re.search(r"\d", text):
+            return normalize_phone(text), True
+        return normalize(text), False
+
+    def _substring(self, query):
+        """Keys containing ``query``."""
+        grams = _grams(query, padded=False)
+        if not grams:
+            # Too short for a gram: check every key
+            return [i for i, key in enumerate(self._keys) if query in key]
+        lists = sorted((self._postings.get(gram, np.empty(0, np.int64)) for gram in grams), key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        return [i for i in candidates if query in self._keys[i]]
+
+    def _near(self, query):
+        """Keys sharing at least ``MIN_SHARED`` of ``query``'s grams, best first."""
+        grams = _grams(query)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self._keys))
+        keys = np.flatnonzero(shared >= MIN_SHARED * len(grams))
+        return keys[np.lexsort((keys, -shared[keys]))]
+
+    def search(self, text, limit=None, typos=True):
+        """Customer names matching ``text`` (a name fragment or phone number):
+        substring matches in name order, then, with ``typos``, near matches
+        best first (names only: numbers that differ are different phones).
+        An empty ``text`` returns every name."""
+        query, is_phone = self._query(text)
+        if not query:
+            return self._names[:limit].tolist()
+        found = np.unique(self._owners[self._substring(query)])
+        if typos and not is_phone and len(query) >= MIN_FUZZY and (limit is None or len(found) < limit):
+            near = self._owners[self._near(query)]
+            # First (best) appearance of each customer not already found
+            near = near[np.sort(np.unique(near, return_index=True)[1])]
+            found = np.concatenate([found, near[~np.isin(near, found)]])
+        return self._names[found[:limit]].tolist()
@@ -0,0 +1,92 @@
+"""Opt-in per-section timing for the dashboards.
+
+A ``Profiler`` is a stopwatch with checkpoints: ``section(name)`` closes the
+previous section and starts the next, so a long Streamlit script only needs
+one call before each of its headers. For every section it records wall time,
+the rows it processed (as reported with ``rows``) and the peak Python/numpy
+memory allocated while it ran (via ``tracemalloc``; Arrow buffers are not
+counted). Memory figures are process-wide, so they are only meaningful while
+one session is rerunning.
+
+A section can be backdated with ``start`` (a ``time.perf_counter()``
+reading), so an app can time its own start-up (imports, opening the store)
+from the top of the script; no memory is traced before the profiler exists.
+
+When disabled every call is a no-op. ``finished`` tells whether ``finish``
+was called, i.e. whether the script run it belongs to is over.
+"""
+
+import datetime as dt
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+
+class Profiler:
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.records = []
+        self._current = None
+        self._started_tracing = False
+        self.finished = False
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def section(self, name, rows=None, start=None):
+        """Start timing ``name`` (ending the running section, if any), from
+        ``start`` if given."""
+        if not self.enabled:
+            return
+        self._close()
+        tracemalloc.reset_peak()
+        self._current = {
+            "section": name,
+            "rows": rows,
+            "start": time.perf_counter() if start is None else start,
+            "memory": tracemalloc.get_traced_memory()[0],
+        }
+
+    def rows(self, count):
+        """Add ``count`` to the rows processed by the running section."""
+        if self.enabled and self._current is not None:
+            self._current["rows"] = (self._current["rows"] or 0) + int(count)
+
+    def finish(self):
+        """End the last section; returns the records (one dict per section)."""
+        self.finished = True
+        if not self.enabled:
+            return []
+        self._close()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return self.records
+
+    def total_seconds(self):
+        return sum(r["seconds"] for r in self.records)
+
+    def write_log(self, path, **context):
+        """Append the records to ``path`` as JSON lines, tagged with the time
+        of the run and any ``context`` (e.g. the app name)."""
+        if not self.records:
+            return
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        run = {"run": dt.datetime.now().isoformat(timespec="seconds"), **context}
+        with open(path, "a", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps({**run, **record}, ensure_ascii=False) + "\n")
+
+    def _close(self):
+        if self._current is None:
+            return
+        current, self._current = self._current, None
+        peak = tracemalloc.get_traced_memory()[1]
+        self.records.append({
+            "section": current["section"],
+            "seconds": round(time.perf_counter() - current["start"], 6),
+            "rows": current["rows"],
+            "peak_mib": round(max(0, peak - current["memory"]) / 2**20, 3),
+        })
@@ -0,0 +1,140 @@
+"""Report tables shared by the dashboards and the batch report engine.
+
+The functions here take frames in the compact schema (money in paisa) and
+return frames/series in paisa; convert with ``schema.to_taka`` for display or
+before writing a workbook.
+
+``run_batch`` produces the month-end workbooks without the UI: one workbook
+per executive (transactions in the date range plus customer-wise outstanding
+as at its last day) and the chairman's company report, with the executives
+fanned out across a process pool. Each worker loads the table once and then
+serves every executive it is given.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from . import dedup, exports, loader, open_store, schema
+from .aggregates import OUTSTANDING, RunningTotals
+
+# Label -> column of the chairman's company totals
+CHAIRMAN_TOTALS = {
+    "Total Sales": "sales_amount",
+    "Total Deposit": "paid_amount",
+    "Total Return": "sales_return",
+    "Total Outstanding": OUTSTANDING,
+    "Total Company Profit": "company_profit",
+}
+
+# Label -> column of the date-range totals section
+RANGE_TOTALS = {
+    "Total Sales": "sales_amount",
+    "Total Deposit": "paid_amount",
+    "Total Return": "sales_return",
+    "Total Customer Cashback": "customer_cashback_on_paid_amount",
+    "Total Executive Commission": "sales_ex_commission",
+    "Total Zonal Officer Commission": "zonal_officer_commission",
+    "Total GM Commission": "gm_commission",
+    "Total Company Profit": "company_profit",
+}
+
+
+def executive_transactions(df, executive):
+    return df[df["sales_executive"] == executive]
+
+
+def customer_transactions(df, customer):
+    return df[df["customer_name"] == customer]
+
+
+def customer_outstanding(totals, executive, merges=None):
+    """Customer-wise outstanding of one executive, from the running totals."""
+    return totals.customers_of(executive, merges)[["customer_name", OUTSTANDING]]
+
+
+def labelled_totals(df, labels):
+    """Sums of ``df``'s columns named by ``labels`` (label -> column); missing
+    columns count as 0. ``df`` may also be a Series of column totals (such as
+    ``ui.query_totals``)."""
+    return pd.Series({label: df[col].sum() if col in df else 0 for label, col in labels.items()})
+
+
+def chairman_totals(df):
+    return labelled_totals(df, CHAIRMAN_TOTALS)
+
+
+def write_workbook(target, sheets):
+    """Write ``sheets`` (name -> frame) as one workbook to a path or buffer;
+    money columns are converted from paisa to taka."""
+    return exports.write_xlsx(sheets, target)
+
+
+def safe_filename(name):
+    """``name`` usable as a file name on Windows and Linux."""
+    return re.sub(r'[<>:"/\\|?*\s]+', "_", str(name).strip()).strip("._") or "unnamed"
+
+
+# --- batch ------------------------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(root, start, end):
+    store = open_store(root)
+    _worker["df"] = loader.load(store, start, end)
+    # Balances as at the end of the period, not including later transactions
+    _worker["totals"] = store.totals() if end is None else RunningTotals.from_frame(store.read(end=end))
+    _worker["merges"] = dedup.load_merges(dedup.map_path(store))
+
+
+def _executive_report(executive, out_dir, suffix):
+    df, totals = _worker["df"], _worker["totals"]
+    transactions = executive_transactions(df, executive)
+    path = Path(out_dir) / f"{safe_filename(executive)}_transactions{suffix}.xlsx"
+    write_workbook(path, {
+        "Transactions": transactions,
+        "Customer Outstanding": customer_outstanding(totals, executive, _worker["merges"]),
+    })
+    return executive, str(path), len(transactions)
+
+
+def _period_suffix(start, end):
+    if start is None and end is None:
+        return ""
+    return "_" + "_".join("" if d is None else f"{pd.Timestamp(d):%Y-%m-%d}" for d in (start, end))
+
+
+def run_batch(store, out_dir, start=None, end=None, executives=None, workers=None):
+    """Write every executive's workbook and the chairman report to ``out_dir``.
+
+    ``start``/``end`` limit the transactions to that date range (days
+    inclusive); ``executives`` defaults to everyone in the table. Returns
+    ``(executive or "chairman", path, rows)`` for each workbook written.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    suffix = _period_suffix(start, end)
+
+    df = loader.load(store, start, end)
+    if executives is None:
+        executives = sorted(df["sales_executive"].dropna().unique())
+
+    chairman = out_dir / f"chairman_report{suffix}.xlsx"
+    write_workbook(chairman, {
+        "Company Totals": schema.to_taka(chairman_totals(df)).rename_axis("item").reset_index(name="amount"),
+        "Transactions": df,
+    })
+    results = [("chairman", str(chairman), len(df))]
+    if not executives:
+        return results
+
+    workers = workers or min(len(executives), os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(str(store.root), start, end)) as pool:
+        jobs = [pool.submit(_executive_report, e, str(out_dir), suffix) for e in executives]
+        results.extend(job.result() for job in jobs)
+    return results
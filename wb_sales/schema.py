@@ -0,0 +1,163 @@
+"""Column layout of the sales & deposit transaction table.
+
+In memory and on disk the table uses a compact schema:
+
+* customer, executive, customer type (and area zone, when present) are
+  categoricals. Their dictionary is stable: new names are added at the end,
+  so existing codes never change.
+* money columns are int64 paisa (1 BDT = 100 paisa), so sums are exact.
+  ``to_taka`` converts back for display and exports.
+"""
+
+import pandas as pd
+
+DATE = "date"
+
+DIMENSIONS = ["order_no", "customer_type", "customer_name", "sales_executive"]
+
+# Repeated names stored as categoricals (area_zone only exists in some workbooks)
+CATEGORIES = ["customer_type", "customer_name", "sales_executive", "area_zone"]
+
+MONEY_COLUMNS = [
+    "open_value",
+    "sales_amount",
+    "sales_return",
+    "paid_amount",
+    "customer_cashback_on_paid_amount",
+    "sales_ex_commission",
+    "zonal_officer_commission",
+    "gm_commission",
+    "company_profit",
+]
+
+COLUMNS = [DATE] + DIMENSIONS + MONEY_COLUMNS
+
+# Older forms and workbooks used these names for the same columns
+ALIASES = {
+    "Order No": "order_no",
+    "executive_commission": "sales_ex_commission",
+}
+
+PAISA_PER_TAKA = 100
+
+# Derived money columns that are also held in paisa
+DERIVED_MONEY = ["outstanding", "customer_outstanding", "customer_commission",
+                 "balance", "opening", "movement", "closing"]
+
+
+def to_paisa(values):
+    """Taka amounts (numbers, strings or blanks) as exact int64 paisa."""
+    values = pd.to_numeric(values, errors="coerce")
+    if isinstance(values, pd.Series):
+        return (values.fillna(0) * PAISA_PER_TAKA).round().astype("int64")
+    return 0 if pd.isna(values) else int(round(values * PAISA_PER_TAKA))
+
+
+def to_taka(data, columns=None):
+    """Paisa amounts back to taka.
+
+    For a frame, ``columns`` defaults to every money column it has; other
+    columns are left alone. Series and scalars are converted as a whole.
+    """
+    if not isinstance(data, pd.DataFrame):
+        return data / PAISA_PER_TAKA
+    if columns is None:
+        columns = [c for c in MONEY_COLUMNS + DERIVED_MONEY if c in data.columns]
+    return data.assign(**{c: data[c] / PAISA_PER_TAKA for c in columns})
+
+
+def outstanding(df):
+    """Per-row outstanding: opening balance + sales - deposit - return - cashback."""
+    return (
+        df["open_value"]
+        + df["sales_amount"]
+        - df["paid_amount"]
+        - df["sales_return"]
+        - df["customer_cashback_on_paid_amount"]
+    )
+
+
+def _names(values):
+    """Distinct non-blank names in ``values`` as a string Index."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.Index(values.cat.categories, dtype="string")
+    return pd.Index(values.dropna().unique(), dtype="string")
+
+
+def extend_categories(categories, values):
+    """``categories`` followed by the new names in ``values``, sorted."""
+    known = pd.Index(categories, dtype="string")
+    return known.append(_names(values).difference(known).sort_values())
+
+
+def categorize(values, categories=()):
+    """``values`` as a categorical that keeps ``categories`` in their order and
+    appends any new names, sorted, at the end."""
+    if isinstance(values.dtype, pd.CategoricalDtype) and not len(categories):
+        return values
+    target = extend_categories(categories, values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        if values.cat.categories.equals(target):
+            return values
+        return values.cat.set_categories(target.astype(object))
+    return pd.Series(
+        pd.Categorical(values.astype("string"), categories=target.astype(object)),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def empty_frame():
+    """An empty transaction table with the standard columns and dtypes."""
+    return normalize(pd.DataFrame(columns=COLUMNS))
+
+
+def normalize(df, unit="taka", categories=None):
+    """Return ``df`` in the compact schema: standard column names, every
+    standard column present, datetime dates, categorical dimensions and int64
+    paisa money.
+
+    ``unit`` says what the money columns hold now: ``"taka"`` for workbooks
+    and form input, ``"paisa"`` for frames already in the compact schema.
+    ``categories`` maps column -> existing dictionary to extend.
+    """
+    categories = categories or {}
+    df = df.rename(columns={k: v for k, v in ALIASES.items() if k in df.columns})
+    df = df.loc[:, ~df.columns.duplicated()].copy()
+
+    df[DATE] = pd.to_datetime(df[DATE], errors="coerce") if DATE in df else pd.NaT
+    for col in DIMENSIONS + [c for c in CATEGORIES if c in df]:
+        values = df[col] if col in df else pd.Series(pd.NA, index=df.index, dtype="string")
+        if col in CATEGORIES:
+            df[col] = categorize(values, categories.get(col, ()))
+        else:
+            df[col] = values.astype("string")
+    for col in MONEY_COLUMNS:
+        values = df[col] if col in df else pd.Series(0, index=df.index)
+        if unit == "paisa":
+            df[col] = pd.to_numeric(values, errors="coerce").fillna(0).astype("int64")
+        else:
+            df[col] = to_paisa(values)
+
+    # Extra columns are kept after the standard ones; object columns are stored
+    # as strings so they survive the round trip through Parquet.
+    extra = [c for c in df.columns if c not in COLUMNS]
+    for col in extra:
+        if df[col].dtype == object:
+            df[col] = df[col].astype("string")
+    return df[COLUMNS + extra].reset_index(drop=True)
+
+
+def concat(frames):
+    """Stack compact frames, merging category dictionaries so the result stays
+    categorical (the first frame's codes are kept)."""
+    frames = list(frames)
+    for col in frames[0].columns:
+        if not isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            continue
+        categories = pd.Index(frames[0][col].cat.categories, dtype="string")
+        for frame in frames[1:]:
+            if col in frame:
+                categories = extend_categories(categories, frame[col])
+        frames = [f.assign(**{col: categorize(f[col], categories)}) if col in f else f for f in frames]
+    return pd.concat(frames, ignore_index=True)
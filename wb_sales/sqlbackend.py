@@ -0,0 +1,213 @@
+"""Optional SQLite mirror of the store for filter and summary pushdown.
+
+With ``WB_SALES_BACKEND=sqlite`` the dashboards answer date-range,
+executive and customer filters and the SUM/GROUP BY summaries with queries
+against ``transactions.sqlite`` in the store folder instead of masking the
+whole table in pandas, so only the matching rows (or the totals) are read
+into Python. The Parquet store stays the system of record: the mirror is
+caught up from the journal like the running totals (``sync``), and rebuilt
+when the base table was rewritten.
+
+The ``transactions`` table holds the compact schema (money as integer
+paisa, dates as seconds since 1970) and is indexed on date, executive +
+date, customer + date and order number.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import dedup, schema
+from .aggregates import COUNT, OUTSTANDING, TOTAL_COLUMNS
+from .journal import SEQ
+
+TABLE = "transactions"
+
+_INDEXES = {
+    "ix_date": [schema.DATE],
+    "ix_executive_date": ["sales_executive", schema.DATE],
+    "ix_customer_date": ["customer_name", schema.DATE],
+    "ix_order_no": ["order_no"],
+}
+
+_OUTSTANDING_SQL = ("open_value + sales_amount - paid_amount - sales_return"
+                    " - customer_cashback_on_paid_amount")
+
+
+def _seconds(value):
+    return int(pd.Timestamp(value).timestamp())
+
+
+def _rows(df):
+    """``df`` (compact schema) as tuples in ``schema.COLUMNS`` order."""
+    dates = df[schema.DATE]
+    seconds = (dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[s]").astype(np.int64))
+    out = {schema.DATE: np.where(dates.isna().to_numpy(), None, seconds.astype(object))}
+    for col in schema.DIMENSIONS:
+        values = df[col].astype(object)
+        out[col] = values.where(values.notna(), None).to_numpy()
+    for col in schema.MONEY_COLUMNS:
+        out[col] = df[col].to_numpy(np.int64).astype(object)
+    return zip(*(out[col] for col in schema.COLUMNS))
+
+
+class SqlBackend:
+    """SQLite mirror of ``store`` at ``path`` (default ``transactions.sqlite``
+    in the store folder)."""
+
+    def __init__(self, store, path=None):
+        self.store = store
+        self.path = path or store.root / "transactions.sqlite"
+
+    def _connect(self):
+        # A connection per call: cheap, and safe across Streamlit's threads
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(self.path, timeout=30)
+        con.execute("PRAGMA journal_mode=WAL")
+        return con
+
+    # --- keeping up with the store -----------------------------------------
+
+    def _seq(self, con):
+        try:
+            return con.execute("SELECT value FROM meta WHERE key = 'seq'").fetchone()[0]
+        except (sqlite3.OperationalError, TypeError):
+            return None
+
+    def sync(self):
+        """Bring the mirror up to date with the store; returns how many rows
+        were added (or the table size after a rebuild)."""
+        base_seq = self.store.base_seq()
+        con = self._connect()
+        try:
+            seq = self._seq(con)
+            if seq is not None and max(base_seq, self.store.journal.last_seq()) <= seq:
+                return 0
+            con.execute("BEGIN IMMEDIATE")
+            seq = self._seq(con)  # another session may have synced meanwhile
+            if seq is None or base_seq > seq:
+                added = self._rebuild(con)
+            else:
+                new = self.store.journal.read(after_seq=seq)
+                added = 0
+                if new:
+                    rows = schema.normalize(pd.DataFrame(new).drop(columns=SEQ))
+                    self._insert(con, rows)
+                    self._set_seq(con, new[-1][SEQ])
+                    added = len(rows)
+            con.commit()
+            return added
+        finally:
+            con.close()
+
+    def _rebuild(self, con):
+        df, seq = self.store.snapshot()
+        con.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        types = {schema.DATE: "INTEGER", **{c: "TEXT" for c in schema.DIMENSIONS},
+                 **{c: "INTEGER NOT NULL" for c in schema.MONEY_COLUMNS}}
+        con.execute(f"CREATE TABLE {TABLE} ({', '.join(f'{c} {t}' for c, t in types.items())})")
+        self._insert(con, df)
+        # Built after the bulk insert, which is faster than maintaining them
+        for name, columns in _INDEXES.items():
+            con.execute(f"CREATE INDEX {name} ON {TABLE} ({', '.join(columns)})")
+        con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+        self._set_seq(con, seq)
+        return len(df)
+
+    def _insert(self, con, df):
+        marks = ", ".join("?" * len(schema.COLUMNS))
+        con.executemany(f"INSERT INTO {TABLE} ({', '.join(schema.COLUMNS)}) VALUES ({marks})", _rows(df))
+
+    def _set_seq(self, con, seq):
+        con.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('seq', ?)", (int(seq),))
+
+    # --- queries ------------------------------------------------------------
+
+    def _merges(self):
+        return dedup.load_merges(dedup.map_path(self.store))
+
+    def _where(self, start, end, executive, customer, order_no):
+        clauses, params = [], []
+        if start is not None:
+            clauses.append(f"{schema.DATE} >= ?")
+            params.append(_seconds(pd.Timestamp(start).normalize()))
+        if end is not None:
+            clauses.append(f"{schema.DATE} < ?")
+            params.append(_seconds(pd.Timestamp(end).normalize() + pd.Timedelta(days=1)))
+        if executive is not None:
+            clauses.append("sales_executive = ?")
+            params.append(executive)
+        if customer is not None:
+            # A merged customer also covers the names merged into it
+            names = dedup.variants([customer], self._merges())
+            clauses.append(f"customer_name IN ({', '.join('?' * len(names))})")
+            params.extend(names)
+        if order_no is not None:
+            clauses.append("order_no = ?")
+            params.append(order_no)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def date_extent(self):
+        """First and last transaction date (NaT when there are none), like
+        ``dateindex.date_extent`` of the whole table."""
+        con = self._connect()
+        try:
+            first, last = con.execute(f"SELECT MIN({schema.DATE}), MAX({schema.DATE}) FROM {TABLE}").fetchone()
+        finally:
+            con.close()
+        return tuple(pd.NaT if v is None else pd.Timestamp(v, unit="s") for v in (first, last))
+
+    def values(self, column):
+        """Sorted distinct values of the dimension ``column`` (blanks left
+        out); customers are listed under the names they are merged into."""
+        if column not in schema.DIMENSIONS:
+            raise ValueError(f"{column!r} is not a dimension column")
+        con = self._connect()
+        try:
+            found = [v for v, in con.execute(f"SELECT DISTINCT {column} FROM {TABLE} WHERE {column} IS NOT NULL")]
+        finally:
+            con.close()
+        if column == dedup.CUSTOMER:
+            merges = self._merges()
+            found = {merges.get(name, name) for name in found}
+        return sorted(found)
+
+    def transactions(self, start=None, end=None, executive=None, customer=None, order_no=None):
+        """Matching rows in date order, shaped like ``loader.load``'s table."""
+        where, params = self._where(start, end, executive, customer, order_no)
+        sql = f"SELECT {', '.join(schema.COLUMNS)} FROM {TABLE}{where} ORDER BY {schema.DATE} NULLS LAST, rowid"
+        con = self._connect()
+        try:
+            df = pd.read_sql_query(sql, con, params=params)
+        finally:
+            con.close()
+        df[schema.DATE] = pd.to_datetime(df[schema.DATE], unit="s")
+        df = dedup.apply_frame(schema.normalize(df, unit="paisa"), self._merges())
+        df[OUTSTANDING] = schema.outstanding(df)
+        return df
+
+    def totals(self, by=None, start=None, end=None, executive=None, customer=None):
+        """Money totals, outstanding and row count of the matching rows: a
+        Series, or with ``by`` (a column or list) a frame per group like
+        ``RunningTotals.by_executive``."""
+        keys = [] if by is None else [by] if isinstance(by, str) else list(by)
+        where, params = self._where(start, end, executive, customer, None)
+        sums = [f"SUM({c}) AS {c}" for c in schema.MONEY_COLUMNS]
+        sums += [f"SUM({_OUTSTANDING_SQL}) AS {OUTSTANDING}", f"COUNT(*) AS {COUNT}"]
+        sql = f"SELECT {', '.join(keys + sums)} FROM {TABLE}{where}"
+        if keys:
+            sql += f" GROUP BY {', '.join(keys)}"
+        con = self._connect()
+        try:
+            df = pd.read_sql_query(sql, con, params=params)
+        finally:
+            con.close()
+        df[TOTAL_COLUMNS] = df[TOTAL_COLUMNS].fillna(0).astype("int64")
+        if not keys:
+            return df[TOTAL_COLUMNS].iloc[0]
+        table = df.dropna(subset=keys).astype({k: "string" for k in keys}).set_index(keys)
+        if "customer_name" in keys:
+            table = dedup.merge_totals(table, merges=self._merges())
+        return table.sort_index().reset_index()
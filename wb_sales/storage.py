@@ -0,0 +1,299 @@
+"""Columnar (Parquet) storage for the transaction table.
+
+The store is the system of record; Excel workbooks are only imported from and
+exported to. Layout under ``root``::
+
+    manifest.json                      committed state (see below)
+    transactions/year=2025/month=06/part-00000042.parquet
+    journal.jsonl                      transactions not yet compacted
+    totals.parquet                     running totals as of the manifest
+
+The base table is split into one Parquet file per year/month, so a date-range
+read only opens the months it needs. Partition files are never modified: a
+compaction writes new files for the months it touches and then swaps in a new
+``manifest.json``, which lists the current file of every month, the last
+journal entry already merged and the category dictionaries. Readers always
+see base + journal. Writers hold the store's file lock (``writer.store_lock``),
+so appends and compactions from several sessions or processes never
+interleave.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from . import exports, schema
+from .aggregates import RunningTotals
+from .dateindex import date_slice, sort_by_date
+from .journal import SEQ, SEQ_KEY, Journal
+from .writer import store_lock
+
+# Journal length at which the apps fold it into the base table
+COMPACT_THRESHOLD = 500
+
+# Partition for rows whose date could not be parsed
+UNDATED = "undated"
+
+# Attempts of a lock-free read that keeps racing compactions
+READ_RETRIES = 5
+
+
+def partition_keys(dates):
+    """``"YYYY-MM"`` partition key of every date (``UNDATED`` for NaT)."""
+    months = dates.dt.year * 100 + dates.dt.month
+    labels = {m: f"{int(m) // 100:04d}-{int(m) % 100:02d}" for m in months.dropna().unique()}
+    return months.map(labels).fillna(UNDATED)
+
+
+def month_key(value):
+    return f"{pd.Timestamp(value):%Y-%m}"
+
+
+class TransactionStore:
+    """Transaction table kept as month-partitioned Parquet plus a journal under ``root``."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.data_dir = self.root / "transactions"
+        self.manifest_path = self.root / "manifest.json"
+        self.journal = Journal(self.root / "journal.jsonl")
+        self.totals_path = self.root / "totals.parquet"
+        # Single-file layout used before the table was partitioned
+        self.legacy_path = self.root / "transactions.parquet"
+        self.lock = store_lock(self.root)
+
+    def exists(self):
+        return self.manifest_path.exists() or self.legacy_path.exists() or self.journal.exists()
+
+    def manifest(self):
+        if not self.manifest_path.exists():
+            if self.legacy_path.exists():
+                return self._migrate_legacy()
+            return {"journal_seq": 0, "partitions": {}, "categories": {}}
+        with open(self.manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def base_seq(self):
+        """Last journal sequence number already merged into the base table."""
+        return self.manifest()["journal_seq"]
+
+    def pending(self):
+        """Journal entries not yet merged into the base table."""
+        return self.journal.read(after_seq=self.base_seq())
+
+    def partitions(self, start=None, end=None, manifest=None):
+        """Partition keys holding rows dated ``start``..``end`` (all when open)."""
+        keys = sorted((manifest or self.manifest())["partitions"])
+        if start is None and end is None:
+            return keys
+        lo = month_key(start) if start is not None else ""
+        hi = month_key(end) if end is not None else "9999-99"
+        return [k for k in keys if k != UNDATED and lo <= k <= hi]
+
+    def read(self, columns=None, start=None, end=None):
+        """The table (base + journal) in date order.
+
+        ``start``/``end`` limit it to that date range (days inclusive); only
+        the matching month partitions are read.
+        """
+        return self.snapshot(columns, start, end)[0]
+
+    def snapshot(self, columns=None, start=None, end=None):
+        """``(table, seq)``: ``read``'s table and the last journal entry it
+        includes, for state that is later caught up from the journal."""
+        wanted = None if columns is None else list(dict.fromkeys([schema.DATE, *columns]))
+        for _ in range(READ_RETRIES):
+            # Readers take no lock. A compaction between reading the manifest
+            # and the journal (or removing a month file before it is opened)
+            # would leave rows out, so that read starts over.
+            manifest = self.manifest()
+            seq = manifest["journal_seq"]
+            pending = self.journal.read(after_seq=seq)
+            if self.base_seq() != seq:
+                continue
+            try:
+                df = self._read_base(manifest, self.partitions(start, end, manifest), wanted)
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            # Still racing compactions: read once more holding the lock
+            with self.lock:
+                return self.snapshot(columns, start, end)
+        if pending:
+            tail = self._normalize_rows(pending, manifest)
+            df = schema.concat([df, tail.reindex(columns=df.columns)])
+            seq = pending[-1][SEQ]
+        df = sort_by_date(df)
+        if start is not None or end is not None:
+            df = date_slice(df, start, end).reset_index(drop=True)
+        return (df[columns] if columns else df), seq
+
+    def totals(self):
+        """Running totals covering the base table and the pending journal."""
+        manifest = self.manifest()
+        totals = RunningTotals.load(self.totals_path) if self.totals_path.exists() else None
+        if totals is None or totals.seq != manifest["journal_seq"]:
+            base = self._read_base(manifest, self.partitions(manifest=manifest))
+            totals = RunningTotals.from_frame(base, manifest["journal_seq"])
+        pending = self.journal.read(after_seq=manifest["journal_seq"])
+        if pending:
+            totals.add(pd.DataFrame(pending).drop(columns=SEQ), seq=pending[-1][SEQ])
+        return totals
+
+    def append(self, rows):
+        """Add transactions (dicts) to the journal; O(1) in the table size."""
+        if isinstance(rows, dict):
+            rows = [rows]
+        with self.lock:
+            first_seq = max(self.journal.last_seq(), self.base_seq()) + 1
+            return self.journal.append(rows, first_seq)
+
+    def write(self, df):
+        """Replace the whole table (base and journal) with ``df``, a frame in
+        the compact schema (as returned by ``read``)."""
+        df = schema.normalize(df, unit="paisa")
+        with self.lock:
+            manifest = self.manifest()
+            # A fresh sequence number marks the new table, so cached totals built
+            # from the old one are recognised as stale.
+            seq = max(self.journal.last_seq(), manifest["journal_seq"]) + 1
+            fresh = {"journal_seq": seq, "partitions": {}, "categories": manifest["categories"]}
+            self._commit(fresh, dict(iter(df.groupby(partition_keys(df[schema.DATE])))),
+                         RunningTotals.from_frame(df, seq))
+        return len(df)
+
+    def compact(self):
+        """Fold the journal into the base table; returns how many rows were merged.
+
+        Only the months that received new rows are rewritten.
+        """
+        with self.lock:
+            manifest = self.manifest()
+            pending = self.journal.read(after_seq=manifest["journal_seq"])
+            if not pending:
+                return 0
+            seq = pending[-1][SEQ]
+            totals = self.totals()
+            tail = self._normalize_rows(pending, manifest)
+            parts = {}
+            for key, rows in tail.groupby(partition_keys(tail[schema.DATE])):
+                existing = self._read_base(manifest, [key]) if key in manifest["partitions"] else None
+                parts[key] = rows if existing is None else schema.concat([existing, rows])
+            self._commit({**manifest, "journal_seq": seq}, parts, totals)
+            self.journal.discard_through(seq)
+        return len(pending)
+
+    def maybe_compact(self, threshold=COMPACT_THRESHOLD):
+        """Compact once the journal has grown past ``threshold`` entries."""
+        if self.journal.last_seq() - self.base_seq() >= threshold:
+            return self.compact()
+        return 0
+
+    # --- internals -------------------------------------------------------
+
+    def _categories(self, manifest, col):
+        return pd.Index(manifest["categories"].get(col, []), dtype="string")
+
+    def _read_base(self, manifest, keys, columns=None):
+        frames = []
+        for key in keys:
+            frame = pd.read_parquet(self.data_dir / manifest["partitions"][key], columns=columns)
+            # Every month shares the manifest's dictionary, so codes are the
+            # same in every partition and the frames concatenate cheaply
+            for col in frame.columns.intersection(schema.CATEGORIES):
+                categories = self._categories(manifest, col)
+                if isinstance(frame[col].dtype, pd.CategoricalDtype):
+                    frame[col] = frame[col].cat.set_categories(categories.astype(object))
+                else:
+                    # A month where the column is blank throughout is stored
+                    # as a null column, not a dictionary
+                    frame[col] = schema.categorize(frame[col], categories)
+            frames.append(frame)
+        if not frames:
+            df = schema.normalize(pd.DataFrame(columns=schema.COLUMNS),
+                                  categories={c: self._categories(manifest, c) for c in schema.CATEGORIES})
+            return df[columns] if columns else df
+        return pd.concat(frames, ignore_index=True)
+
+    def _normalize_rows(self, records, manifest):
+        rows = pd.DataFrame(records).drop(columns=SEQ)
+        return schema.normalize(rows, categories={c: self._categories(manifest, c) for c in schema.CATEGORIES})
+
+    def _commit(self, manifest, parts, totals):
+        """Write ``parts`` (partition key -> frame) as new files, then publish
+        them with ``manifest``; the manifest swap is the commit point."""
+        seq = manifest["journal_seq"]
+        categories = dict(manifest["categories"])
+        for frame in parts.values():
+            for col in frame.columns.intersection(schema.CATEGORIES):
+                categories[col] = list(schema.extend_categories(categories.get(col, []), frame[col]))
+
+        partitions = dict(manifest["partitions"])
+        for key, frame in parts.items():
+            folder = UNDATED if key == UNDATED else f"year={key[:4]}/month={key[5:]}"
+            relative = f"{folder}/part-{seq:08d}.parquet"
+            frame = sort_by_date(frame.reset_index(drop=True))
+            for col in frame.columns.intersection(schema.CATEGORIES):
+                frame[col] = frame[col].cat.remove_unused_categories()
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), SEQ_KEY: str(seq)})
+            (self.data_dir / relative).parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, self.data_dir / relative)
+            partitions[key] = relative
+
+        tmp_path = self.root / "totals.parquet.tmp"
+        totals.seq = seq
+        totals.save(tmp_path)
+        os.replace(tmp_path, self.totals_path)
+
+        manifest = {"journal_seq": seq, "partitions": partitions, "categories": categories}
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+        self._remove_unreferenced(partitions)
+        return manifest
+
+    def _remove_unreferenced(self, partitions):
+        live = {self.data_dir / p for p in partitions.values()}
+        for path in self.data_dir.rglob("part-*.parquet"):
+            if path not in live:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass  # still open by a reader (Windows); removed next time
+
+    def _migrate_legacy(self):
+        with self.lock:
+            if not self.legacy_path.exists():
+                return self.manifest()  # another process migrated it first
+            df = pd.read_parquet(self.legacy_path)
+            seq = int((pq.read_schema(self.legacy_path).metadata or {}).get(SEQ_KEY, 0))
+            df = schema.normalize(df, unit="paisa")
+            fresh = {"journal_seq": seq, "partitions": {}, "categories": {}}
+            manifest = self._commit(fresh, dict(iter(df.groupby(partition_keys(df[schema.DATE])))),
+                                    RunningTotals.from_frame(df, seq))
+            self.legacy_path.unlink()
+        return manifest
+
+    # --- Excel interchange -----------------------------------------------
+
+    def import_excel(self, path, append=False):
+        """Load a workbook into the store, replacing it unless ``append``."""
+        df = schema.normalize(pd.read_excel(path))
+        with self.lock:
+            if append:
+                df = schema.concat([self.read(), df])
+            return self.write(df)
+
+    def export_excel(self, path, df=None):
+        df = self.read() if df is None else df
+        exports.write_xlsx({"Transactions": df}, path)
+        return len(df)
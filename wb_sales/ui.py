@@ -0,0 +1,347 @@
+"""Streamlit glue shared by the dashboards."""
+
+import functools
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from . import aging, bulk, commissions, cube, dedup, exports, grid, loader, open_store, schema
+from .config import BACKEND, PROFILE_LOG
+from .dateindex import date_extent, date_slice
+from .ledger import CustomerLedger
+from .nameindex import NameIndex
+from .profiling import Profiler
+
+_balances_lock = threading.Lock()
+_receivables_lock = threading.Lock()
+_cube_lock = threading.Lock()
+
+
+@st.cache_resource(max_entries=2, show_spinner="Loading transactions...")
+def _load(signature):
+    return loader.load(open_store(signature[0]))
+
+
+@st.cache_resource(max_entries=8, show_spinner="Loading transactions...")
+def _load_range(signature, start, end):
+    return loader.load(open_store(signature[0]), start, end)
+
+
+def load_transactions(store=None, start=None, end=None):
+    """The transaction table, re-read only when the store files change.
+
+    With ``start``/``end`` only that date range is loaded, reading just the
+    month partitions it covers; a range covering every month is sliced from
+    the whole table instead of being held a second time. Every caller gets
+    the same cached frame; copy it before adding columns.
+    """
+    store = store or open_store()
+    if start is None and end is None:
+        return _load(loader.signature(store))
+    manifest = store.manifest()
+    if store.partitions(start, end, manifest) == store.partitions(manifest=manifest):
+        return date_slice(_load(loader.signature(store)), start, end)
+    return _load_range(loader.signature(store), start, end)
+
+
+@st.cache_resource
+def _sql_backend(root):
+    from .sqlbackend import SqlBackend
+
+    return SqlBackend(open_store(root))
+
+
+def sql_backend(store=None):
+    """The store's SQLite mirror, caught up with the store, when
+    ``WB_SALES_BACKEND=sqlite``; otherwise ``None``."""
+    if BACKEND != "sqlite":
+        return None
+    store = store or open_store()
+    backend = _sql_backend(str(store.root))
+    backend.sync()
+    return backend
+
+
+def query_transactions(store=None, start=None, end=None, executive=None, customer=None):
+    """Transactions dated ``start``..``end`` of one executive and/or customer.
+
+    With the SQLite backend the filter runs as an indexed query and only the
+    matching rows are read; otherwise the date range is loaded (only the
+    month partitions it covers, see ``load_transactions``) and filtered.
+    """
+    store = store or open_store()
+    backend = sql_backend(store)
+    if backend is not None:
+        return backend.transactions(start, end, executive=executive, customer=customer)
+    df = load_transactions(store, start, end)
+    if executive is not None:
+        df = df[df["sales_executive"] == executive]
+    if customer is not None:
+        df = df[df["customer_name"] == customer]
+    return df
+
+
+def query_totals(store=None, by=None, start=None, end=None, executive=None, customer=None):
+    """Money totals, outstanding and transaction count of the transactions
+    ``query_transactions`` would return: a Series, or with ``by`` (a column
+    or list of columns) a frame with one row per group.
+
+    With the SQLite backend they are summed by a GROUP BY query; otherwise
+    they are rolled up from the daily cube.
+    """
+    store = store or open_store()
+    backend = sql_backend(store)
+    if backend is not None:
+        return backend.totals(by, start, end, executive=executive, customer=customer)
+    return load_cube(store).query(by, start, end, sales_executive=executive, customer_name=customer)
+
+
+def load_date_extent(store=None):
+    """First and last transaction date, for the date pickers; with the
+    SQLite backend read from its date index instead of the loaded table."""
+    store = store or open_store()
+    backend = sql_backend(store)
+    if backend is not None:
+        return backend.date_extent()
+    return date_extent(load_transactions(store))
+
+
+def dimension_values(column, store=None):
+    """Sorted distinct values of ``column`` (e.g. the executives), for the
+    pickers; with the SQLite backend from a DISTINCT query."""
+    store = store or open_store()
+    backend = sql_backend(store)
+    if backend is not None:
+        return backend.values(column)
+    return sorted(load_transactions(store)[column].dropna().unique())
+
+
+@st.cache_resource(max_entries=2, show_spinner="Building customer ledger...")
+def _ledger(signature):
+    return CustomerLedger.from_frame(_load(signature))
+
+
+def load_ledger(store=None):
+    """The customer ledger (running balances) of the current table."""
+    store = store or open_store()
+    return _ledger(loader.signature(store))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _customer_index(signature, backend):
+    if backend == "sqlite":
+        names = _sql_backend(signature[0]).values("customer_name")
+    else:
+        names = _load(signature)["customer_name"].dropna().unique()
+    return NameIndex(pd.Series(names, dtype="string"))
+
+
+def load_customer_index(store=None):
+    """Name search index over the customers of the current table."""
+    store = store or open_store()
+    sql_backend(store)  # caught up before its names are read
+    return _customer_index(loader.signature(store), BACKEND)
+
+
+def customer_picker(label, index, key):
+    """A customer selectbox narrowed by a search box (name fragment or phone,
+    typos tolerated) looked up in ``index`` (a ``NameIndex``). Returns
+    ``None`` when there is no customer to pick."""
+    text = st.text_input("Search customers", key=f"{key}_find", placeholder="Part of a name or phone number")
+    options = index.search(text)
+    if not options:
+        st.caption(f"No customer matches \"{text}\"; showing everyone.")
+        options = list(index.names)
+    return st.selectbox(label, options, key=key)
+
+
+@st.cache_resource
+def _balances(root):
+    # A holder, so stale totals can be swapped out without touching the cache
+    return {"totals": open_store(root).totals()}
+
+
+def load_balances(store=None):
+    """Running per-executive / per-customer totals, caught up with any
+    transactions appended since they were last used."""
+    store = store or open_store()
+    with _balances_lock:
+        holder = _balances(str(store.root))
+        holder["totals"] = loader.catch_up(store, holder["totals"])
+        return holder["totals"]
+
+
+
+@st.cache_resource(max_entries=2)
+def _receivables(root, merges):
+    # ``merges``: the merge map's signature; settling depends on the names
+    return {"receivables": aging.build(open_store(root))}
+
+
+@st.cache_resource(max_entries=4, show_spinner="Settling receivables...")
+def _receivables_as_of(signature, merges, as_of):
+    return aging.build(open_store(signature[0]), as_of)
+
+
+def load_receivables(store=None, as_of=None):
+    """Receivables aging state, settled up to the newest appended transaction.
+
+    With ``as_of`` before the newest transaction's date the state is settled
+    again from the transactions dated up to ``as_of``.
+    """
+    store = store or open_store()
+    if as_of is not None and pd.Timestamp(as_of) < load_date_extent(store)[1]:
+        return _receivables_as_of(loader.signature(store), loader.file_signature(dedup.map_path(store)),
+                                  pd.Timestamp(as_of))
+    with _receivables_lock:
+        holder = _receivables(str(store.root), loader.file_signature(dedup.map_path(store)))
+        holder["receivables"] = loader.catch_up(store, holder["receivables"], lambda: aging.build(store))
+        return holder["receivables"]
+
+
+@st.cache_resource
+def _cube(root):
+    return {"cube": cube.build(open_store(root))}
+
+
+def load_cube(store=None):
+    """The daily cube (``wb_sales.cube``), caught up with appended transactions."""
+    store = store or open_store()
+    with _cube_lock:
+        holder = _cube(str(store.root))
+        holder["cube"] = loader.catch_up(store, holder["cube"], lambda: cube.build(store))
+        return holder["cube"]
+
+
+def start_profiler(started=None):
+    """A ``Profiler`` that is enabled by the sidebar's profiling toggle.
+
+    The toggle defaults to on with ``?profile=1`` in the URL or
+    ``WB_SALES_PROFILE=1`` in the environment. With ``started`` (a
+    ``time.perf_counter()`` reading from the top of the script) the time up
+    to here is recorded as a "Startup" section; it is large on the first run
+    in a server process, which pays for the imports.
+    """
+    default = st.query_params.get("profile") == "1" or os.environ.get("WB_SALES_PROFILE") == "1"
+    enabled = st.sidebar.toggle("⏱️ Profile sections", value=default, key="profile_sections")
+    profiler = Profiler(enabled)
+    if started is not None:
+        profiler.section("Startup", start=started)
+    return profiler
+
+
+def show_profile(profiler, app):
+    """End ``profiler``'s last section, show its records in the sidebar and
+    append them to ``config.PROFILE_LOG``."""
+    records = profiler.finish()
+    if not records:
+        return
+    profiler.write_log(PROFILE_LOG, app=app)
+    with st.sidebar.expander(f"Section timings ({profiler.total_seconds():.2f} s)", expanded=True):
+        table = pd.DataFrame(records).sort_values("seconds", ascending=False)
+        table["ms"] = (table.pop("seconds") * 1000).round(1)
+        st.dataframe(table[["section", "ms", "rows", "peak_mib"]], hide_index=True, use_container_width=True)
+        st.caption(f"Appended to {PROFILE_LOG}")
+
+
+def section_fragment(name, app="main"):
+    """Decorator for a dashboard section ``fn(store, profiler)`` with widgets:
+    it runs as an ``st.fragment``, so changing one of its widgets reruns just
+    this function instead of the whole page.
+
+    In a full run the section is timed as ``name`` by the page's profiler. A
+    fragment rerun comes after that profiler has finished, so it is timed on
+    its own and only appended to ``config.PROFILE_LOG`` under ``app`` (a
+    fragment cannot redraw the sidebar).
+    """
+    def decorate(fn):
+        @st.fragment
+        @functools.wraps(fn)
+        def run(store, profiler):
+            if not profiler.finished:
+                profiler.section(name)
+                return fn(store, profiler)
+            alone = Profiler(profiler.enabled)
+            alone.section(name)
+            try:
+                return fn(store, alone)
+            finally:
+                alone.finish()
+                alone.write_log(PROFILE_LOG, app=app, rerun="fragment")
+        return run
+    return decorate
+
+
+def bulk_import(store, key="bulk_import"):
+    """Upload a CSV/Excel batch, show what is wrong with it or a preview with
+    the computed commissions, and append it to ``store`` in one write.
+
+    Returns the number of rows imported (0 until the user confirms).
+    """
+    upload = st.file_uploader("Batch file (CSV or Excel)", type=["csv", "xlsx", "xls"], key=key)
+    if upload is None:
+        st.caption("Columns as in the workbook: date, order_no, customer_name, customer_type, "
+                   "sales_executive, sales_amount, sales_return, paid_amount, … Blank cashback and "
+                   "commission cells are computed; add a cashback_eligible (yes/no) column to "
+                   "switch cashback off for some rows.")
+        return 0
+    rows, errors = bulk.validate(bulk.read_batch(upload))
+    if len(errors):
+        st.error(f"{len(errors)} problem(s) found; nothing was imported. Fix the file and upload it again.")
+        st.dataframe(errors, hide_index=True, use_container_width=True)
+        return 0
+    preview = bulk.prepare(rows, commissions.load_rules(commissions.rules_path(store)))
+    st.success(f"{len(preview)} valid transaction(s), "
+               f"{preview['paid_amount'].sum():,.2f} BDT deposited, {preview['sales_amount'].sum():,.2f} BDT sales.")
+    st.dataframe(preview.head(200), use_container_width=True)
+    if not st.button(f"Import {len(preview)} transactions", key=f"{key}_confirm"):
+        return 0
+    added, _ = bulk.import_batch(store, rows)
+    st.success(f"✅ Imported {added} transactions.")
+    return added
+
+
+def download_button(df, label, file_name, key, paisa=True, sheet="Transactions"):
+    """A download button for ``df`` with a choice of Excel, CSV or Parquet.
+
+    The file is only written when the button is clicked (``exports.export``
+    runs as Streamlit's deferred download), and clicking does not rerun the
+    page. ``file_name`` is given without an extension; ``paisa`` says the
+    money columns still hold paisa.
+    """
+    choices = exports.formats(len(df))
+    fmt = st.radio(f"{label} format", choices, format_func=lambda f: exports.FORMATS[f][0], horizontal=True,
+                   key=f"{key}_format", label_visibility="collapsed")
+    if "xlsx" not in choices:
+        st.caption(f"{len(df):,} rows is more than an Excel sheet holds; download CSV or Parquet.")
+    st.download_button(
+        label=label,
+        data=lambda: exports.export(df, fmt, paisa, sheet),
+        file_name=f"{file_name}.{fmt}",
+        mime=exports.FORMATS[fmt][1],
+        key=key,
+        on_click="ignore",
+    )
+
+
+def paged_table(df, key, paisa=True, page_size=grid.PAGE_SIZE):
+    """Show ``df`` one page at a time, searched and sorted on the server.
+
+    ``paisa`` converts the money columns of the visible page to taka.
+    """
+    search_col, sort_col, order_col, page_col = st.columns([3, 2, 1, 1])
+    text = search_col.text_input("Search", key=f"{key}_search", placeholder="Customer, executive, order no…")
+    sort_by = sort_col.selectbox("Sort by", ["(none)"] + list(df.columns), key=f"{key}_sort")
+    descending = order_col.toggle("Descending", key=f"{key}_desc")
+    matched = grid.search(df, text)
+    pages = grid.page_count(len(matched), page_size)
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages  # the search left fewer pages
+    number = page_col.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key=f"{key}_page")
+
+    rows, total = grid.page(matched, number, page_size, None if sort_by == "(none)" else sort_by, not descending)
+    st.dataframe(schema.to_taka(rows) if paisa else rows, use_container_width=True)
+    first = (number - 1) * page_size + 1 if total else 0
+    st.caption(f"Rows {first:,}–{first + len(rows) - 1 if total else 0:,} of {total:,}")
@@ -0,0 +1,224 @@
+"""Single-writer access to the store: a file lock and group commit.
+
+Every change to a store (journal appends, compaction, rewrites) happens while
+holding ``store_lock(root)``, an exclusive lock on ``root/store.lock`` shared
+by every process using the store, so two saves can never pick the same
+journal sequence number and a compaction cannot drop an entry appended while
+it was running.
+
+Within a process, saves go through one ``GroupCommitWriter`` per store: each
+session's ``save`` queues its rows and waits, and the writer thread appends
+everything queued so far with a single write and ``fsync`` under one lock
+acquisition. Twenty staff pressing "Save" at the same moment cost one durable
+write, and each of them only returns once their rows are on disk. Each commit
+is also appended to the incremental backup (``backup.capture``); when a new
+full base snapshot is due it is taken on a separate thread once the savers
+have been answered, outside the lock.
+"""
+
+import os
+import queue
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+from pathlib import Path
+
+from . import backup
+
+# How long a save waits for another process to release the store
+LOCK_TIMEOUT = 30.0
+
+# How long the writer waits for more submissions before committing a group
+LINGER = 0.005
+
+# Most submissions folded into one commit
+MAX_GROUP = 1000
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(fd):
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(fd):
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """Exclusive inter-process lock on ``path``, re-entrant within a thread
+    and exclusive between threads of this process."""
+
+    def __init__(self, path, timeout=LOCK_TIMEOUT):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self):
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"timed out waiting for {self.path}")
+        if self._depth == 0:
+            try:
+                self._fd = self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def _lock_file(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        deadline = time.monotonic() + self.timeout
+        delay = 0.001
+        while True:
+            try:
+                _lock(fd)
+                return fd
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"{self.path} is held by another process") from None
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+_locks = {}
+_writers = {}
+_registry_lock = threading.Lock()
+
+
+def store_lock(root):
+    """The process-wide lock of the store at ``root``."""
+    path = Path(root).resolve() / "store.lock"
+    with _registry_lock:
+        if path not in _locks:
+            _locks[path] = FileLock(path)
+        return _locks[path]
+
+
+class GroupCommitWriter:
+    """Background thread appending queued rows to ``store`` in groups."""
+
+    def __init__(self, store):
+        self.store = store
+        self._queue = queue.Queue()
+        self._base = None
+        self._thread = threading.Thread(target=self._run, name=f"wb_sales writer {store.root}", daemon=True)
+        self._thread.start()
+
+    def submit(self, rows):
+        """Queue ``rows`` (a dict or list of dicts); the future resolves to the
+        last sequence number of the commit that made them durable."""
+        future = Future()
+        self._queue.put(([rows] if isinstance(rows, dict) else list(rows), future))
+        return future
+
+    def _next_group(self):
+        group = [self._queue.get()]
+        deadline = time.monotonic() + LINGER
+        while len(group) < MAX_GROUP:
+            try:
+                group.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        return group
+
+    def _run(self):
+        while True:
+            group = self._next_group()
+            records = [record for rows, _ in group for record in rows]
+            try:
+                with store_lock(self.store.root):
+                    seq = self.store.append(records) if records else self.store.journal.last_seq()
+                    # The rows are durable: answer the savers before the
+                    # follow-up work, which must not fail (and so repeat) a save
+                    for _, future in group:
+                        future.set_result(seq)
+                    self._back_up()
+                    self._compact()
+            except BaseException as exc:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                self._start_base()
+
+    def _back_up(self):
+        # Before compaction can discard the entries; the rows are already
+        # saved, so a failed backup is reported rather than failing the save
+        try:
+            backup.capture(self.store, base=False)
+        except Exception as exc:
+            warnings.warn(f"backup of {self.store.root} failed: {exc}")
+
+    def _compact(self):
+        # The journal keeps the rows until a later group compacts it
+        try:
+            self.store.maybe_compact()
+        except Exception as exc:
+            warnings.warn(f"compaction of {self.store.root} failed: {exc}")
+
+    def _start_base(self):
+        # A full snapshot grows with the table, so it runs on its own thread
+        # after the savers have been answered, never inside the lock
+        if self._base is not None and self._base.is_alive():
+            return
+        try:
+            if not backup.base_due(self.store):
+                return
+        except Exception as exc:
+            warnings.warn(f"backup of {self.store.root} failed: {exc}")
+            return
+        self._base = threading.Thread(target=self._take_base, name=f"wb_sales backup {self.store.root}",
+                                      daemon=True)
+        self._base.start()
+
+    def _take_base(self):
+        try:
+            backup.take_base(self.store)
+        except Exception as exc:
+            warnings.warn(f"backup of {self.store.root} failed: {exc}")
+
+
+def writer_for(store):
+    """The writer of ``store``'s root (one per process)."""
+    root = Path(store.root).resolve()
+    with _registry_lock:
+        if root not in _writers:
+            _writers[root] = GroupCommitWriter(store)
+        return _writers[root]
+
+
+def save(store, rows, timeout=None):
+    """Append ``rows`` (a dict or list of dicts) through the group-commit
+    writer and wait until they are durable; returns the commit's last
+    sequence number. Errors of the commit are raised here."""
+    return writer_for(store).submit(rows).result(timeout)